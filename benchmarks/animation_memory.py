@@ -0,0 +1,68 @@
+# 动画内存压力测试：创建越来越多的僵尸、豌豆射手和向日葵并播放动画，测量共享的动画片段占用的内存和进程内存，
+# 对象数量增加时两者都应该保持不变（每个对象只保存片段的引用和帧索引）
+# 运行方法（在项目根目录）：python -m benchmarks.animation_memory
+import os  # 导入os库
+import time  # 导入time库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import data.src.PVZ as PVZ  # 导入游戏
+from data.src.Game import *  # 导入游戏处理核心（同时导入所有游戏对象）
+
+COUNTS = [10, 100, 1000, 5000]  # 每种对象的数量
+FRAMES = 120  # 播放动画的帧数，足够让每个动画的所有帧都被用到
+
+def Rss():
+    """
+    进程当前占用的物理内存（MB），无法获取时返回 None
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def Populate(pvz, count):
+    """
+    在每一行放入 count 个僵尸、豌豆射手和向日葵
+    """
+    game = pvz.game
+    entities = []
+    for index in range(count):
+        row = index % game.board.rows + 1
+        column = index % game.board.columns + 1
+        entities.append(Zombie(pvz, "common_zombie", row))
+        entities.append(Peashooter(pvz, (game.board.gridX[column], game.board.gridY[row])))
+        entities.append(Sunflower(pvz, (game.board.gridX[column], game.board.gridY[row])))
+    return entities
+
+def main():
+    PVZ.RECORD_REPLAY = False  # 不生成操作录像
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.game = Game(pvz)
+    pvz.board = pvz.game.board
+    pvz.ObjectGame = pvz
+    pvz.initialize_list()  # 与 Pvz.start 相同，但不加载音乐、不进入开始界面
+    pvz.initialize_instance()
+    print("每种对象数  对象总数  不同图片数  片段数  已加载帧数  帧内存(MB)  不共享时(MB)  进程内存(MB)  每帧更新(ms)")
+    for count in COUNTS:
+        entities = Populate(pvz, count)
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            CLOCK.Advance()
+            for entity in entities:
+                entity.update()
+        cost = (time.perf_counter() - start) / FRAMES * 1000
+        clips, frames, pixels = ClipStats()
+        unique = len({id(entity.image) for entity in entities})
+        # 共享之前每个对象各自加载和缩放当前帧，持有一份自己的图片
+        private = sum(entity.image.get_bytesize() * entity.image.get_width() * entity.image.get_height() for entity in entities)
+        rss = Rss()
+        print(str(count).ljust(11), str(len(entities)).ljust(9), str(unique).ljust(11), str(clips).ljust(7), str(frames).ljust(11),
+              f"{pixels / 1024 / 1024:.1f}".ljust(11), f"{private / 1024 / 1024:.1f}".ljust(13),
+              (f"{rss:.1f}" if rss is not None else "-").ljust(13), f"{cost:.2f}")
+        del entities
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+# 草坪大小压力测试：在不同行列数的草坪上运行无界面模拟，测量每帧耗时
+# 运行方法（在项目根目录）：python -m benchmarks.board_scaling
+import time  # 导入time库
+from data.src.Simulation import *  # 导入无界面模拟
+
+BOARDS = [(9, 5), (20, 10), (40, 25), (40, 50)]  # (列数, 行数)
+TICKS = 3000  # 每个草坪推进的帧数
+
+def Defend(simulation):
+    """
+    开局在每行种下向日葵和豌豆射手
+    """
+    if simulation.tick == 0:
+        for row in range(1, simulation.board.rows + 1):
+            simulation.Place(1, 1, row)
+            for column in range(2, 5):
+                simulation.Place(2, column, row)
+
+def main():
+    print("草坪(列x行)  帧数  总耗时(s)  每帧(ms)  僵尸数")
+    for columns, rows in BOARDS:
+        level = dict(settings["level"]["stress"], board = {"columns": columns, "rows": rows})
+        simulation = Simulation(level, seed = 1, gold = 10 ** 9, autoCollectSun = True)
+        start = time.perf_counter()
+        result = simulation.Run(TICKS, Defend)
+        cost = time.perf_counter() - start
+        print(f"{columns}x{rows}".ljust(12), str(result["tick"]).ljust(5), f"{cost:.2f}".ljust(10), f"{cost / result['tick'] * 1000:.3f}".ljust(9), result["zombies"])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# 摄像机绘制压力测试：草坪越来越大（每格一只僵尸），摄像机在世界中滚动，比较每帧绘制背景和实体的耗时，应与世界大小无关
+# 运行方法（在项目根目录）：python -m benchmarks.camera_render
+import os  # 导入os库
+import time  # 导入time库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import data.src.PVZ as PVZ  # 导入游戏
+from data.src.Game import *  # 导入游戏处理核心（同时导入所有游戏对象）
+
+BOARDS = [(9, 5), (20, 20), (40, 50)]  # 草坪的列数和行数
+FRAMES = 120  # 每项测量运行的帧数
+SCROLL = (23, 11)  # 每帧摄像机滚动的距离，到达世界边缘后从左上角重新开始
+
+def main():
+    PVZ.RECORD_REPLAY = False  # 不生成操作录像
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.game = Game(pvz)
+    pvz.ObjectGame = pvz
+    PreloadAnimations()  # 动画帧预先加载，只比较绘制
+    background = Background(pvz.screen)
+    print("草坪      世界大小       实体数  背景(ms/帧)  实体(ms/帧)  每帧绘制  每帧剔除")
+    for columns, rows in BOARDS:
+        board = Board(columns, rows)
+        pvz.board = board
+        pvz.initialize_list()
+        VIEWPORT.SetWorld(*board.worldSize)
+        # 每格一只僵尸，位置固定（只测量绘制，不推进游戏逻辑）
+        zombies = Zombie.SpawnBatch(pvz, ["common_zombie"] * (columns * rows), [row for row in range(1, rows + 1) for _ in range(columns)],
+                                    [column * board.cellSize[0] - board.zombieFirstX + board.left for _ in range(rows) for column in range(columns)])
+        for zombie in zombies:
+            zombie.imageIndex = 1  # 显示第一帧
+            zombie.updateImage()
+        backgroundTime = entityTime = 0
+        for frame in range(FRAMES + 1):
+            start = time.perf_counter()
+            background.run(board)
+            middle = time.perf_counter()
+            for zombie in zombies:
+                zombie.draw()
+            end = time.perf_counter()
+            if frame:  # 第一帧合成背景分块，不计时
+                backgroundTime += middle - start
+                entityTime += end - middle
+            VIEWPORT.EndFrame()
+            if VIEWPORT.x + SCROLL[0] > VIEWPORT.worldWidth - VIEWPORT.width or VIEWPORT.y + SCROLL[1] > VIEWPORT.worldHeight - VIEWPORT.height:
+                VIEWPORT.MoveTo(0, 0)
+            else:
+                VIEWPORT.ScrollBy(*SCROLL)
+        print(f"{columns}x{rows}".ljust(9), f"{board.worldSize[0]}x{board.worldSize[1]}".ljust(14), str(len(zombies)).ljust(7),
+              f"{backgroundTime * 1000 / FRAMES:.2f}".ljust(12), f"{entityTime * 1000 / FRAMES:.2f}".ljust(12),
+              str(VIEWPORT.lastDrawn).ljust(9), VIEWPORT.lastCulled)
+    VIEWPORT.SetWorld(*pvz.game.board.worldSize)
+
+if __name__ == '__main__':
+    main()
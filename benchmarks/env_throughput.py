@@ -0,0 +1,32 @@
+# 训练环境吞吐量测试：测量 PvzEnv 和不同局数的 VectorEnv 每秒能执行多少个环境步
+# 运行方法（在项目根目录）：python -m benchmarks.env_throughput
+import time  # 导入time库
+import numpy as np  # 导入NumPy
+from data.src.Environment import *  # 导入训练环境
+
+COUNTS = [1, 16, 64]  # VectorEnv 同时运行的局数
+SECONDS = 3  # 每项测量的时长
+PLACE_PROBABILITY = 0.1  # 每一步随机种植的概率
+
+def main():
+    print(f"每步推进 {ENV_FRAME_SKIP} 帧，随机策略")
+    print("局数  环境步/秒  模拟帧/秒  完成局数")
+    rng = np.random.default_rng(0)
+    for count in COUNTS:
+        env = VectorEnv(count)
+        env.reset(0)
+        steps = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < SECONDS:
+            actions = np.zeros(count, dtype = np.int64)
+            if rng.random() < PLACE_PROBABILITY:
+                masks = env.ActionMasks()
+                for index in range(count):
+                    actions[index] = rng.choice(np.flatnonzero(masks[index]))
+            env.step(actions)
+            steps += count
+        cost = time.perf_counter() - start
+        print(str(count).ljust(5), f"{steps / cost:.0f}".ljust(10), f"{steps * ENV_FRAME_SKIP / cost:.0f}".ljust(10), sum(env.episodes))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# 模拟分支压力测试：测量 Simulation.Fork 在不同实体数量下的耗时，以及分支后第一帧（写时复制）和 copy.deepcopy 的耗时
+# 运行方法（在项目根目录）：python -m benchmarks.fork_cost
+import copy  # 导入复制库
+import time  # 导入time库
+from data.src.Simulation import *  # 导入无界面模拟
+
+ENTITIES = [100, 1000]  # 场上的实体数量
+BOARD = {"columns": 20, "rows": 10}  # 测试使用的草坪，放得下 1000 个实体
+REPEAT = 2000  # 每项测量重复的次数
+
+def Build(count):
+    """
+    创建一局场上约有 count 个实体的模拟：四分之一是植物，其余一半僵尸一半豌豆
+    """
+    level = dict(settings["level"]["stress"], board = BOARD)
+    simulation = Simulation(level, seed = 1, gold = 10 ** 9)
+    board = simulation.board
+    plants = min(count // 4, board.columns * board.rows)
+    for index in range(plants):
+        simulation.Place(2, index % board.columns + 1, index // board.columns % board.rows + 1)
+    simulation.Step()
+    rest = count - plants
+    for index in range(rest):
+        lane = simulation.lanes[index % board.rows + 1]
+        if index % 2:
+            lane.zombies.append(SimZombie(simulation.NewId(), "common_zombie", board.zombieFirstX - index % 300))
+        else:
+            lane.peas.append(SimPea(board.left + index % 600))
+    return simulation
+
+def Measure(function, repeat = REPEAT):
+    """
+    返回每次调用的平均耗时（微秒）
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def main():
+    print("实体数  Fork(us)  Fork+第一帧(us)  单独一帧(us)  deepcopy(us)  每秒分支数")
+    for count in ENTITIES:
+        simulation = Build(count)
+        forkCost = Measure(simulation.Fork)
+        forkStepCost = Measure(lambda: simulation.Fork().Step())
+        fork = simulation.Fork()
+        fork.Step()
+        stepCost = Measure(fork.Step, 200)
+        deepcopyCost = Measure(lambda: copy.deepcopy(simulation), 20)
+        print(str(count).ljust(7), f"{forkCost:.1f}".ljust(9), f"{forkStepCost:.1f}".ljust(16), f"{stepCost:.1f}".ljust(13),
+              f"{deepcopyCost:.1f}".ljust(13), f"{1e6 / forkCost:.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# 帧插值测试：游戏逻辑按固定帧率运行，窗口按更高的帧率绘制，比较插值和不插值时一颗豌豆在画面上每帧移动距离的波动（越小越平滑），
+# 以及插值给每帧绘制带来的额外耗时
+# 运行方法（在项目根目录）：python -m benchmarks.frame_interpolation
+import os  # 导入os库
+import time  # 导入time库
+import statistics  # 导入统计库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import data.src.PVZ as PVZ  # 导入游戏
+from data.src.Game import *  # 导入游戏处理核心（同时导入所有游戏对象）
+
+RATES = [(60, 60), (60, 144), (30, 144), (30, 240)]  # (逻辑帧率, 绘制帧率)
+SECONDS = 1  # 每项模拟的时间（秒）
+COUNT = 200  # 测量绘制耗时时窗口内的僵尸数量
+FRAMES = 200  # 测量绘制耗时的帧数
+
+class RecordingScreen:
+    """
+    只记录图片绘制位置的窗口，用于取得豌豆在画面上的位置
+    """
+    def __init__(self):
+        self.positions = []
+
+    def fill(self, color):
+        pass
+
+    def blit(self, image, pos):
+        self.positions.append(pos[0])
+
+def Smoothness(pvz, logicFps, renderFps, interpolate):
+    """
+    按累积时间运行逻辑（与 Pvz.run 相同），返回豌豆每个绘制帧移动距离的平均值和标准差（像素）
+    """
+    screen = RecordingScreen()
+    renderer = Renderer(screen, RENDER, False, interpolate)
+    pea = Pea((200, 300), pvz.screen, 1, pvz.board)
+    for _ in range(2):  # 清空双缓冲中上一项测量的快照
+        RENDER.Begin()
+        RENDER.Publish()
+    step = 1 / logicFps
+    accumulator = step  # 第一帧之前先运行一个逻辑帧
+    for _ in range(SECONDS * renderFps):
+        accumulator += 1 / renderFps
+        while accumulator >= step:
+            RENDER.Begin()
+            pea.run()
+            RENDER.Publish()
+            accumulator -= step
+        renderer.Draw(RENDER.Latest(), RENDER.Previous() if interpolate else None, accumulator / step if interpolate else 1.0)
+    moves = [b - a for a, b in zip(screen.positions, screen.positions[1:])]
+    return statistics.mean(moves), statistics.pstdev(moves)
+
+def DrawCost(pvz, zombies, interpolate):
+    """
+    两份快照之间插值绘制 FRAMES 帧，返回平均每帧的耗时（毫秒）
+    """
+    renderer = Renderer(pvz.screen, RENDER, False, interpolate)
+    for _ in range(2):
+        RENDER.Begin()
+        for zombie in zombies:
+            zombie.pos[0] -= 1
+            zombie.update()
+            zombie.draw()
+        RENDER.Publish()
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        renderer.Draw(RENDER.Latest(), RENDER.Previous() if interpolate else None, (frame % 10) / 10 if interpolate else 1.0)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+def main():
+    PVZ.RECORD_REPLAY = False  # 不生成操作录像
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.game = Game(pvz)
+    pvz.board = pvz.game.board
+    pvz.ObjectGame = pvz
+    pvz.initialize_list()
+    PreloadAnimations()  # 动画帧预先加载，只比较绘制
+    print("逻辑帧率  绘制帧率  不插值：每帧移动/波动(px)  插值：每帧移动/波动(px)")
+    for logicFps, renderFps in RATES:
+        plain = Smoothness(pvz, logicFps, renderFps, False)
+        smooth = Smoothness(pvz, logicFps, renderFps, True)
+        print(str(logicFps).ljust(9), str(renderFps).ljust(9), f"{plain[0]:.2f} / {plain[1]:.2f}".ljust(25), f"{smooth[0]:.2f} / {smooth[1]:.2f}")
+    zombies = Zombie.SpawnBatch(pvz, ["common_zombie"] * COUNT, [index % pvz.board.rows + 1 for index in range(COUNT)],
+                                [-(index * 3) % 600 - 100 for index in range(COUNT)])
+    print(f"{COUNT} 只僵尸每帧绘制耗时：不插值 {DrawCost(pvz, zombies, False):.2f}ms，插值 {DrawCost(pvz, zombies, True):.2f}ms")
+
+if __name__ == '__main__':
+    main()
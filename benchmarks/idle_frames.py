@@ -0,0 +1,55 @@
+# 空闲帧测试：在静止的开始界面停留一段时间，比较开启和关闭空闲帧检测时运行的帧数、实际绘制的帧数和消耗的 CPU 时间
+# 运行方法（在项目根目录）：python -m benchmarks.idle_frames
+import os  # 导入os库
+import time  # 导入time库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import data.src.PVZ as PVZ  # 导入游戏
+from data.src.Game import *  # 导入游戏处理核心（同时导入所有游戏对象）
+
+SECONDS = 3  # 每项测量停留的时间（秒）
+
+def StartScreen(pvz, frames):
+    """
+    按 Pvz.start 的帧循环运行开始界面 SECONDS 秒，返回运行的帧数、绘制的帧数、空闲等待次数和 CPU 时间（秒）
+    """
+    renderer = Renderer(pvz.screen, RENDER, False)
+    idle = IdleFrames(renderer, frames)
+    clock = pygame.time.Clock()
+    loops = 0
+    end = time.perf_counter() + SECONDS
+    cpu = time.process_time()
+    while time.perf_counter() < end:
+        if idle.Idle():
+            idle.Wait()
+        events = pygame.event.get()
+        RENDER.Begin()
+        pvz.startBackground.run()
+        pvz.startButton.run()
+        idle.Update(events, RENDER.Publish(), RENDER.Previous())
+        renderer.Present()
+        CLOCK.Advance()
+        VIEWPORT.EndFrame()
+        clock.tick(DEFAULT_FPS)
+        loops += 1
+    return loops, renderer.frames, idle.waits, time.process_time() - cpu
+
+def main():
+    PVZ.RECORD_REPLAY = False  # 不生成操作录像
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.game = Game(pvz)
+    pvz.board = pvz.game.board
+    pvz.ObjectGame = pvz
+    pvz.initialize_list()
+    pvz.initialize_instance()
+    PreloadAnimations()
+    print(f"在开始界面停留 {SECONDS} 秒")
+    print("空闲检测  运行帧数  绘制帧数  等待次数  CPU 时间(s)")
+    for name, frames in (("关闭", 0), ("开启", IDLE_FRAMES)):
+        loops, drawn, waits, cpu = StartScreen(pvz, frames)
+        print(name.ljust(8), str(loops).ljust(9), str(drawn).ljust(9), str(waits).ljust(9), f"{cpu:.3f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+# 多进程按行并行压力测试：在大草坪上分别使用 1~N 个工作进程运行模拟，测量加速比，并检查结果与单进程模式一致
+# 运行方法（在项目根目录）：python -m benchmarks.parallel_scaling
+import time  # 导入time库
+import multiprocessing  # 导入多进程库
+from data.src.ParallelSimulation import *  # 导入按行并行的无界面模拟
+from benchmarks.board_scaling import Defend  # 复用开局布阵策略
+
+BOARD = {"columns": 40, "rows": 50}  # 测试使用的草坪
+TICKS = 2000  # 推进的帧数
+SEED = 1  # 随机种子
+
+def main():
+    level = dict(settings["level"]["stress"], board = BOARD)
+    simulation = Simulation(level, seed = SEED, gold = 10 ** 9, autoCollectSun = True)
+    start = time.perf_counter()
+    expected = simulation.Run(TICKS, Defend)
+    baseline = time.perf_counter() - start
+    print(f"草坪 {BOARD['columns']}x{BOARD['rows']}，{TICKS} 帧")
+    print("进程数  总耗时(s)  每帧(ms)  加速比  结果一致")
+    print("单进程".ljust(6), f"{baseline:.2f}".ljust(10), f"{baseline / TICKS * 1000:.3f}".ljust(9), "1.00".ljust(7), "-")
+    for workers in range(1, multiprocessing.cpu_count() + 1):
+        with ParallelSimulation(level, seed = SEED, gold = 10 ** 9, autoCollectSun = True, workers = workers) as simulation:
+            start = time.perf_counter()
+            result = simulation.Run(TICKS, Defend)
+            cost = time.perf_counter() - start
+        print(str(workers).ljust(7), f"{cost:.2f}".ljust(10), f"{cost / TICKS * 1000:.3f}".ljust(9), f"{baseline / cost:.2f}".ljust(7), result == expected)
+
+if __name__ == '__main__':
+    main()
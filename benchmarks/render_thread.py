@@ -0,0 +1,57 @@
+# 绘制线程压力测试：游戏逻辑每帧发布绘制快照，比较在同一线程中绘制和在单独的绘制线程中绘制时，游戏逻辑每帧的耗时和实际绘制的帧数
+# 运行方法（在项目根目录）：python -m benchmarks.render_thread
+import os  # 导入os库
+import time  # 导入time库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import data.src.PVZ as PVZ  # 导入游戏
+from data.src.Game import *  # 导入游戏处理核心（同时导入所有游戏对象）
+
+COUNTS = [45, 200, 500]  # 窗口内的僵尸数量
+FRAMES = 200  # 每项测量运行的帧数
+
+def RunFrames(pvz, background, zombies, renderer):
+    """
+    运行 FRAMES 帧（推进动画、记录并发布快照），按 DEFAULT_FPS 控制帧率，返回游戏逻辑平均每帧的耗时（毫秒，不含等待）和实际绘制的帧数
+    """
+    logicTime = 0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        RENDER.Begin()
+        background.run(pvz.board)
+        for zombie in zombies:
+            zombie.update()
+            zombie.draw()
+        RENDER.Publish()
+        renderer.Present()
+        VIEWPORT.EndFrame()
+        CLOCK.Advance()
+        elapsed = time.perf_counter() - start
+        logicTime += elapsed
+        time.sleep(max(0, 1 / DEFAULT_FPS - elapsed))  # 与 clock.tick 相同，剩余的时间让给其他线程
+    renderer.Close(5)
+    return logicTime * 1000 / FRAMES, renderer.frames
+
+def main():
+    PVZ.RECORD_REPLAY = False  # 不生成操作录像
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.game = Game(pvz)
+    pvz.board = pvz.game.board
+    pvz.ObjectGame = pvz
+    pvz.initialize_list()
+    PreloadAnimations()  # 动画帧预先加载，只比较绘制
+    background = Background(pvz.screen)
+    print("僵尸数  同一线程(ms/帧)  绘制帧数  绘制线程(ms/帧)  绘制帧数")
+    for count in COUNTS:
+        # 僵尸分布在窗口内的各行，全部需要绘制
+        zombies = Zombie.SpawnBatch(pvz, ["common_zombie"] * count, [index % pvz.board.rows + 1 for index in range(count)],
+                                    [-(index * 7) % 700 for index in range(count)])
+        results = []
+        for threaded in (False, True):
+            results.extend(RunFrames(pvz, background, zombies, Renderer(pvz.screen, RENDER, threaded)))
+        print(str(count).ljust(7), f"{results[0]:.2f}".ljust(16), str(results[1]).ljust(9), f"{results[2]:.2f}".ljust(16), results[3])
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# 回放一致性检查：用脚本代替玩家的鼠标玩一局（选卡、种植、点击阳光、铲除，并模拟设置窗口修改金币）并录像，中途退出后从存档继续，
+# 再用 Replay 回放这两份录像，每隔 CHECK_INTERVAL 帧比较录制时和回放时的完整游戏状态（存档快照），任何一帧不同时返回非零退出码
+# 运行方法（在项目根目录）：python -m benchmarks.replay_fidelity
+import os  # 导入os库
+import sys  # 导入sys库
+import tempfile  # 导入临时文件库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import pygame  # 导入pygame库
+from data.src.Replay import *  # 导入操作录像
+from data.src.Snapshot import *  # 导入存档快照
+
+TICKS = 6000  # 录制的帧数
+CHECK_INTERVAL = 100  # 比较游戏状态的间隔（帧）
+SEED = 20240501  # 僵尸出生时间线的随机种子
+CARDS = ["sunflower", "peashooter", "nut", "potato_mine"]  # 选中的卡片
+PLAN = [("sunflower", 1, row) for row in range(1, 6)] + [("peashooter", 2, row) for row in range(1, 6)] + \
+       [("peashooter", 3, row) for row in range(1, 6)] + [("nut", 6, row) for row in range(1, 6)] + [("potato_mine", 7, 3)]  # 按顺序种植
+GOLD_TICK = 1500  # 模拟设置窗口修改金币的帧
+SHOVEL_TICK = 3000  # 开始铲除的帧：拿起铲子、铲除第 1 列第 1 行的向日葵、放回铲子，每步间隔 SHOVEL_STEP 帧
+SHOVEL_STEP = 12
+
+class ScriptedMouse:
+    def __init__(self):
+        """
+        由脚本设置的鼠标，代替 pygame.mouse 的 get_pos 和 get_pressed
+        """
+        self.pos = (0, 0)
+        self.pressed = False
+
+    def Press(self, pos):
+        self.pos = (int(pos[0]) - VIEWPORT.x, int(pos[1]) - VIEWPORT.y)  # 世界坐标转换为窗口坐标
+        self.pressed = True
+
+    def get_pos(self):
+        return self.pos
+
+    def get_pressed(self, num_buttons = 3):
+        return (self.pressed, False, False)
+
+def Center(pos, size):
+    return (pos[0] + size[0] // 2, pos[1] + size[1] // 2)
+
+def Play(pvz, mouse, plan):
+    """
+    在运行一帧之前决定这一帧的鼠标：铲除期间只操作铲子，选中卡片后点击要种植的网格，
+    否则点击一个阳光，没有阳光时点击计划中下一张买得起的卡片
+    """
+    mouse.pressed = False
+    tick = pvz.game.tick
+    if tick == GOLD_TICK:
+        pvz.RequestGold(pvz.game.gold + 500)  # 与设置窗口相同，由游戏线程在下一个逻辑帧应用
+    shovel = pvz.game.shovel
+    if SHOVEL_TICK <= tick < SHOVEL_TICK + 3 * SHOVEL_STEP:
+        step, offset = divmod(tick - SHOVEL_TICK, SHOVEL_STEP)
+        if offset == 0:
+            if step == 0:
+                mouse.Press(Center(shovel.pos, shovel.size))  # 拿起铲子
+            elif step == 1:
+                mouse.Press(pvz.board.CellCenter(1, 1))  # 铲除
+            else:
+                mouse.Press(Center(pvz.game.shovelFrame.pos, pvz.game.shovelFrame.size))  # 放回铲子
+        return
+    if pvz.plant and plan:
+        name, column, row = plan.pop(0)
+        mouse.Press(pvz.board.CellCenter(column, row))
+        return
+    for sunlight in pvz.sunlight_list:
+        mouse.Press(Center(sunlight.pos, sunlight.size))
+        return
+    if plan:
+        for card in pvz.card:
+            if card.name == plan[0][0] and card.READY and card.affordable:
+                mouse.Press(Center(card.pos, card.size))
+                pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos = mouse.pos, button = 1))  # 选卡在事件循环中处理
+                return
+
+def State(pvz):
+    """
+    游戏状态的存档快照，去掉存档时间和全局随机数状态（只用于不影响结果的默认值）
+    """
+    snapshot = Capture(pvz)
+    snapshot["time"] = 0
+    snapshot["game"]["random"] = None
+    return Encode(snapshot)
+
+def Record(pvz, mouse, plan, ticks, states):
+    """
+    用脚本玩到第 ticks 帧（或者游戏结束），每隔 CHECK_INTERVAL 帧把游戏状态记入 states，然后结束录像
+    """
+    while pvz.game.tick < ticks and not pvz.gameover:
+        Play(pvz, mouse, plan)
+        pvz.Step()
+        if pvz.game.tick % CHECK_INTERVAL == 0:
+            states[pvz.game.tick] = State(pvz)
+    pvz.recorder.Close(pvz.game.tick)
+
+def Check(path, states):
+    """
+    回放录像，比较录像覆盖的每个帧的游戏状态
+
+    :return: 比较的帧数，有不同时退出
+    """
+    replayer = Replayer(path)
+    counts = {}
+    for tick, code, args in replayer.commands:
+        counts[COMMAND_NAME[code]] = counts.get(COMMAND_NAME[code], 0) + 1
+    print(f"录像从第 {replayer.header['tick']} 帧到第 {replayer.endTick} 帧，操作 {counts}")
+    checked = 0
+    for tick in sorted(states):
+        if replayer.header["tick"] < tick <= replayer.endTick:
+            replayer.Run(tick)
+            if State(replayer.pvz) != states[tick]:
+                print(f"帧 {tick}: 回放的游戏状态与录制时不同")
+                sys.exit(1)
+            checked += 1
+    return checked
+
+def main():
+    directory = tempfile.mkdtemp()
+    mouse = ScriptedMouse()
+    pygame.mouse.get_pos = mouse.get_pos
+    pygame.mouse.get_pressed = mouse.get_pressed
+    plan = list(PLAN)
+    states = {}
+    # 第一局玩到一半时退出并存档，再从存档继续玩到 TICKS 帧，两段各有一份录像
+    first = HeadlessGame(DEFAULT_LEVEL, SEED, 200, CARDS, os.path.join(directory, "first.pvzr"))
+    Record(first, mouse, plan, TICKS // 2, states)
+    second = HeadlessGame(DEFAULT_LEVEL, SEED, 200, CARDS, os.path.join(directory, "second.pvzr"), Encode(Capture(first)))
+    Record(second, mouse, plan, TICKS, states)
+    mouse.pressed = False  # 回放时不读取鼠标
+
+    checked = Check(os.path.join(directory, "first.pvzr"), states) + Check(os.path.join(directory, "second.pvzr"), states)
+    if checked != len(states):
+        print(f"只比较了 {checked} / {len(states)} 个帧")
+        sys.exit(1)
+    print(f"回放一致：比较了 {checked} 个帧的游戏状态，剩余计划 {len(plan)} 株")
+
+if __name__ == '__main__':
+    main()
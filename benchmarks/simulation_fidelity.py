@@ -0,0 +1,106 @@
+# 无界面模拟一致性检查：用同一个种子和同一个脚本（按计划种植、收集所有阳光）分别运行无界面模拟（Simulation）和真实的游戏（Replay.HeadlessGame），
+# 每隔 CHECK_INTERVAL 帧比较出生和消灭的僵尸数、金币和场上的僵尸数，最后比较游戏结束的帧。
+# 无界面模拟近似了部分规则（见 Simulation.py 开头的说明），所以按 TOLERANCE 允许小的差别，超出时返回非零退出码。
+# 机器人、平衡测试和强化学习环境都建立在无界面模拟上，修改游戏规则后用它检查两边是否仍然一致
+# 运行方法（在项目根目录）：python -m benchmarks.simulation_fidelity [-s 种子] [-t 帧数]
+import os  # 导入os库
+import sys  # 导入sys库
+import argparse  # 导入命令行参数库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+from data.src.Replay import *  # 导入操作录像（同时导入无界面模拟）
+
+CHECK_INTERVAL = 600  # 比较的间隔（帧）
+TOLERANCE = {"spawned": 0, "killed": 2, "gold": SUN_VALUE, "zombies": 2}  # 每次比较允许的差别：死亡的时机和一个阳光的收集时机不同
+GAMEOVER_TOLERANCE = SecondsToTicks(5)  # 游戏结束的帧允许的差别
+PLAN = [("sunflower", 1, row) for row in (3, 2, 4, 1, 5)] + [("peashooter", 2, row) for row in (3, 2, 4, 1, 5)] + \
+       [("peashooter", 3, row) for row in (3, 2, 4, 1, 5)] + [("nut", 6, row) for row in (3, 2, 4, 1, 5)]  # 按顺序种植，金币足够时种下一株
+
+class GameSide:
+    def __init__(self, level, seed):
+        """
+        真实的游戏：直接调用游戏的操作方法（与玩家点击走同样的代码），统计出生的僵尸
+        """
+        self.pvz = HeadlessGame(level, seed, 200, sorted({name for name, column, row in PLAN}))
+        self.spawned = 0
+        self.pvz.game.SubscribeCells(self.OnCell)
+
+    def OnCell(self, zombie, old, new):
+        if old is None:
+            self.spawned += 1
+
+    def Place(self, name, column, row):
+        pvz = self.pvz
+        pvz.plantType = settings["plant_name"].index(name)
+        return pvz.PlaceAt(pvz.board.CellCenter(column, row))
+
+    def Step(self):
+        pvz = self.pvz
+        for sunlight in list(pvz.sunlight_list):  # 收集所有阳光
+            pvz.game.CollectSunAt((sunlight.pos[0] + sunlight.size[0] // 2, sunlight.pos[1] + sunlight.size[1] // 2))
+        pvz.Step()
+
+    def State(self):
+        alive = sum(1 for zombie in self.pvz.zombie_list if zombie.hp > 0)  # 生命值为 0 的僵尸正在播放死亡动画，已经算作被消灭
+        return {"tick": self.pvz.game.tick, "spawned": self.spawned, "killed": self.spawned - alive, "gold": self.pvz.game.gold,
+                "zombies": alive, "gameover": self.pvz.gameover}
+
+class SimulationSide:
+    def __init__(self, level, seed):
+        """
+        无界面模拟：阳光出现时自动收集
+        """
+        self.simulation = Simulation(level, seed, 200, autoCollectSun = True)
+
+    def Place(self, name, column, row):
+        return self.simulation.Place(settings["plant_name"].index(name), column, row)
+
+    def Step(self):
+        self.simulation.Step()
+
+    def State(self):
+        result = self.simulation.Result()
+        return {"tick": result["tick"], "spawned": result["zombiesSpawned"], "killed": result["zombiesKilled"], "gold": result["gold"],
+                "zombies": result["zombies"], "gameover": result["gameover"]}
+
+def main():
+    parser = argparse.ArgumentParser(description = "比较无界面模拟和真实的游戏")
+    parser.add_argument("-l", "--level", type = int, default = DEFAULT_LEVEL, help = "关卡编号")
+    parser.add_argument("-s", "--seed", type = int, default = 1, help = "随机种子")
+    parser.add_argument("-t", "--ticks", type = int, default = 12000, help = "最多运行的帧数")
+    args = parser.parse_args()
+
+    sides = {"game": GameSide(args.level, args.seed), "simulation": SimulationSide(args.level, args.seed)}
+    plans = {name: list(PLAN) for name in sides}
+    differences = []
+    print("帧      " + "  ".join(f"{name}: 出生/消灭/金币/僵尸".ljust(30) for name in sides))
+    for tick in range(args.ticks):
+        states = {}
+        for name, side in sides.items():
+            plan = plans[name]
+            if plan and side.Place(*plan[0]):
+                plan.pop(0)
+            if not side.State()["gameover"]:
+                side.Step()
+            states[name] = side.State()
+        if (tick + 1) % CHECK_INTERVAL == 0 or all(state["gameover"] for state in states.values()):
+            game, simulation = states["game"], states["simulation"]
+            print(str(tick + 1).ljust(8) + "  ".join(f"{state['spawned']}/{state['killed']}/{state['gold']}/{state['zombies']}".ljust(34)
+                                                     for state in states.values()))
+            for key, tolerance in TOLERANCE.items():
+                if abs(game[key] - simulation[key]) > tolerance:
+                    differences.append((tick + 1, key, game[key], simulation[key]))
+            if all(state["gameover"] for state in states.values()):
+                break
+    ends = {name: side.State()["tick"] if side.State()["gameover"] else None for name, side in sides.items()}
+    print(f"游戏结束的帧：游戏 {ends['game']}，无界面模拟 {ends['simulation']}")
+    if (ends["game"] is None) != (ends["simulation"] is None) or \
+            ends["game"] is not None and abs(ends["game"] - ends["simulation"]) > GAMEOVER_TOLERANCE:
+        differences.append((args.ticks, "gameover", ends["game"], ends["simulation"]))
+    if differences:
+        print(f"无界面模拟与游戏的差别超出允许范围（共 {len(differences)} 处），第一处：帧 {differences[0][0]} {differences[0][1]} 游戏 {differences[0][2]}，模拟 {differences[0][3]}")
+        sys.exit(1)
+    print("无界面模拟与游戏一致（在允许的差别内）")
+
+if __name__ == '__main__':
+    main()
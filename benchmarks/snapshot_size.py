@@ -0,0 +1,68 @@
+# 存档快照压力测试：在游戏世界中放入大量僵尸、植物、豌豆和阳光，测量快照的大小和保存、读取、恢复的耗时
+# 运行方法（在项目根目录）：python -m benchmarks.snapshot_size
+import os  # 导入os库
+import time  # 导入time库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import data.src.PVZ as PVZ  # 导入游戏
+from data.src.Snapshot import *  # 导入存档快照
+
+COUNTS = [100, 1000, 5000]  # 每种实体的数量
+REPEAT = 5  # 每项测量重复的次数，取最快的一次
+
+def Populate(pvz, count):
+    """
+    在每一行放入 count 个僵尸、豌豆射手、向日葵、豌豆和阳光
+    """
+    game = pvz.game
+    for name in ENTITY_LISTS:
+        del getattr(pvz, name)[:]
+    rows = game.board.rows
+    for index in range(count):
+        row = index % rows + 1
+        column = index % game.board.columns + 1
+        zombie = Zombie(pvz, "common_zombie", row)
+        zombie.pos[0] -= index % 500
+        zombie.hp -= index % 7
+        pvz.zombie_list.append(zombie)
+        pvz.peashooter_list.append(Peashooter(pvz, (game.board.gridX[column], game.board.gridY[row])))
+        pvz.sunflower_list.append(Sunflower(pvz, (game.board.gridX[column], game.board.gridY[row])))
+        pvz.pea_list.append(Pea((100 + index % 600, game.board.gridY[row]), pvz.screen, row, game.board))
+        pvz.sunlight_list.append(Sunlight(pvz.screen, (100 + index % 600, 0)))
+
+def Best(function, *args):
+    """
+    重复运行，返回最快一次的耗时（毫秒）和结果
+    """
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = function(*args)
+        cost = (time.perf_counter() - start) * 1000
+        best = cost if best is None else min(best, cost)
+    return best, result
+
+def main():
+    PVZ.RECORD_REPLAY = False  # 不生成操作录像
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.game = Game(pvz)
+    pvz.board = pvz.game.board
+    pvz.ObjectGame = pvz
+    pvz.initialize_list()  # 与 Pvz.start 相同，但不加载音乐、不进入开始界面
+    pvz.initialize_instance()
+    print("每种实体数  实体总数  快照(KB)  未压缩(KB)  捕获(ms)  编码(ms)  解码(ms)  恢复(ms)")
+    for count in COUNTS:
+        Populate(pvz, count)
+        entities = sum(len(getattr(pvz, name)) for name in ENTITY_LISTS)
+        captureCost, snapshot = Best(Capture, pvz)
+        encodeCost, data = Best(Encode, snapshot)
+        raw = Encode(snapshot, compress = 0)
+        decodeCost, decoded = Best(Decode, data)
+        restoreCost, _ = Best(Restore, pvz, decoded)
+        print(str(count).ljust(11), str(entities).ljust(9), f"{len(data) / 1024:.1f}".ljust(9), f"{len(raw) / 1024:.1f}".ljust(11),
+              f"{captureCost:.1f}".ljust(9), f"{encodeCost:.1f}".ljust(9), f"{decodeCost:.1f}".ljust(9), f"{restoreCost:.1f}")
+
+if __name__ == '__main__':
+    main()
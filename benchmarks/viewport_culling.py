@@ -0,0 +1,56 @@
+# 视口剔除压力测试：一大群僵尸分布在比窗口宽得多的范围内（大草坪、大波僵尸），比较开启和关闭剔除时每帧运行僵尸的耗时，并输出每帧绘制和剔除的数量
+# 运行方法（在项目根目录）：python -m benchmarks.viewport_culling
+import os  # 导入os库
+import time  # 导入time库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import data.src.PVZ as PVZ  # 导入游戏
+from data.src.Game import *  # 导入游戏处理核心（同时导入所有游戏对象）
+
+COUNTS = [500, 2000]  # 僵尸数量
+WIDTHS = [1, 4]  # 僵尸分布范围是窗口宽度的几倍
+FRAMES = 60  # 每项测量运行的帧数
+TYPES = ["common_zombie", "conehead_zombie", "buckethead_zombie"]  # 轮流使用的僵尸类型
+
+def RunFrames(pvz, zombies):
+    """
+    运行 FRAMES 帧，返回平均每帧的耗时（毫秒）
+    """
+    for zombie in zombies:  # 预热一帧，不计时
+        zombie.run()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for zombie in zombies:
+            zombie.run()
+        VIEWPORT.EndFrame()
+        CLOCK.Advance()
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+def main():
+    PVZ.RECORD_REPLAY = False  # 不生成操作录像
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.game = Game(pvz)
+    pvz.board = pvz.game.board
+    pvz.ObjectGame = pvz
+    pvz.initialize_list()  # 与 Pvz.start 相同，但不加载音乐、不进入开始界面
+    pvz.initialize_instance()
+    PreloadAnimations()  # 动画帧预先加载，只比较绘制和取帧
+    print("僵尸数  分布宽度  关闭剔除(ms/帧)  开启剔除(ms/帧)  每帧绘制  每帧剔除")
+    for count in COUNTS:
+        for width in WIDTHS:
+            types = [TYPES[index % len(TYPES)] for index in range(count)]
+            lanes = [index % pvz.board.rows + 1 for index in range(count)]
+            offsets = [index * GAME_SIZE[0] * width // count - pvz.board.zombieFirstX for index in range(count)]
+            results = []
+            for enabled in (False, True):
+                VIEWPORT.enabled = enabled
+                zombies = Zombie.SpawnBatch(pvz, types, lanes, offsets)
+                results.append(RunFrames(pvz, zombies))
+            print(str(count).ljust(7), f"{width}x".ljust(9), f"{results[0]:.2f}".ljust(16), f"{results[1]:.2f}".ljust(16),
+                  str(VIEWPORT.lastDrawn).ljust(9), VIEWPORT.lastCulled)
+    VIEWPORT.enabled = True
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# 僵尸批量出生压力测试：比较逐只创建和 Zombie.SpawnBatch（逐只完整初始化，有偏移时再重新计算网格）一次创建一大波僵尸的耗时，与一帧的时间预算（1000 / DEFAULT_FPS 毫秒）比较
+# 运行方法（在项目根目录）：python -m benchmarks.zombie_spawn
+import os  # 导入os库
+import time  # 导入time库
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+import data.src.PVZ as PVZ  # 导入游戏
+from data.src.Game import *  # 导入游戏处理核心（同时导入所有游戏对象）
+
+COUNTS = [50, 500, 5000]  # 一波僵尸的数量
+TYPES = ["common_zombie", "conehead_zombie", "buckethead_zombie"]  # 轮流使用的僵尸类型
+REPEAT = 5  # 每项测量重复的次数，取最快的一次
+
+def Best(function):
+    """
+    重复运行，返回最快一次的耗时（毫秒）
+    """
+    best = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        cost = (time.perf_counter() - start) * 1000
+        best = cost if best is None else min(best, cost)
+    return best
+
+def main():
+    PVZ.RECORD_REPLAY = False  # 不生成操作录像
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.game = Game(pvz)
+    pvz.board = pvz.game.board
+    pvz.ObjectGame = pvz
+    pvz.initialize_list()  # 与 Pvz.start 相同，但不加载音乐、不进入开始界面
+    pvz.initialize_instance()
+    budget = 1000 / DEFAULT_FPS
+    print(f"一帧的时间预算 {budget:.1f}ms")
+    print("僵尸数  逐只创建(ms)  批量创建(ms)  加速比  批量/预算")
+    for count in COUNTS:
+        types = [TYPES[index % len(TYPES)] for index in range(count)]
+        lanes = [index % pvz.board.rows + 1 for index in range(count)]
+        offsets = [index % 50 for index in range(count)]
+        single = Best(lambda: [Zombie(pvz, types[index], lanes[index]) for index in range(count)])
+        batch = Best(lambda: Zombie.SpawnBatch(pvz, types, lanes, offsets))
+        print(str(count).ljust(7), f"{single:.2f}".ljust(13), f"{batch:.2f}".ljust(13), f"{single / batch:.1f}".ljust(7), f"{batch / budget:.0%}")
+
+if __name__ == '__main__':
+    main()
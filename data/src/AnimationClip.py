@@ -0,0 +1,63 @@
+import pygame # 导入pygame库
+
+class AnimationClip:
+    def __init__(self, path, size, imageCount):
+        """
+        动画片段：一组缩放好的动画帧，按 (路径, 尺寸, 图片数量) 只创建一次，所有使用相同动画的对象共享，
+        对象只保存片段的引用和当前帧的索引。帧在第一次使用时加载，之后不再修改
+
+        :param path: 图片路径，多帧动画为带 %d 的路径模板
+        :param size: 缩放后的尺寸
+        :param imageCount: 图片数量，1 表示静态图片
+        """
+        self.path = path
+        self.size = tuple(size)
+        self.imageCount = imageCount
+        self.frames = [None] * (imageCount + 1)  # frames[i] 为第 i 帧（多帧动画从 1 开始，静态图片为 frames[1]）
+
+    def Frame(self, index):
+        """
+        获取第 index 帧，第一次使用时加载并缩放
+
+        :param index: 帧索引，静态图片忽略
+        """
+        if self.imageCount == 1:
+            index = 1
+        frame = self.frames[index]
+        if frame is None:
+            path = self.path if self.imageCount == 1 else self.path % index
+            frame = pygame.transform.scale(pygame.image.load(path), self.size)
+            self.frames[index] = frame
+        return frame
+
+    def Loaded(self):
+        """
+        已经加载的帧数
+        """
+        return sum(frame is not None for frame in self.frames)
+
+    def Bytes(self):
+        """
+        已经加载的帧占用的像素内存（字节）
+        """
+        return sum(frame.get_bytesize() * frame.get_width() * frame.get_height() for frame in self.frames if frame is not None)
+
+CLIPS = {}  # (路径, 尺寸, 图片数量) -> 动画片段
+
+def GetClip(path, size, imageCount):
+    """
+    获取共享的动画片段，不存在时创建
+    """
+    key = (path, tuple(size), imageCount)
+    clip = CLIPS.get(key)
+    if clip is None:
+        clip = CLIPS[key] = AnimationClip(path, size, imageCount)
+    return clip
+
+def ClipStats():
+    """
+    动画片段缓存的统计
+
+    :return: (片段数, 已加载的帧数, 像素内存字节数)
+    """
+    return len(CLIPS), sum(clip.Loaded() for clip in CLIPS.values()), sum(clip.Bytes() for clip in CLIPS.values())
@@ -0,0 +1,64 @@
+from data.src.const import *  # 导入常量
+
+class AnimationClock:
+    def __init__(self, fps = DEFAULT_FPS):
+        """
+        共享的动画时钟：帧循环每帧调用一次 Advance，所有对象的动画和移动都读取同一个 now，
+        不再各自调用 time.time()。时间由帧数推进，暂停、慢放和快进只需要修改这里
+
+        :param fps: 每秒帧数，一帧推进 1 / fps 秒
+        """
+        self.fps = fps  # 每秒帧数
+        self.ticks = 0.0  # 已经推进的帧数（乘以速度）
+        self.now = 0.0  # 当前的动画时间（秒）
+        self.scale = 1.0  # 速度倍率，1 为正常速度，小于 1 为慢放，大于 1 为快进
+        self.paused = False  # 是否暂停
+
+    def Advance(self, ticks = 1):
+        """
+        推进时钟，暂停时不变
+
+        :param ticks: 推进的帧数
+        """
+        if self.paused:
+            return
+        self.ticks += ticks * self.scale
+        self.now = self.ticks / self.fps
+
+    def Elapsed(self, since, seconds):
+        """
+        从帧数 since 到现在是否已经经过 seconds 秒。按帧计数（至少经过 round(seconds * fps) 帧，与无界面模拟的 SecondsToTicks 相同），
+        不比较浮点的秒数，结果与时钟已经推进了多少帧无关，存档恢复后和回放时的计时与原来完全相同
+
+        :param since: 开始计时的帧数（CLOCK.ticks）
+        :param seconds: 秒数
+        :return: 已经经过返回 True
+        """
+        return self.ticks - since >= max(1, round(seconds * self.fps))
+
+    def SetScale(self, scale):
+        """
+        设置速度倍率
+        """
+        self.scale = scale
+
+    def Pause(self):
+        """
+        暂停动画
+        """
+        self.paused = True
+
+    def Resume(self):
+        """
+        继续动画
+        """
+        self.paused = False
+
+    def Reset(self):
+        """
+        回到 0 时刻（速度和暂停状态不变）
+        """
+        self.ticks = 0.0
+        self.now = 0.0
+
+CLOCK = AnimationClock()  # 游戏使用的动画时钟
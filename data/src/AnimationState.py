@@ -0,0 +1,161 @@
+from data.src.settings import *  # 导入设置
+from data.src.AnimationClip import *  # 导入共享的动画片段
+
+# 动画状态机的声明：每种对象有若干状态，每个状态对应一个动画片段（settings 中的路径、图片数量和尺寸的键名），
+# 可以声明帧事件（播放到第几帧时调用对象的 OnFrameEvent）、播放完后自动进入的状态，以及收到触发时进入的状态。
+#   "section"：片段的键名所在的 settings 路径，默认为状态机的名字，状态中也可以单独指定
+#   "initial"：初始状态
+#   "states"：状态名 -> {"path": 路径键, "count": 图片数量键, "size": 尺寸键（默认 "size"）,
+#                        "events": {帧: 事件名}（负数从最后一帧倒数，-1 为最后一帧）, "end": 播放完后进入的状态, "on": {触发名: 目标状态}}
+# 启动时编译为 StateMachine：状态名换成整数编号，片段从共享缓存中取得，切换状态只是查表和复制编译好的字段。
+
+def ZombieAnimation(zombieType):
+    """
+    各种僵尸共用的状态机声明：行走、啃食、无头、死亡、燃烧
+    """
+    dying = {"die": "dead", "burn": "burn"}
+    return {
+        "section": (zombieType,),
+        "initial": "walk",
+        "states": {
+            "walk": {"path": "path", "count": "imageCount", "on": dict(dying, eat = "eat", behead = "headless")},
+            "eat": {"path": "eatPath", "count": "eatImageCount", "on": dict(dying, stop = "walk", behead = "headless")},
+            "headless": {"path": "headlessPath", "count": "headlessImageCount", "on": dying},
+            "dead": {"path": "deadPath", "count": "deadImageCount", "on": {"burn": "burn"}},
+            "burn": {"section": ("game", "zombie-burn"), "path": "Path", "count": "ImageCount", "size": "Size"},
+        },
+    }
+
+ANIMATIONS = {
+    "peashooter": {
+        "initial": "idle",
+        "states": {
+            "idle": {"path": "path", "count": "imageCount", "on": {"fire": "shoot"}},
+            "shoot": {"path": "shoot_path", "count": "shoot_imageCount", "events": {6: "shoot"}, "end": "idle"},
+        },
+    },
+    "sunflower": {
+        "initial": "idle",
+        "states": {
+            "idle": {"path": "path", "count": "imageCount", "on": {"fire": "shoot"}},
+            "shoot": {"path": "shoot_path", "count": "shoot_imageCount", "events": {7: "sun"}, "end": "idle"},
+        },
+    },
+    "nut": {
+        "initial": "nut1",
+        "states": {
+            "nut1": {"path": "path1", "count": "imageCount1", "on": {"damage": "nut2"}},
+            "nut2": {"path": "path2", "count": "imageCount2", "on": {"damage": "nut3"}},
+            "nut3": {"path": "path3", "count": "imageCount3"},
+        },
+    },
+    "potato_mine": {
+        "initial": "init",
+        "states": {
+            "init": {"path": "initPath", "count": "initImageCount", "on": {"grow": "armed", "explode": "explosion"}},
+            "armed": {"path": "path", "count": "imageCount", "on": {"explode": "explosion"}},
+            "explosion": {"path": "ExplosionPath", "count": "ExplosionImageCount"},
+        },
+    },
+    "chomper": {
+        "initial": "idle",
+        "states": {
+            "idle": {"path": "path", "count": "imageCount", "on": {"eat": "eat"}},
+            "eat": {"path": "eatPath", "count": "eatImageCount", "events": {7: "bite"}, "end": "eating"},
+            "eating": {"path": "eatingPath", "count": "eatingImageCount", "on": {"done": "idle"}},
+        },
+    },
+    "cherry_bomb": {
+        "initial": "init",
+        "states": {
+            "init": {"path": "initExplosionPath", "count": "initExplosionImageCount", "events": {-1: "explode"}, "on": {"explode": "explosion"}},
+            "explosion": {"path": "ExplosionPath", "count": "ExplosionImageCount", "size": "ExplosionSize", "events": {-1: "finish"}},
+        },
+    },
+    "jalapeno": {
+        "initial": "init",
+        "states": {
+            "init": {"path": "path", "count": "imageCount", "events": {-1: "explode"}, "on": {"explode": "explosion"}},
+            "explosion": {"path": "ExplosionPath", "count": "ExplosionImageCount", "size": "ExplosionSize", "events": {-1: "finish"}},
+        },
+    },
+    "squash": {
+        "initial": "idle",
+        "states": {
+            "idle": {"path": "path", "count": "imageCount", "on": {"attack": "attack"}},
+            "attack": {"path": "attackPath", "count": "attackImageCount", "events": {-2: "hit", -1: "land"}},
+        },
+    },
+    "GrowSoil": {
+        "initial": "grow",
+        "states": {
+            "grow": {"path": "path", "count": "imageCount", "events": {-1: "done"}},
+        },
+    },
+    "common_zombie": ZombieAnimation("common_zombie"),
+    "conehead_zombie": ZombieAnimation("conehead_zombie"),
+    "buckethead_zombie": ZombieAnimation("buckethead_zombie"),
+}
+
+class AnimationState:
+    __slots__ = ("id", "name", "path", "imageCount", "size", "clip", "events", "end", "transitions")
+
+    def __init__(self, id, name, path, imageCount, size):
+        self.id = id  # 状态编号
+        self.name = name  # 状态名
+        self.path = path  # 图片路径
+        self.imageCount = imageCount  # 图片数量
+        self.size = size  # 图片尺寸
+        self.clip = GetClip(path, size, imageCount)  # 共享的动画片段
+        self.events = {}  # 帧 -> 事件名
+        self.end = -1  # 播放完后进入的状态编号，-1 表示循环播放
+        self.transitions = {}  # 触发名 -> 目标状态编号
+
+class StateMachine:
+    def __init__(self, name, definition):
+        """
+        把状态机的声明编译为按编号索引的状态表
+
+        :param name: 状态机的名字，也是默认的 settings 键
+        :param definition: ANIMATIONS 中的声明
+        """
+        self.name = name
+        section = definition.get("section", (name,))
+        self.ids = {stateName: index for index, stateName in enumerate(definition["states"])}  # 状态名 -> 编号
+        self.states = []  # 编号 -> AnimationState
+        for stateName, spec in definition["states"].items():
+            values = settings
+            for key in spec.get("section", section):
+                values = values[key]
+            state = AnimationState(self.ids[stateName], stateName, values[spec["path"]], values[spec["count"]],
+                                   tuple(values[spec.get("size", "size")]))
+            for frame, event in spec.get("events", {}).items():
+                if frame < 0:
+                    frame += state.imageCount + 1
+                if not 1 <= frame <= state.imageCount:
+                    raise ValueError(f"{name}.{stateName} 的帧事件 {event} 在第 {frame} 帧，超出了图片数量 {state.imageCount}")
+                state.events[frame] = event
+            self.states.append(state)
+        for stateName, spec in definition["states"].items():
+            state = self.states[self.ids[stateName]]
+            if "end" in spec:
+                state.end = self.ids[spec["end"]]
+            state.transitions = {trigger: self.ids[target] for trigger, target in spec.get("on", {}).items()}
+        self.initial = self.ids[definition["initial"]]  # 初始状态编号
+
+    def Preload(self):
+        """
+        加载所有状态的全部帧
+        """
+        for state in self.states:
+            for index in range(1, state.imageCount + 1):
+                state.clip.Frame(index)
+
+MACHINES = {name: StateMachine(name, definition) for name, definition in ANIMATIONS.items()}  # 编译好的状态机
+
+def PreloadAnimations():
+    """
+    启动时加载所有状态机用到的动画帧，之后切换状态不会再读取磁盘
+    """
+    for machine in MACHINES.values():
+        machine.Preload()
@@ -0,0 +1,83 @@
+import pygame # 导入pygame库
+from collections import OrderedDict  # 导入有序字典，用于最近最少使用的淘汰
+from data.src.const import *  # 导入常量
+
+class BackgroundTiles:
+    def __init__(self, image, imagePos, board, tileSize = BACKGROUND_TILE_SIZE, capacity = BACKGROUND_TILE_CACHE):
+        """
+        分块缓存的世界背景：世界被切成 tileSize x tileSize 的小块，每块在第一次显示时合成一次并缓存，
+        每帧只绘制与窗口相交的小块，绘制开销与世界大小无关。
+        比默认草坪大的草坪用默认草坪的图片平铺出来
+
+        :param image: 缩放好的背景图片（默认草坪）
+        :param imagePos: 背景图片左上角的世界坐标
+        :param board: 草坪
+        :param tileSize: 小块的边长
+        :param capacity: 最多缓存的小块数量，超过时淘汰最久没有显示的
+        """
+        self.image = image
+        self.imagePos = tuple(imagePos)
+        self.board = board
+        self.tileSize = tileSize
+        self.capacity = capacity
+        self.tiles = OrderedDict()  # (列, 行) -> 合成好的小块
+        # 背景图片中默认草坪（GRID_COUNT 格）的区域，用于平铺更大的草坪
+        self.lawnSize = (GRID_COUNT[0] * board.cellSize[0], GRID_COUNT[1] * board.cellSize[1])
+        self.lawn = image.subsurface(pygame.Rect(board.left - self.imagePos[0], board.top - self.imagePos[1], *self.lawnSize))
+
+    def Build(self, column, row):
+        """
+        合成一个小块：先画背景图片，再把默认草坪平铺到超出默认大小的草坪上
+
+        :return: 小块的 Surface
+        """
+        size = self.tileSize
+        originX = column * size
+        originY = row * size
+        tile = pygame.Surface((size, size))
+        tile.fill(WHITE)
+        tile.blit(self.image, (self.imagePos[0] - originX, self.imagePos[1] - originY))
+        board = self.board
+        lawnWidth, lawnHeight = self.lawnSize
+        for blockY in range(0, board.rows * board.cellSize[1], lawnHeight):
+            for blockX in range(0, board.columns * board.cellSize[0], lawnWidth):
+                if blockX == 0 and blockY == 0:
+                    continue  # 默认草坪本身已经在背景图片中
+                x = board.left + blockX
+                y = board.top + blockY
+                if x >= originX + size or y >= originY + size or x + lawnWidth <= originX or y + lawnHeight <= originY:
+                    continue  # 与这个小块不相交
+                width = min(lawnWidth, board.left + board.columns * board.cellSize[0] - x)
+                height = min(lawnHeight, board.top + board.rows * board.cellSize[1] - y)
+                tile.blit(self.lawn, (x - originX, y - originY), pygame.Rect(0, 0, width, height))
+        return tile
+
+    def Tile(self, column, row):
+        """
+        获取一个小块，没有缓存时合成
+        """
+        key = (column, row)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = self.tiles[key] = self.Build(column, row)
+            if len(self.tiles) > self.capacity:
+                self.tiles.popitem(last = False)  # 淘汰最久没有显示的小块
+        else:
+            self.tiles.move_to_end(key)
+        return tile
+
+    def Draw(self, screen, viewport):
+        """
+        绘制与窗口相交的小块
+
+        :param screen: 窗口
+        :param viewport: 摄像机
+        :return: 绘制的小块数量
+        """
+        size = self.tileSize
+        first = (viewport.x // size, viewport.y // size)
+        last = ((viewport.x + viewport.width - 1) // size, (viewport.y + viewport.height - 1) // size)
+        for row in range(first[1], last[1] + 1):
+            for column in range(first[0], last[0] + 1):
+                screen.blit(self.Tile(column, row), (column * size - viewport.x, row * size - viewport.y))
+        return (last[0] - first[0] + 1) * (last[1] - first[1] + 1)
@@ -0,0 +1,220 @@
+import os  # 导入os库
+import sys  # 导入sys库
+import csv  # 导入csv库
+import copy  # 导入拷贝库
+import json  # 导入json库
+import time  # 导入time库
+import argparse  # 导入命令行参数库
+import multiprocessing  # 导入多进程库
+import data.src.Simulation as simulationModule  # 导入无界面模拟模块，用于修改其中的常量
+from data.src.Simulation import *  # 导入无界面模拟
+
+# 平衡测试：用脚本策略在多个进程中批量运行带种子的无界面对局，按配置汇总存活时间、胜率和阳光经济，
+# 输出 CSV/JSON 报告。每个配置的结果按配置哈希缓存，配置不变时再次运行直接读取缓存。
+# 运行方法（在项目根目录）：python -m data.src.BalanceRunner data/balance/example.json
+
+CACHE_VERSION = 1  # 模拟规则或统计方式改变时加一，使旧缓存失效
+CACHE_DIR = "./data/balance/cache"  # 缓存目录
+TUNABLE_CONST = ("PEATIME", "SUNTIME", "SUNLIGHT_TIME", "SUNLIGHT_DELETE_TIME", "PLANT_HP", "NUT_HP", "ZOMBIE_MOVE_TICKS", "PEA_SPEED", "SUN_VALUE")  # 可以在配置中修改的常量
+REPORT_FIELDS = ("name", "hash", "games", "winRate", "survivalMean", "survivalMin", "survivalMax", "zombiesKilledMean",
+                 "sunProducedMean", "sunCollectedMean", "goldSpentMean", "goldLeftMean", "plantsPlacedMean", "cached")
+
+BUILD_ORDER = {  # 脚本策略：按顺序在每一行种下 (植物编号, 列)，前一项在所有行种完后才种下一项
+    "none": [],
+    "economy": [(1, 1), (2, 2), (1, 3), (2, 4), (2, 5), (3, 8)],
+    "rush": [(2, 1), (2, 2), (1, 3), (2, 4)],
+    "wall": [(1, 1), (2, 2), (3, 7), (2, 3), (1, 4), (2, 5)],
+}
+STRATEGY_INTERVAL = 30  # 脚本策略每隔多少帧检查一次
+
+def BuildOrderStrategy(name):
+    """
+    创建按建造顺序种植的脚本策略
+
+    :param name: BUILD_ORDER 中的策略名称
+    :return: strategy(simulation) 函数
+    """
+    order = BUILD_ORDER[name]
+    def strategy(simulation):
+        if simulation.tick % STRATEGY_INTERVAL:
+            return
+        for plantType, column in order:
+            column = min(column, simulation.board.columns)
+            for row in range(1, simulation.board.rows + 1):
+                if simulation.map.IsFree(column, row):
+                    if not simulation.Place(plantType, column, row):
+                        return  # 金币不够时等待，保证按顺序建造
+    return strategy
+
+_BASE_SETTINGS = copy.deepcopy(settings)  # 未修改的设置
+_BASE_CONST = {name: getattr(simulationModule, name) for name in TUNABLE_CONST}  # 未修改的常量
+_appliedHash = None  # 当前进程已经应用的配置哈希
+
+def _Merge(target, override):
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _Merge(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+def ApplyConfig(config):
+    """
+    在当前进程中应用配置：先恢复原始设置和常量，再合并配置中的修改
+
+    :param config: 配置字典，"settings" 为要合并进 settings 的修改，"const" 为要修改的常量
+    """
+    global _appliedHash
+    configHash = ConfigHash([config.get("settings", {}), config.get("const", {})])
+    if configHash == _appliedHash:
+        return
+    settings.clear()
+    settings.update(copy.deepcopy(_BASE_SETTINGS))
+    _Merge(settings, config.get("settings", {}))
+    for name, value in _BASE_CONST.items():
+        setattr(simulationModule, name, value)
+    for name, value in config.get("const", {}).items():
+        if name not in TUNABLE_CONST:
+            raise KeyError(f"常量 {name} 不能在平衡测试中修改，可修改的常量：{', '.join(TUNABLE_CONST)}")
+        setattr(simulationModule, name, value)
+    RebuildPlantSpec()
+    _appliedHash = configHash
+
+def ConfigKey(config):
+    """
+    计算配置的缓存键，包括原始设置，所以修改 settings.py 也会使缓存失效
+
+    :return: 十六进制哈希字符串
+    """
+    return ConfigHash([CACHE_VERSION, _BASE_SETTINGS, _BASE_CONST, BUILD_ORDER.get(config["strategy"]),
+                       {key: value for key, value in config.items() if key not in ("name", "key")}])
+
+def NormalizeConfig(config, defaults):
+    """
+    补全配置的默认值
+
+    :param config: 单个配置
+    :param defaults: 全局默认值（配置文件中 configs 以外的字段）
+    :return: 完整的配置字典
+    """
+    result = {"level": DEFAULT_LEVEL, "strategy": "economy", "gold": 200, "games": 100, "seedStart": 0,
+              "ticks": None, "autoCollectSun": True, "settings": {}, "const": {}}
+    result.update({key: value for key, value in defaults.items() if key != "configs"})
+    result.update(config)
+    if isinstance(result["level"], str) and result["level"].isdigit():
+        result["level"] = int(result["level"])  # JSON 的键只能是字符串
+    if result["strategy"] not in BUILD_ORDER:
+        raise KeyError(f"未知的策略 {result['strategy']}，可用的策略：{', '.join(BUILD_ORDER)}")
+    if result["ticks"] is None:
+        result["ticks"] = settings["level"][result["level"]]["length"]
+    result.setdefault("name", result["strategy"])
+    return result
+
+def PlayGame(task):
+    """
+    运行一局对局（在工作进程中执行）
+
+    :param task: (配置, 种子)
+    :return: (配置哈希, 对局结果)
+    """
+    config, seed = task
+    ApplyConfig(config)
+    simulation = Simulation(config["level"], seed, config["gold"], config["autoCollectSun"])
+    result = simulation.Run(config["ticks"], BuildOrderStrategy(config["strategy"]))
+    return config["key"], result
+
+def Summarize(config, results):
+    """
+    汇总一个配置的所有对局结果
+
+    :return: 报告中的一行
+    """
+    count = len(results)
+    survival = [result["tick"] for result in results]
+    mean = lambda name: round(sum(result[name] for result in results) / count, 2)
+    return {
+        "name": config["name"],
+        "hash": config["key"][:12],
+        "games": count,
+        "winRate": round(sum(not result["gameover"] for result in results) / count, 4),
+        "survivalMean": round(sum(survival) / count, 2),
+        "survivalMin": min(survival),
+        "survivalMax": max(survival),
+        "zombiesKilledMean": mean("zombiesKilled"),
+        "sunProducedMean": mean("sunProduced"),
+        "sunCollectedMean": mean("sunCollected"),
+        "goldSpentMean": mean("goldSpent"),
+        "goldLeftMean": mean("gold"),
+        "plantsPlacedMean": mean("plantsPlaced"),
+    }
+
+def Run(configs, processes = None, cacheDir = CACHE_DIR, useCache = True):
+    """
+    运行所有配置，已缓存的配置直接读取结果
+
+    :param configs: 完整的配置列表，见 NormalizeConfig
+    :param processes: 进程数，默认使用全部CPU核心
+    :param cacheDir: 缓存目录
+    :param useCache: 是否读取缓存
+    :return: 报告行列表，顺序与 configs 相同
+    """
+    rows = {}
+    tasks = []
+    for config in configs:
+        config["key"] = ConfigKey(config)
+        path = os.path.join(cacheDir, config["key"] + ".json")
+        if useCache and os.path.exists(path):
+            with open(path, "r", encoding = "utf-8") as file:
+                rows[config["key"]] = dict(json.load(file), name = config["name"], cached = True)
+        elif config["key"] not in rows:
+            rows[config["key"]] = None
+            tasks.extend((config, seed) for seed in range(config["seedStart"], config["seedStart"] + config["games"]))
+    if tasks:
+        results = {}
+        with multiprocessing.Pool(processes) as pool:
+            for key, result in pool.imap_unordered(PlayGame, tasks, chunksize = max(1, len(tasks) // ((processes or os.cpu_count() or 1) * 8))):
+                results.setdefault(key, []).append(result)
+        os.makedirs(cacheDir, exist_ok = True)
+        for config in configs:
+            if rows[config["key"]] is None:
+                row = Summarize(config, results[config["key"]])
+                with open(os.path.join(cacheDir, config["key"] + ".json"), "w", encoding = "utf-8") as file:
+                    json.dump(row, file, ensure_ascii = False, indent = 4)
+                rows[config["key"]] = dict(row, cached = False)
+    return [dict(rows[config["key"]], name = config["name"]) for config in configs]
+
+def WriteReport(rows, output):
+    """
+    写出 CSV 和 JSON 报告
+
+    :param rows: Run 的返回值
+    :param output: 输出路径（不含扩展名）
+    """
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok = True)
+    with open(output + ".csv", "w", encoding = "utf-8", newline = "") as file:
+        writer = csv.DictWriter(file, REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(output + ".json", "w", encoding = "utf-8") as file:
+        json.dump(rows, file, ensure_ascii = False, indent = 4)
+
+def main():
+    parser = argparse.ArgumentParser(description = "批量运行无界面对局，统计不同平衡数值下的胜率和阳光经济")
+    parser.add_argument("config", help = "配置文件（JSON），格式见 data/balance/example.json")
+    parser.add_argument("-o", "--output", default = "./data/balance/report", help = "报告输出路径（不含扩展名）")
+    parser.add_argument("-p", "--processes", type = int, default = None, help = "进程数，默认使用全部CPU核心")
+    parser.add_argument("--no-cache", action = "store_true", help = "忽略缓存，重新运行所有配置")
+    args = parser.parse_args()
+    with open(args.config, "r", encoding = "utf-8") as file:
+        defaults = json.load(file)
+    configs = [NormalizeConfig(config, defaults) for config in defaults.get("configs", [{}])]
+    start = time.perf_counter()
+    rows = Run(configs, args.processes, useCache = not args.no_cache)
+    WriteReport(rows, args.output)
+    for row in rows:
+        print(f"{row['name']:<24} 胜率 {row['winRate']:.2%}  平均存活 {row['survivalMean']:.0f} 帧  平均产生阳光 {row['sunProducedMean']:.0f}" + ("  (缓存)" if row["cached"] else ""))
+    print(f"用时 {time.perf_counter() - start:.2f}s，报告已写入 {args.output}.csv / {args.output}.json", file = sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+import math  # 导入数学计算库
+from data.src.const import *  # 导入常量
+from data.src.PlantGrid import *  # 导入植物地图
+
+class Board:
+    def __init__(self, columns = GRID_COUNT[0], rows = GRID_COUNT[1]):
+        """
+        初始化草坪，所有按行、按格保存的数据都根据草坪的行列数创建
+
+        :param columns: 草坪的列数
+        :param rows: 草坪的行数（即僵尸行进的路数）
+        """
+        self.columns = columns  # 列数
+        self.rows = rows  # 行数
+        self.left = GRID_LEFT_X  # 网格的左边横坐标
+        self.top = GRID_TOP_Y  # 网格的顶部纵坐标
+        self.cellSize = GRID_SIZE  # 网格的大小
+        # 右边界与下边界按默认草坪的边界随行列数平移，默认草坪与原常量完全一致
+        self.right = GRID_RIGHT_X + (columns - GRID_COUNT[0]) * GRID_SIZE[0]  # 网格的右边横坐标
+        self.down = GRID_DOWN_Y + (rows - GRID_COUNT[1]) * GRID_SIZE[1]  # 网格的底部纵坐标
+        self.zombieFirstX = ZONBIE_FIRST_X + (columns - GRID_COUNT[0]) * GRID_SIZE[0]  # 僵尸出现的横坐标
+        self.rightVirtualX = self.left + (columns + 1) * GRID_SIZE[0]  # 右侧虚拟网格的横坐标
+        # 每个网格左上角的坐标，索引 0 为占位，与网格坐标（从 1 开始）一致
+        self.gridX = (0,) + tuple(self.left + (i - 1) * GRID_SIZE[0] for i in range(1, columns + 1))
+        self.gridY = (0,) + tuple(self.top + (i - 1) * GRID_SIZE[1] for i in range(1, rows + 1))
+        # 像素 -> 网格的查找表：columnAt[x] 为横坐标 x 所在的列，rowAt[y] 为纵坐标 y 所在的行（网格的左边线和上边线属于该格），
+        # 覆盖整个窗口以及僵尸出现位置右侧一格，草坪外的像素按同样的规则编号（可能为 0 或负数）
+        width = max(GAME_SIZE[0], self.zombieFirstX + GRID_SIZE[0]) + GRID_SIZE[0] + 1
+        height = max(GAME_SIZE[1], self.down) + GRID_SIZE[1] + 1
+        self.columnAt = tuple((x - self.left) // GRID_SIZE[0] + 1 for x in range(width))
+        self.rowAt = tuple((y - self.top) // GRID_SIZE[1] + 1 for y in range(height))
+        # 世界（背景和所有实体所在的坐标系）的大小，草坪的右边和下边与窗口边缘保持与默认草坪相同的距离，默认草坪正好是一个窗口
+        self.worldSize = (max(GAME_SIZE[0], self.right + GAME_SIZE[0] - GRID_RIGHT_X), max(GAME_SIZE[1], self.down + GAME_SIZE[1] - GRID_DOWN_Y))
+        # 天降阳光落地纵坐标的范围，上下边界与网格的顶部和底部保持与默认草坪相同的距离
+        self.sunFallY = (self.top + GAME_SIZE[1] - 450 - GRID_TOP_Y, self.down + GAME_SIZE[1] - 60 - GRID_DOWN_Y)
+        self.frozen = True  # 创建后不能再修改，所有对象共享同一份几何数据
+
+    def __setattr__(self, name, value):
+        if getattr(self, "frozen", False):
+            raise AttributeError(f"草坪的几何数据是只读的，不能修改 {name}")
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def FromLevel(cls, level):
+        """
+        根据关卡定义创建草坪
+
+        :param level: 关卡定义，见 settings["level"]，其中 "board" 给出行列数
+        :return: Board 实例
+        """
+        board = level.get("board", {})
+        return cls(board.get("columns", GRID_COUNT[0]), board.get("rows", GRID_COUNT[1]))
+
+    def NewMap(self):
+        """
+        创建空的植物地图
+
+        :return: PlantGrid，用 Get(列, 行) / Set(列, 行, 植物编号) 读写，0 表示该位置没有植物
+        """
+        return PlantGrid(self.columns, self.rows)
+
+    def NewLaneList(self, value = 0):
+        """
+        创建按行保存数据的列表，索引 0 为占位
+
+        :param value: 每行的初始值
+        :return: 长度为 rows + 1 的列表
+        """
+        return [value] * (self.rows + 1)
+
+    def InGarden(self, pos):
+        """
+        检查坐标是否在花园范围内
+
+        :param pos: 屏幕坐标 (x, y)
+        :return: 如果在花园范围内返回True,否则返回False
+        """
+        return pos[0] > self.left and pos[0] < self.right and pos[1] > self.top and pos[1] < self.down
+
+    def CellColumn(self, x):
+        """
+        横坐标所在的列（网格的左边线属于该格）
+
+        :param x: 屏幕横坐标
+        :return: 列号，草坪左边为 0 或负数
+        """
+        if x.__class__ is int and 0 <= x < len(self.columnAt):
+            return self.columnAt[x]
+        return math.floor((x - self.left) / self.cellSize[0]) + 1
+
+    def CellRow(self, y):
+        """
+        纵坐标所在的行（网格的上边线属于该格）
+
+        :param y: 屏幕纵坐标
+        :return: 行号，草坪上方为 0 或负数
+        """
+        if y.__class__ is int and 0 <= y < len(self.rowAt):
+            return self.rowAt[y]
+        return math.floor((y - self.top) / self.cellSize[1]) + 1
+
+    def CellAt(self, xy):
+        """
+        坐标所在的网格，网格左上角的坐标对应该网格本身（GetGridPos 的逆运算）
+
+        :param xy: 屏幕坐标 (x, y)
+        :return: 网格坐标 [col, row]
+        """
+        return [self.CellColumn(xy[0]), self.CellRow(xy[1])]
+
+    def CellColumns(self, xs):
+        """
+        批量计算横坐标所在的列，与 CellColumn 一致
+
+        :param xs: 横坐标序列或数组
+        :return: NumPy 整数数组
+        """
+        import numpy  # 只有批量计算时才导入NumPy
+        return numpy.floor_divide(numpy.asarray(xs) - self.left, self.cellSize[0]).astype(numpy.int64) + 1
+
+    def CellRows(self, ys):
+        """
+        批量计算纵坐标所在的行，与 CellRow 一致
+
+        :param ys: 纵坐标序列或数组
+        :return: NumPy 整数数组
+        """
+        import numpy  # 只有批量计算时才导入NumPy
+        return numpy.floor_divide(numpy.asarray(ys) - self.top, self.cellSize[1]).astype(numpy.int64) + 1
+
+    def Column(self, x):
+        """
+        鼠标和僵尸使用的列号：网格的左边线属于左边一格，即 ceil((x - left) / 宽度)
+
+        :param x: 屏幕横坐标
+        :return: 列号（不限制范围）
+        """
+        if x.__class__ is int and 0 < x <= len(self.columnAt):
+            return self.columnAt[x - 1]
+        return math.ceil((x - self.left) / self.cellSize[0])
+
+    def Row(self, y):
+        """
+        鼠标和僵尸使用的行号：网格的上边线属于上边一格，即 ceil((y - top) / 高度)
+
+        :param y: 屏幕纵坐标
+        :return: 行号（不限制范围）
+        """
+        if y.__class__ is int and 0 < y <= len(self.rowAt):
+            return self.rowAt[y - 1]
+        return math.ceil((y - self.top) / self.cellSize[1])
+
+    def GetGrid(self, xy):
+        """
+        将屏幕坐标转换为网格坐标（不限制范围），规则见 Column 和 Row
+
+        :param xy: 屏幕坐标 (x, y)
+        :return: 网格坐标 [col, row]
+        """
+        return [self.Column(xy[0]), self.Row(xy[1])]
+
+    def ClampGrid(self, grid):
+        """
+        将网格坐标限制在草坪范围内
+
+        :param grid: 网格坐标 [col, row]
+        :return: 限制后的网格坐标 [col, row]
+        """
+        return [max(1, min(grid[0], self.columns)), max(1, min(grid[1], self.rows))]
+
+    def IsValidGrid(self, grid):
+        """
+        检查网格坐标是否在草坪范围内
+
+        :param grid: 网格坐标 [col, row]
+        :return: 在范围内返回True,否则返回False
+        """
+        return 1 <= grid[0] <= self.columns and 1 <= grid[1] <= self.rows
+
+    def GetGridPos(self, xy):
+        """
+        获取指定坐标对应的网格位置
+
+        :param xy: 屏幕坐标 (x, y)
+        :return: {"if": 是否在草坪内, "pos": 网格左上角坐标}
+        """
+        if not self.InGarden(xy):
+            return {"if": False, "pos": []}
+        grid = self.GetGrid(xy)
+        if grid[0] > self.columns or grid[1] > self.rows:
+            return {"if": False, "pos": []}
+        return {"if": True, "pos": [self.gridX[grid[0]], self.gridY[grid[1]]]}
+
+    def CellCenter(self, column, row):
+        """
+        网格中心的坐标（GetGrid 的逆运算）
+
+        :param column: 列号
+        :param row: 行号
+        :return: 屏幕坐标 (x, y)
+        """
+        return (self.gridX[column] + self.cellSize[0] // 2, self.gridY[row] + self.cellSize[1] // 2)
+
+    def IsInRightVirtualGrid(self, xy):
+        """
+        检查坐标是否在右侧虚拟网格范围内（草坪最后一列右边的一格）
+
+        :param xy: 屏幕坐标 (x, y)
+        :return: 如果在右侧虚拟网格范围内返回True,否则返回False
+        """
+        return self.Column(xy[0]) == self.columns + 2 and 1 <= self.Row(xy[1]) <= self.rows
+
+DEFAULT_BOARD = Board()  # 默认的 9x5 草坪
@@ -0,0 +1,305 @@
+import os  # 导入os库
+import sys  # 导入sys库
+import json  # 导入json库
+import time  # 导入time库
+import argparse  # 导入命令行参数库
+import tracemalloc  # 导入内存跟踪库
+import multiprocessing  # 导入多进程库
+from data.src.Simulation import *  # 导入无界面模拟
+
+# 机器人玩家：在无界面模拟中自动选卡、收集阳光和种植，不需要有人操作。
+# GreedyBot 用简单的启发式规则决定种什么、种在哪里；RolloutBot 对几个候选操作分别分支模拟（Simulation.Fork）向前推演，选结果最好的一个。
+# 夜间测试（在项目根目录）：python -m data.src.Bot -n 1000 -o data/bot/report.json --baseline data/bot/baseline.json --min-win-rate 0.9
+# 报告包括胜率、每帧耗时和内存，胜率低于下限或与基准相比变差超过容差时返回非零退出码。
+# 两种机器人在第 1 关的胜率都应为 1.0。
+
+CARD_PRIORITY = ("sunflower", "peashooter", "nut", "potato_mine", "cherry_bomb", "squash", "jalapeno", "chomper")  # 选卡顺序
+BOT_INTERVAL = 15  # GreedyBot 每隔多少帧做一次决定
+ROLLOUT_INTERVAL = 60  # RolloutBot 每隔多少帧做一次决定
+ROLLOUT_HORIZON = 300  # 推演的帧数
+ROLLOUT_WIDTH = 3  # 推演的候选操作个数（另外总是推演“不操作”）
+SUNFLOWER_COLUMNS = 2  # 向日葵种在最左边几列
+DEFENSE_COLUMNS = (2, 3, 4, 5)  # 豌豆射手可以种的列
+DANGER_CELLS = 3  # 僵尸走到离左边界几格以内时使用一次性植物
+REPORT_FIELDS = ("policy", "games", "winRate", "survivalMean", "zombiesKilledMean", "tickMsMean", "tickMsP99", "tickMsMax",
+                 "peakMemoryKB", "gamesPerSecond", "seconds")
+REGRESSION_FIELDS = {"winRate": -1, "tickMsMean": 1, "tickMsP99": 1, "peakMemoryKB": 1}  # 与基准比较的字段：1 表示越大越差，-1 表示越小越差
+
+def PickCards(count = None):
+    """
+    选卡：按 CARD_PRIORITY 选择前 count 种植物
+
+    :param count: 卡片数量，默认全部
+    :return: 植物编号列表
+    """
+    return [settings["plant_name"].index(name) for name in CARD_PRIORITY[:count]]
+
+def _PlantType(name):
+    return settings["plant_name"].index(name)
+
+class GreedyBot:
+    def __init__(self, cards = None, interval = BOT_INTERVAL):
+        """
+        启发式机器人，可以直接作为 Simulation.Run 的 strategy 使用
+
+        :param cards: 可以使用的植物编号，默认 PickCards()
+        :param interval: 每隔多少帧做一次决定
+        """
+        self.cards = list(cards) if cards is not None else PickCards()
+        self.interval = interval
+
+    def __call__(self, simulation):
+        if simulation.tick % self.interval:
+            return
+        self.CollectSun(simulation)
+        action = self.Choose(simulation)
+        if action is not None:
+            self.Apply(simulation, action)
+
+    def CollectSun(self, simulation):
+        """
+        收集场上所有的阳光
+        """
+        for sun in list(simulation.suns):
+            simulation.CollectSun(sun.id)
+
+    def Apply(self, simulation, action):
+        """
+        执行操作 (植物编号, 列, 行)
+        """
+        return simulation.Place(*action)
+
+    def Choose(self, simulation):
+        """
+        选择优先级最高的操作
+
+        :return: (植物编号, 列, 行)，没有可做的操作时返回 None
+        """
+        candidates = self.Candidates(simulation)
+        return candidates[0] if candidates else None
+
+    def Has(self, name):
+        return _PlantType(name) in self.cards
+
+    def Threats(self, simulation):
+        """
+        统计每行的威胁
+
+        :return: {行号: (僵尸生命值之和, 最左边僵尸所在的列, 最左边僵尸前面是否已经有没爆炸的土豆地雷)}，没有僵尸的行不包括在内
+        """
+        board = simulation.board
+        threats = {}
+        for row in range(1, board.rows + 1):
+            lane = simulation.lanes[row]
+            if lane.zombies:
+                nearest = min(zombie.x for zombie in lane.zombies)
+                mined = any(PLANT_SPEC[plant.type]["name"] == "potato_mine" and not plant.state and plant.x < nearest for plant in lane.plants)
+                threats[row] = (sum(zombie.hp for zombie in lane.zombies), board.CellColumn(nearest), mined)
+        return threats
+
+    def Candidates(self, simulation):
+        """
+        按优先级列出当前买得起、能种下的操作：
+        在最左边的僵尸前面埋土豆地雷 > 危急时的其他一次性植物 > 缺少防守的行补豌豆射手 > 向日葵 > 继续加豌豆射手。
+        坚果被啃食的速度比豌豆射手还快，不再种坚果
+
+        :return: [(植物编号, 列, 行), ...]
+        """
+        board = simulation.board
+        plantMap = simulation.map
+        threats = self.Threats(simulation)
+        candidates = []
+        def Add(name, column, row):
+            if self.Has(name) and 1 <= column <= board.columns and simulation.CanPlace(_PlantType(name), column, row):
+                candidates.append((_PlantType(name), column, row))
+
+        peashooter = _PlantType("peashooter")
+        defense = {row: plantMap.LaneCount(peashooter, row) for row in range(1, board.rows + 1)}
+        zombieHp = settings["common_zombie"]["hp"]
+        for row, (hp, column, mined) in sorted(threats.items(), key = lambda item: item[1][1]):  # 僵尸越靠左越危险
+            if not mined:  # 土豆地雷种在僵尸前面离它最近的空网格，僵尸走到时炸掉附近所有的僵尸
+                for mineColumn in range(min(column, board.columns + 1) - 1, 0, -1):
+                    if plantMap.IsFree(mineColumn, row):
+                        Add("potato_mine", mineColumn, row)
+                        break
+            if column <= DANGER_CELLS + 1 and not mined:
+                Add("cherry_bomb", column, row)
+                Add("squash", column - 1, row)
+                Add("jalapeno", 1, row)
+        for row, (hp, column, mined) in sorted(threats.items(), key = lambda item: -item[1][0] / (1 + defense[item[0]])):
+            if defense[row] * zombieHp * 2 < hp or defense[row] == 0:
+                for defenseColumn in DEFENSE_COLUMNS:
+                    Add("peashooter", defenseColumn, row)
+        sunflower = _PlantType("sunflower")
+        for column in range(1, SUNFLOWER_COLUMNS + 1):
+            for row in range(1, board.rows + 1):
+                if plantMap.Get(column, row) != sunflower:
+                    Add("sunflower", column, row)
+        for defenseColumn in DEFENSE_COLUMNS:
+            for row in sorted(range(1, board.rows + 1), key = lambda row: defense[row]):
+                Add("peashooter", defenseColumn, row)
+        return candidates
+
+def Evaluate(simulation):
+    """
+    推演结束后的局面评分：输掉的局面最差，其次看消灭的僵尸、僵尸离家的距离、金币和植物数量
+    """
+    if simulation.gameover:
+        return -1e9 + simulation.tick
+    board = simulation.board
+    score = simulation.stats["zombiesKilled"] * 100 + simulation.gold * 0.5
+    for row in range(1, board.rows + 1):
+        for zombie in simulation.lanes[row].zombies:
+            score -= zombie.hp * (board.zombieFirstX - zombie.x) / (board.zombieFirstX - board.left)
+        score += bin(simulation.map.laneMasks[row]).count("1") * 10
+    return score
+
+class RolloutBot(GreedyBot):
+    def __init__(self, cards = None, interval = ROLLOUT_INTERVAL, horizon = ROLLOUT_HORIZON, width = ROLLOUT_WIDTH):
+        """
+        推演机器人：对 GreedyBot 给出的前 width 个候选操作和“不操作”分别分支模拟，
+        用 GreedyBot 继续玩 horizon 帧后评分，选择评分最高的操作
+
+        :param horizon: 推演的帧数
+        :param width: 推演的候选操作个数
+        """
+        super().__init__(cards, interval)
+        self.horizon = horizon
+        self.width = width
+        self.rolloutBot = GreedyBot(self.cards)  # 推演中使用的策略
+        self.rollouts = 0  # 已经推演的次数
+
+    def Choose(self, simulation):
+        candidates = self.Candidates(simulation)[:self.width]
+        if not candidates:
+            return None
+        best = None
+        for action in candidates + [None]:
+            fork = simulation.Fork()
+            if action is not None:
+                self.Apply(fork, action)
+            fork.Run(self.horizon, self.rolloutBot)
+            self.rollouts += 1
+            score = Evaluate(fork)
+            if best is None or score > best[0]:
+                best = (score, action)
+        return best[1]
+
+POLICIES = {"greedy": GreedyBot, "rollout": RolloutBot}
+
+def PlayGame(task):
+    """
+    机器人玩一局完整的游戏（在工作进程中执行），逐帧计时
+
+    :param task: (策略名称, 关卡, 种子, 初始金币, 最多帧数, 是否跟踪内存)
+    :return: 对局结果，另外包括每帧耗时（毫秒）的统计和内存峰值
+    """
+    policy, level, seed, gold, ticks, traceMemory = task
+    if traceMemory:
+        tracemalloc.start()
+    simulation = Simulation(level, seed, gold)
+    bot = POLICIES[policy]()
+    tickTimes = []
+    for _ in range(ticks):
+        if simulation.gameover:
+            break
+        bot(simulation)  # 机器人思考的时间不计入帧耗时
+        start = time.perf_counter()
+        simulation.Step()
+        tickTimes.append(time.perf_counter() - start)
+    result = simulation.Result()
+    tickTimes.sort()
+    result["tickMsMean"] = sum(tickTimes) / max(1, len(tickTimes)) * 1000
+    result["tickMsP99"] = tickTimes[int(len(tickTimes) * 0.99)] * 1000 if tickTimes else 0
+    result["tickMsMax"] = tickTimes[-1] * 1000 if tickTimes else 0
+    if traceMemory:
+        result["peakMemoryKB"] = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return result
+
+def Summarize(policy, results, seconds):
+    """
+    汇总所有对局
+
+    :return: 报告字典
+    """
+    count = len(results)
+    mean = lambda name: round(sum(result[name] for result in results) / count, 4)
+    report = {
+        "policy": policy,
+        "games": count,
+        "winRate": round(sum(not result["gameover"] for result in results) / count, 4),
+        "survivalMean": mean("tick"),
+        "zombiesKilledMean": mean("zombiesKilled"),
+        "tickMsMean": mean("tickMsMean"),
+        "tickMsP99": round(sorted(result["tickMsP99"] for result in results)[count // 2], 4),  # 各局 p99 的中位数
+        "tickMsMax": round(max(result["tickMsMax"] for result in results), 4),
+        "peakMemoryKB": round(max(result["peakMemoryKB"] for result in results), 1) if "peakMemoryKB" in results[0] else None,
+        "gamesPerSecond": round(count / seconds, 2),
+        "seconds": round(seconds, 2),
+    }
+    return report
+
+def Regressions(report, baseline, tolerance):
+    """
+    与基准报告比较
+
+    :param tolerance: 允许变差的比例
+    :return: 变差超过容差的字段说明列表
+    """
+    problems = []
+    for name, direction in REGRESSION_FIELDS.items():
+        old, new = baseline.get(name), report.get(name)
+        if old is None or new is None:
+            continue
+        if direction > 0 and new > old * (1 + tolerance):
+            problems.append(f"{name}: {old} -> {new}")
+        elif direction < 0 and new < old * (1 - tolerance):
+            problems.append(f"{name}: {old} -> {new}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description = "机器人在无界面模拟中批量玩完整对局，报告胜率、每帧耗时和内存")
+    parser.add_argument("-n", "--games", type = int, default = 100, help = "对局数")
+    parser.add_argument("--policy", choices = sorted(POLICIES), default = "greedy", help = "机器人策略")
+    parser.add_argument("--level", default = str(DEFAULT_LEVEL), help = "关卡")
+    parser.add_argument("--seed", type = int, default = 0, help = "第一局的种子，之后依次加一")
+    parser.add_argument("--gold", type = int, default = 200, help = "初始金币")
+    parser.add_argument("-t", "--ticks", type = int, default = None, help = "每局最多的帧数，默认为关卡长度")
+    parser.add_argument("-p", "--processes", type = int, default = None, help = "进程数，默认使用全部CPU核心")
+    parser.add_argument("--memory", action = "store_true", help = "用 tracemalloc 记录每局的内存峰值（会让模拟变慢）")
+    parser.add_argument("-o", "--output", default = None, help = "报告输出路径（JSON）")
+    parser.add_argument("--baseline", default = None, help = "基准报告（JSON），变差超过容差时返回退出码 1")
+    parser.add_argument("--tolerance", type = float, default = 0.2, help = "与基准比较时允许变差的比例")
+    parser.add_argument("--min-win-rate", type = float, default = None, help = "胜率下限，低于下限时返回退出码 1")
+    args = parser.parse_args()
+    if args.baseline and not os.path.exists(args.baseline):
+        parser.error(f"基准报告 {args.baseline} 不存在")  # 路径写错时不能悄悄跳过比较
+
+    level = int(args.level) if args.level.isdigit() else args.level
+    ticks = args.ticks if args.ticks is not None else settings["level"][level]["length"]
+    tasks = [(args.policy, level, seed, args.gold, ticks, args.memory) for seed in range(args.seed, args.seed + args.games)]
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.processes) as pool:
+        results = list(pool.imap_unordered(PlayGame, tasks))
+    report = Summarize(args.policy, results, time.perf_counter() - start)
+    for name in REPORT_FIELDS:
+        print(f"{name:<18} {report[name]}")
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+        with open(args.output, "w", encoding = "utf-8") as file:
+            json.dump(report, file, ensure_ascii = False, indent = 4)
+    problems = []
+    if args.min_win_rate is not None and report["winRate"] < args.min_win_rate:
+        problems.append(f"winRate: {report['winRate']} < {args.min_win_rate}")
+    if args.baseline:
+        with open(args.baseline, "r", encoding = "utf-8") as file:
+            problems.extend(Regressions(report, json.load(file), args.tolerance))
+    if problems:
+        print("检查未通过：\n  " + "\n  ".join(problems), file = sys.stderr)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,7 @@ class Card(Object):  # 定义Card类，继承自object类
         self.number = PosNumber
         self.number = settings['plant_name'].index(self.name)
         self.READY = False
+        self.affordable = True  # 金币是否足够，由 Pvz.OnGoldChanged 在金币变化时更新
 
     def run(self):  # 运行函数
         self.update()
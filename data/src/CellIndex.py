@@ -0,0 +1,68 @@
+class CellIndex:
+    def __init__(self):
+        """
+        按网格保存实体的索引：实体只在进入新的网格时（收到网格变化的通知）移动，
+        查询某一格或某一行时不需要遍历所有实体
+        """
+        self.cells = {}  # (列, 行) -> {实体: None}，用字典保持加入的顺序
+        self.rows = {}  # 行 -> {实体: None}，与 cells 同时维护，查询一行时不需要遍历所有网格
+
+    def Move(self, entity, old, new):
+        """
+        网格变化的通知：把实体从旧的网格移到新的网格
+
+        :param entity: 实体
+        :param old: 旧的网格坐标 [col, row]，为 None 表示刚加入
+        :param new: 新的网格坐标 [col, row]，为 None 表示已经移除
+        """
+        if old is not None:
+            key = (old[0], old[1])
+            cell = self.cells.get(key)
+            if cell is not None:
+                cell.pop(entity, None)
+                if not cell:
+                    del self.cells[key]
+            if new is None or new[1] != old[1]:  # 离开这一行
+                row = self.rows.get(old[1])
+                if row is not None:
+                    row.pop(entity, None)
+                    if not row:
+                        del self.rows[old[1]]
+        if new is not None:
+            self.cells.setdefault((new[0], new[1]), {})[entity] = None
+            if old is None or new[1] != old[1]:  # 进入这一行
+                self.rows.setdefault(new[1], {})[entity] = None
+
+    def At(self, column, row):
+        """
+        某一格内的实体
+
+        :return: 实体列表
+        """
+        cell = self.cells.get((column, row))
+        return list(cell) if cell else []
+
+    def Area(self, columns, rows):
+        """
+        若干列和若干行交叉的网格内的实体
+
+        :param columns: 列号序列
+        :param rows: 行号序列
+        :return: 实体列表
+        """
+        return [entity for column in columns for row in rows for entity in self.cells.get((column, row), ())]
+
+    def InRow(self, row):
+        """
+        某一行内的实体
+
+        :return: 实体列表
+        """
+        cells = self.rows.get(row)
+        return list(cells) if cells else []
+
+    def Count(self):
+        """
+        索引中的实体数量
+        """
+        return sum(len(cell) for cell in self.cells.values())
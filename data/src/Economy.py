@@ -0,0 +1,61 @@
+class Economy:
+    def __init__(self, gold = 200):
+        """
+        金币模型：金币只通过这里修改，每次数值变化时通知所有订阅者。
+        界面（卡片是否可用、金币文字）只在收到通知时重新计算，金币不变的帧不需要做任何检查
+
+        :param gold: 初始金币
+        """
+        self.gold = gold  # 当前金币
+        self.listeners = []  # 订阅者列表，每个订阅者是 callback(gold)
+
+    def Subscribe(self, callback):
+        """
+        订阅金币变化，订阅时立即用当前金币调用一次，使订阅者的状态与金币一致
+
+        :param callback: 金币变化时调用的函数，参数为新的金币数量
+        :return: callback，便于之后取消订阅
+        """
+        self.listeners.append(callback)
+        callback(self.gold)
+        return callback
+
+    def Unsubscribe(self, callback):
+        """
+        取消订阅，没有订阅过时忽略
+        """
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def Set(self, gold):
+        """
+        设置金币，数值变化时通知订阅者
+        """
+        if gold == self.gold:
+            return
+        self.gold = gold
+        for callback in list(self.listeners):
+            callback(gold)
+
+    def Add(self, amount):
+        """
+        增加金币（例如收集阳光）
+        """
+        self.Set(self.gold + amount)
+
+    def CanAfford(self, cost):
+        """
+        检查金币是否足够支付 cost
+        """
+        return self.gold >= cost
+
+    def Spend(self, cost):
+        """
+        支付 cost 金币
+
+        :return: 金币足够并已扣除返回 True，否则返回 False 且不改变金币
+        """
+        if self.gold < cost:
+            return False
+        self.Set(self.gold - cost)
+        return True
@@ -0,0 +1,224 @@
+import numpy as np  # 导入NumPy，需要 pip install numpy
+from data.src.Simulation import *  # 导入无界面模拟
+
+# 训练用的环境接口：与 Gym 相同的 reset(seed) / step(action) -> (观察, 奖励, 结束, 信息)，基于无界面模拟，不涉及 pygame 和渲染。
+# 观察是 float32 张量 (通道, 行, 列+1)，最后一列是草坪右侧（僵尸出现的区域）：
+#   通道 0 ~ 植物种类数-1：每个网格是否种着对应编号的植物（Game.map 的独热编码）
+#   僵尸生命值通道：每个网格中僵尸的生命值之和（以普通僵尸的生命值为单位）
+#   僵尸数量通道：每个网格中的僵尸数量
+#   金币通道：金币 / ENV_GOLD_SCALE，整个平面相同
+#   卡片通道：每种植物当前是否买得起，整个平面相同
+#   进度通道：帧数 / 一局最多的帧数，整个平面相同
+# 动作是整数：0 不操作；之后每种植物、每个网格一个种植动作；最后每个网格一个铲除动作。
+
+ENV_FRAME_SKIP = 30  # 每个动作之后推进的帧数
+ENV_GOLD_SCALE = 1000.0  # 观察中金币的缩放
+ENV_REWARD_KILL = 1.0  # 每消灭一只僵尸的奖励
+ENV_REWARD_LOSS = -10.0  # 僵尸进家的奖励
+
+class PvzEnv:
+    def __init__(self, level = DEFAULT_LEVEL, gold = 200, frameSkip = ENV_FRAME_SKIP, maxTicks = None, autoCollectSun = True):
+        """
+        单局游戏的训练环境
+
+        :param level: 关卡编号或关卡定义字典
+        :param gold: 初始金币
+        :param frameSkip: 每个动作之后推进的帧数
+        :param maxTicks: 一局最多的帧数，默认为关卡长度，达到后结束
+        :param autoCollectSun: 是否自动收集阳光（否则阳光会被浪费，动作中没有收集阳光）
+        """
+        self.level = level if isinstance(level, dict) else settings["level"][level]
+        self.gold = gold
+        self.frameSkip = frameSkip
+        self.maxTicks = maxTicks if maxTicks is not None else self.level["length"]
+        self.autoCollectSun = autoCollectSun
+        self.plantTypes = len(settings["plant_name"]) - 1  # 植物种类数（编号从 1 开始）
+        self.rows = self.level["board"]["rows"]
+        self.columns = self.level["board"]["columns"]
+        self.width = self.columns + 1  # 多出的一列表示草坪右侧
+        self.channels = self.plantTypes * 2 + 4
+        self.observationShape = (self.channels, self.rows, self.width)
+        self.actionCount = 1 + self.plantTypes * self.rows * self.columns + self.rows * self.columns
+        self.plantIds = np.arange(1, self.plantTypes + 1, dtype = np.uint8).reshape(-1, 1, 1)
+        self.plantGold = np.array([PLANT_SPEC[plantType]["gold"] for plantType in range(1, self.plantTypes + 1)])
+        self.zombieHpScale = float(settings["common_zombie"]["hp"])
+        self.simulation = None
+
+    def reset(self, seed = 0, out = None):
+        """
+        开始新的一局
+
+        :param seed: 随机种子，相同种子得到相同的僵尸时间线
+        :param out: 可选的观察数组，直接写入其中
+        :return: 观察
+        """
+        self.simulation = Simulation(self.level, seed, self.gold, self.autoCollectSun)
+        return self.Observe(out)
+
+    def DecodeAction(self, action):
+        """
+        把整数动作解析为 ("none",)、("place", 植物编号, 列, 行) 或 ("shovel", 列, 行)
+        """
+        action = int(action)
+        cells = self.rows * self.columns
+        if action <= 0 or action >= self.actionCount:
+            return ("none",)
+        action -= 1
+        if action < self.plantTypes * cells:
+            plantType, cell = divmod(action, cells)
+            row, column = divmod(cell, self.columns)
+            return ("place", plantType + 1, column + 1, row + 1)
+        row, column = divmod(action - self.plantTypes * cells, self.columns)
+        return ("shovel", column + 1, row + 1)
+
+    def EncodeAction(self, kind, *args):
+        """
+        DecodeAction 的逆运算：EncodeAction("place", 植物编号, 列, 行)、EncodeAction("shovel", 列, 行)
+        """
+        cells = self.rows * self.columns
+        if kind == "place":
+            plantType, column, row = args
+            return 1 + (plantType - 1) * cells + (row - 1) * self.columns + column - 1
+        if kind == "shovel":
+            column, row = args
+            return 1 + self.plantTypes * cells + (row - 1) * self.columns + column - 1
+        return 0
+
+    def ActionMask(self):
+        """
+        当前可以执行的动作
+
+        :return: bool 数组，长度为 actionCount
+        """
+        simulation = self.simulation
+        grid = simulation.map.AsArray()
+        mask = np.zeros(self.actionCount, dtype = bool)
+        mask[0] = True
+        cells = self.rows * self.columns
+        empty = (grid == 0).ravel()
+        for plantType in range(1, self.plantTypes + 1):
+            if simulation.gold >= self.plantGold[plantType - 1]:
+                start = 1 + (plantType - 1) * cells
+                mask[start:start + cells] = empty
+        shovel = np.isin(grid, [settings["plant_name"].index(name) for name in SHOVEL_PLANT]).ravel()
+        mask[1 + self.plantTypes * cells:] = shovel
+        return mask
+
+    def step(self, action, out = None):
+        """
+        执行一个动作并推进 frameSkip 帧
+
+        :param action: 整数动作
+        :param out: 可选的观察数组，直接写入其中
+        :return: (观察, 奖励, 是否结束, 信息字典)
+        """
+        simulation = self.simulation
+        decoded = self.DecodeAction(action)
+        valid = True
+        if decoded[0] == "place":
+            valid = simulation.Place(*decoded[1:])
+        elif decoded[0] == "shovel":
+            valid = simulation.Shovel(*decoded[1:])
+        killed = simulation.stats["zombiesKilled"]
+        for _ in range(self.frameSkip):
+            if simulation.gameover or simulation.tick >= self.maxTicks:
+                break
+            simulation.Step()
+        reward = (simulation.stats["zombiesKilled"] - killed) * ENV_REWARD_KILL
+        if simulation.gameover:
+            reward += ENV_REWARD_LOSS
+        done = simulation.gameover or simulation.tick >= self.maxTicks
+        info = {"tick": simulation.tick, "gold": simulation.gold, "valid": valid, "gameover": simulation.gameover}
+        return self.Observe(out), reward, done, info
+
+    def Observe(self, out = None):
+        """
+        根据模拟的当前状态生成观察
+
+        :param out: 可选的观察数组，形状为 observationShape
+        :return: 观察
+        """
+        simulation = self.simulation
+        board = simulation.board
+        obs = np.zeros(self.observationShape, dtype = np.float32) if out is None else out
+        obs.fill(0)
+        plants = self.plantTypes
+        grid = simulation.map.AsArray()
+        obs[:plants, :, :self.columns] = grid == self.plantIds
+        xs = []
+        bases = []
+        hps = []
+        for row in range(1, self.rows + 1):
+            lane = simulation.lanes[row]
+            base = (row - 1) * self.width
+            for zombie in lane.zombies:
+                xs.append(zombie.x)
+                bases.append(base)
+                hps.append(zombie.hp)
+        if xs:
+            cells = np.asarray(bases) + np.clip(board.CellColumns(xs) - 1, 0, self.columns)  # 一次换算所有僵尸所在的列
+            size = self.rows * self.width
+            obs[plants] = np.bincount(cells, hps, size).reshape(self.rows, self.width) / self.zombieHpScale
+            obs[plants + 1] = np.bincount(cells, None, size).reshape(self.rows, self.width)
+        obs[plants + 2] = simulation.gold / ENV_GOLD_SCALE
+        obs[plants + 3:plants * 2 + 3] = (simulation.gold >= self.plantGold).reshape(-1, 1, 1)
+        obs[plants * 2 + 3] = simulation.tick / self.maxTicks
+        return obs
+
+class VectorEnv:
+    def __init__(self, count, level = DEFAULT_LEVEL, **kwargs):
+        """
+        同时运行 count 局互不相关的游戏，一次调用推进全部
+
+        :param count: 游戏局数
+        :param kwargs: 传给 PvzEnv 的参数
+        """
+        self.envs = [PvzEnv(level, **kwargs) for _ in range(count)]
+        first = self.envs[0]
+        self.observationShape = first.observationShape
+        self.actionCount = first.actionCount
+        self.observations = np.zeros((count,) + first.observationShape, dtype = np.float32)
+        self.rewards = np.zeros(count, dtype = np.float32)
+        self.dones = np.zeros(count, dtype = bool)
+        self.seeds = [0] * count
+        self.episodes = [0] * count  # 每局已经重新开始的次数
+
+    def reset(self, seed = 0):
+        """
+        重新开始所有游戏，第 i 局使用种子 seed + i
+
+        :return: 观察，形状为 (局数,) + observationShape
+        """
+        for index, env in enumerate(self.envs):
+            self.seeds[index] = seed + index
+            self.episodes[index] = 0
+            env.reset(seed + index, self.observations[index])
+        return self.observations
+
+    def step(self, actions):
+        """
+        每局执行一个动作；结束的游戏自动用新的种子重新开始，返回的是新一局的观察
+
+        :param actions: 每局的整数动作
+        :return: (观察, 奖励, 是否结束, 信息列表)，返回的数组在下一次调用时会被覆盖
+        """
+        infos = []
+        count = len(self.envs)
+        for index, env in enumerate(self.envs):
+            obs, reward, done, info = env.step(actions[index], self.observations[index])
+            self.rewards[index] = reward
+            self.dones[index] = done
+            if done:
+                info["finalObservation"] = obs.copy()
+                info["result"] = env.simulation.Result()
+                self.episodes[index] += 1
+                self.seeds[index] += count  # 各局使用的种子互不重复
+                env.reset(self.seeds[index], self.observations[index])
+            infos.append(info)
+        return self.observations, self.rewards, self.dones, infos
+
+    def ActionMasks(self):
+        """
+        每局当前可以执行的动作，形状为 (局数, actionCount)
+        """
+        return np.stack([env.ActionMask() for env in self.envs])
@@ -2,24 +2,28 @@ from data.src._BasicImports import *  # 导入所有需要的模块和常量
 from data.src._GameObjectImports import *  # 导入所有需要的类和函数
 
 class Game:
-    def __init__(self, game): 
+    def __init__(self, game, level = DEFAULT_LEVEL, seed = None, sound = True): 
         """
         初始化游戏对象
 
         :param game: 游戏主对象，包含游戏的基本信息和状态
+        :param level: 关卡编号，对应 settings["level"] 中的关卡定义
+        :param seed: 僵尸出生时间线的随机种子，为 None 时随机生成
+        :param sound: 是否加载声音，为 False 时所有声音都是不播放的 SilentSound（无窗口运行时使用）
         """
-        # 初始化地图，使用二维列表表示，0 表示该位置没有植物
-        self.map = [
-            [],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        ]
+        # 根据关卡定义创建草坪，草坪决定地图以及所有按行保存的数据的大小
+        self.board = Board.FromLevel(settings["level"][level])
+        # 初始化植物地图（PlantGrid），0 表示该位置没有植物
+        self.map = self.board.NewMap()
+        VIEWPORT.SetWorld(*self.board.worldSize)  # 摄像机在这个草坪的世界范围内滚动
         
-        # 初始化玩家拥有的金币数量
-        self.gold = 200
+        # 初始化玩家拥有的金币数量，金币变化时通知订阅者（卡片是否可用、金币文字）
+        self.economy = Economy(200)
+
+        # 僵尸只在进入新的网格时发出通知，按网格保存僵尸的索引订阅这个通知，碰撞检测从索引中查询僵尸
+        self.cellListeners = []  # 订阅者列表，每个订阅者是 callback(zombie, old, new)
+        self.zombieCells = CellIndex()  # 僵尸的网格索引
+        self.SubscribeCells(self.zombieCells.Move)
         
         # 初始化游戏相关对象
         self.game = game
@@ -28,35 +32,38 @@ class Game:
         # 初始化游戏道具和状态变量
         self.shovel = Shovel(self.screen)  # 初始化铲子对象
         self.shovelFrame = ShovelFrame(self.screen)  # 初始化铲子框对象
-        self.zombieTime = 0  # 僵尸生成计时器
+        self.tick = 0  # 游戏正式开始后的帧数
+        self.level = level  # 关卡编号
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)  # 僵尸出生时间线的随机种子
+        self.rng = random.Random(self.seed ^ 0x5EED)  # 天降阳光使用的随机数生成器，与无界面模拟一致，便于回放
+        self.scheduler = WaveScheduler(settings["level"][level], self.seed, self.board.rows)  # 僵尸出生调度器
         self.sunlightTime = 0  # 阳光生成计时器
         self.zombieMusicPlay = False  # 标记僵尸啃食音乐是否正在播放
+        self.sound = sound  # 是否加载声音
 
         # 加载阳光音乐并设置音量
-        self.sunMusic = pygame.mixer.Sound(settings["game"]["bgm"]["sunlight"])
-        self.sunMusic.set_volume(settings["game"]["bgm"]["sunVolume"])  # 设置阳光音乐音量
+        self.sunMusic = self.LoadSound(settings["game"]["bgm"]["sunlight"], settings["game"]["bgm"]["sunVolume"])
 
         # 加载种植音乐并设置音量
-        self.plantMusic = pygame.mixer.Sound(settings["game"]["bgm"]["plant"])
-        self.plantMusic.set_volume(settings["game"]["bgm"]["plantVolume"])  # 设置种植音乐音量
+        self.plantMusic = self.LoadSound(settings["game"]["bgm"]["plant"], settings["game"]["bgm"]["plantVolume"])
 
         # 加载僵尸啃食音乐并设置音量
-        self.zombieMusic = pygame.mixer.Sound(settings["game"]["bgm"]["zombieEat"])
-        self.zombieMusic.set_volume(settings["game"]["bgm"]["zombieEatVolume"])  # 设置僵尸啃食音乐音量
+        self.zombieMusic = self.LoadSound(settings["game"]["bgm"]["zombieEat"], settings["game"]["bgm"]["zombieEatVolume"])
 
         # 加载土豆地雷爆炸音乐并设置音量
-        self.potatoMineExplosionMusic = pygame.mixer.Sound(settings["game"]["bgm"]["potatoMineExplosion"])
-        self.potatoMineExplosionMusic.set_volume(settings["game"]["bgm"]["potatoMineExplosionVolume"])  # 设置土豆地雷爆炸音乐音量
-
-        # 初始化网格坐标列表
-        GRID_X.append(0)
-        GRID_Y.append(0)
-        # 计算并添加 x 轴上每个网格的坐标
-        for i in range(1, GRID_COUNT[0] + 1):
-            GRID_X.append(GRID_LEFT_X + (i - 1) * GRID_SIZE[0])
-        # 计算并添加 y 轴上每个网格的坐标
-        for i in range(1, GRID_COUNT[1] + 1):
-            GRID_Y.append(GRID_TOP_Y + (i - 1) * GRID_SIZE[1])
+        self.potatoMineExplosionMusic = self.LoadSound(settings["game"]["bgm"]["potatoMineExplosion"], settings["game"]["bgm"]["potatoMineExplosionVolume"])
+
+    def LoadSound(self, path, volume):
+        """
+        加载声音并设置音量，不加载声音时返回 SilentSound
+
+        :param path: 声音文件路径
+        :param volume: 音量
+        :return: pygame.mixer.Sound 或 SilentSound
+        """
+        sound = pygame.mixer.Sound(path) if self.sound else SilentSound(path)
+        sound.set_volume(volume)
+        return sound
 
     def CheckInGarden(self, pos): 
         """
@@ -66,23 +73,44 @@ class Game:
         :return: 如果坐标在花园内返回 True，否则返回 False
         """
         # 通过比较坐标与花园边界的关系判断是否在花园内
-        return pos[0] > GRID_LEFT_X and pos[0] < GRID_RIGHT_X and pos[1] > GRID_TOP_Y and pos[1] < GRID_DOWN_Y
+        return self.board.InGarden(pos)
+
+    @property
+    def gold(self):
+        """
+        玩家拥有的金币数量，保存在金币模型中
+        """
+        return self.economy.gold
+
+    @gold.setter
+    def gold(self, value):
+        self.economy.Set(value)  # 通过金币模型修改，数值变化时通知订阅者
+
+    def SubscribeCells(self, callback):
+        """
+        订阅僵尸的网格变化
+
+        :param callback: 僵尸进入新的网格时调用 callback(zombie, old, new)，old 为 None 表示僵尸刚出现，new 为 None 表示僵尸已移除
+        :return: callback，便于之后取消订阅
+        """
+        self.cellListeners.append(callback)
+        return callback
+
+    def PublishCell(self, zombie, old, new):
+        """
+        通知所有订阅者僵尸的网格变化
+        """
+        for callback in self.cellListeners:
+            callback(zombie, old, new)
 
     def CheckPlant_Grid(self, plant_type): 
         """
-        检查是否有足够金币种植指定类型的植物
+        检查是否有足够金币种植指定类型的植物（只检查，不修改任何状态）
 
         :param plant_type: 要种植的植物类型
         :return: 如果金币足够返回 True，否则返回 False
         """
-        # 检查金币是否足够种植指定类型的植物
-        if self.gold >= settings[plant_type]["gold"]:
-            self.game.gridPlant.plantType = plant_type
-            self.game.gridPlant.preIndexTimeNumber = settings["game"]["plantPreIndexTimeNumber"][plant_type]
-            self.game.Plant.preIndexTimeNumber = settings["game"]["plantPreIndexTimeNumber"][plant_type]
-            return True
-        else:
-            return False
+        return self.economy.CanAfford(settings[plant_type]["gold"])
 
     def CheckAddPlant(self, xy, plant_type): 
         """
@@ -103,16 +131,16 @@ class Game:
         # 获取坐标对应的网格位置
         grid = self.getGrid(xy)
         # 检查网格位置是否为空
-        if self.map[grid[1]][grid[0]] == 0:
+        if self.map.IsFree(grid[0], grid[1]):
             # 若为空则记录种植的植物类型
-            self.map[grid[1]][grid[0]] = plant_type
+            self.map.Set(grid[0], grid[1], plant_type)
             plant = True
             # 播放种植音乐
             self.plantMusic.play()
         else:
             plant = False
         return {"plant": plant,
-                "pos": [GRID_X[grid[0]], GRID_Y[grid[1]]]
+                "pos": [self.board.gridX[grid[0]], self.board.gridY[grid[1]]]
                }
 
     def getGrid(self, xy): 
@@ -122,20 +150,8 @@ class Game:
         :param xy: 屏幕坐标，格式为 (x, y)
         :return: 对应的网格坐标，格式为 [col, row]
         """
-        pos = list(xy)
-        grid = [0, 0]
-        # 计算相对于网格起始位置的偏移量
-        pos[0] -= GRID_LEFT_X
-        pos[0] /= GRID_SIZE[0]
-        pos[1] -= GRID_TOP_Y
-        pos[1] /= GRID_SIZE[1]
-        # 向上取整得到网格坐标
-        grid[0] = math.ceil(pos[0])
-        grid[1] = math.ceil(pos[1])
-        # 确保网格坐标在有效范围内
-        grid[0] = max(1, min(grid[0], GRID_COUNT[0]))
-        grid[1] = max(1, min(grid[1], GRID_COUNT[1]))
-        return grid
+        # 计算网格坐标，并确保网格坐标在有效范围内
+        return self.board.ClampGrid(self.board.GetGrid(xy))
     
     def run(self):
         """
@@ -159,18 +175,28 @@ class Game:
         """
         更新游戏状态，包括僵尸和阳光的生成，以及鼠标操作处理
         """
-        # 更新僵尸生成计时器
-        self.zombieTime = (self.zombieTime + 1) % ZOMBIE_TIME
+        # 更新帧数
+        self.tick += 1
         # 更新阳光生成计时器
         self.sunlightTime = (self.sunlightTime + 1) % SUNLIGHT_TIME
-        # 判断是否到了生成僵尸的时间
-        if self.zombieTime == 0: 
-            zombie_type = ChooseZombieType()  # 随机选择僵尸类型
-            self.game.zombie_list.append(Zombie(self.game, zombie_type))  # 添加新的僵尸到僵尸列表中
+        # 生成时间线上这一帧的僵尸（大波僵尸会在同一帧批量出现）
+        due = self.scheduler.Due(self.tick)
+        if due:
+            types, lanes = zip(*due)
+            zombies = Zombie.SpawnBatch(self.game, types, lanes)
+            self.game.zombie_list.extend(zombies)  # 添加新的僵尸到僵尸列表中
+            for zombie in zombies:
+                self.PublishCell(zombie, None, zombie.grid)  # 新僵尸进入网格索引
         # 判断是否到了生成阳光的时间
         if self.sunlightTime == 0: 
-            self.game.sunlight_list.append(Sunlight(self.screen, (random.randint(GRID_LEFT_X, GRID_RIGHT_X), 0)))
+            fall = self.rng.randint(*self.board.sunFallY)  # 阳光落地的纵坐标
+            self.game.sunlight_list.append(Sunlight(self.screen, (self.rng.randint(self.board.left, self.board.right), 0), posY = fall))
         
+        if self.game.replayInput is not None:
+            for column, row in self.game.replayInput.Take(CMD_SHOVEL, self.tick):  # 回放录像中这一帧的铲除操作
+                self.ShovelAt([column, row])
+            return  # 回放时不读取鼠标
+
         # 处理鼠标左键按下事件且铲子上次操作已完成的情况
         if pygame.mouse.get_pressed()[0] and not self.shovel.click: 
             if not self.shovel.use:
@@ -186,34 +212,44 @@ class Game:
 
         # 处理鼠标左键按下且铲子正在使用的情况
         if pygame.mouse.get_pressed()[0] and self.shovel.use:
-            if self.CheckInGarden(pygame.mouse.get_pos()):
-                grid = getGrid(pygame.mouse.get_pos())
-                # 检查网格位置是否有植物
-                if self.map[grid[1]][grid[0]] != 0:
-                    # 移除豌豆射手
-                    for peashooter in self.game.peashooter_list:
-                        if peashooter.grid == grid:
-                            self.map[peashooter.grid[1]][peashooter.grid[0]] = 0
-                            self.game.peashooter_list.remove(peashooter)
-                            break
-                    # 移除向日葵
-                    for sunflower in self.game.sunflower_list:
-                        if sunflower.grid == grid:
-                            self.map[sunflower.grid[1]][sunflower.grid[0]] = 0
-                            self.game.sunflower_list.remove(sunflower)
-                            break
-                    # 移除坚果
-                    for nut in self.game.nut_list:
-                        if nut.grid == grid:
-                            self.map[nut.grid[1]][nut.grid[0]] = 0
-                            self.game.nut_list.remove(nut)
-                            break
-                    # 移除大嘴花
-                    for chomper in self.game.chomper_list:
-                        if chomper.grid == grid:
-                            self.map[chomper.grid[1]][chomper.grid[0]] = 0
-                            self.game.chomper_list.remove(chomper)
-                            break
+            mouse = VIEWPORT.ToWorld(pygame.mouse.get_pos())  # 鼠标所在的世界坐标
+            if self.CheckInGarden(mouse):
+                self.ShovelAt(self.getGrid(mouse))
+
+    def ShovelAt(self, grid):
+        """
+        铲除网格上的植物（玩家用铲子点击草坪或者回放录像中的铲除操作）
+
+        :param grid: 网格坐标 [col, row]
+        """
+        # 检查网格位置是否有植物
+        if self.map.Get(grid[0], grid[1]) == 0:
+            return
+        self.game.recorder.Shovel(self.tick, grid[0], grid[1])  # 记录铲除操作
+        # 移除豌豆射手
+        for peashooter in self.game.peashooter_list:
+            if peashooter.grid == grid:
+                self.map.Clear(peashooter.grid[0], peashooter.grid[1])
+                self.game.peashooter_list.remove(peashooter)
+                break
+        # 移除向日葵
+        for sunflower in self.game.sunflower_list:
+            if sunflower.grid == grid:
+                self.map.Clear(sunflower.grid[0], sunflower.grid[1])
+                self.game.sunflower_list.remove(sunflower)
+                break
+        # 移除坚果
+        for nut in self.game.nut_list:
+            if nut.grid == grid:
+                self.map.Clear(nut.grid[0], nut.grid[1])
+                self.game.nut_list.remove(nut)
+                break
+        # 移除大嘴花
+        for chomper in self.game.chomper_list:
+            if chomper.grid == grid:
+                self.map.Clear(chomper.grid[0], chomper.grid[1])
+                self.game.chomper_list.remove(chomper)
+                break
     
     def PlayZombieEatMusicDetermine(self): 
         """
@@ -284,9 +320,9 @@ class Game:
         :return: 如果有僵尸在啃食植物返回 True，否则返回 False
         """
         # 检查僵尸位置是否在有效范围内
-        if zombie.grid[1] < 1 or zombie.grid[1] > GRID_COUNT[1] or zombie.grid[0] < 1 or zombie.grid[0] > GRID_COUNT[0]:
+        if not self.board.IsValidGrid(zombie.grid):
             return None  # 如果僵尸位置不在有效范围内，返回 None
-        return zombie.eat and (self.map[zombie.grid[1]][zombie.grid[0] - 1] or self.map[zombie.grid[1]][zombie.grid[0]]) # 检查僵尸所在网格及其左侧网格是否有植物
+        return zombie.eat and (self.map.Get(zombie.grid[0] - 1, zombie.grid[1]) or self.map.Get(zombie.grid[0], zombie.grid[1])) # 检查僵尸所在网格及其左侧网格是否有植物
 
     def RunTimeDetermine(self): 
         """
@@ -310,12 +346,10 @@ class Game:
                     # 如果僵尸生命值小于等于 100 且不是普通僵尸，将其转换为普通僵尸
                     if zombie.hp <= 100 and not zombie.type == "common_zombie":
                         zombie.type = "common_zombie"
-                        zombie.path = settings["common_zombie"]["path"]
-                        zombie.imageCount = settings["common_zombie"]["imageCount"]
+                        zombie.SetMachine("common_zombie")  # 换成普通僵尸的动画
                     # 如果僵尸生命值小于等于 40 且头部还在，移除头部并添加僵尸头对象
                     if zombie.hp <= 40 and zombie.head:
-                        zombie.path = settings[zombie.type]["headlessPath"]
-                        zombie.imageCount = settings[zombie.type]["headlessImageCount"]
+                        zombie.Trigger("behead")  # 进入无头状态
                         # 添加僵尸头对象
                         self.game.zombieHead_list.append(ZombieHead(self.screen, (zombie.pos[0] + 30, zombie.pos[1])))
                         zombie.head = False
@@ -344,7 +378,7 @@ class Game:
                         peashooter.hp -= settings[zombie.type]["attack_power"]  
                         if peashooter.hp <= 0:
                             # 移除被吃掉的豌豆射手
-                            self.map[peashooter.grid[1]][peashooter.grid[0]] = 0
+                            self.map.Clear(peashooter.grid[0], peashooter.grid[1])
                             self.game.peashooter_list.remove(peashooter)
                             zombie.eat = False
             if not self.CheckZombieIsEatting(zombie):
@@ -370,17 +404,11 @@ class Game:
                         # 减少坚果的生命值
                         nut.hp -= NUT_HP / 4.0
                         # 根据坚果剩余生命值更新其外观
-                        if nut.hp == NUT_HP / 4.0 * 3:
-                            if not nut.path == settings["nut"]["path2"]:
-                                nut.path = settings["nut"]["path2"]
-                                nut.imageCount = settings["nut"]["imageCount2"]
-                        elif nut.hp == NUT_HP / 4.0 * 2:
-                            if not nut.path == settings["nut"]["path3"]:
-                                nut.path = settings["nut"]["path3"]
-                                nut.imageCount = settings["nut"]["imageCount3"]
+                        if nut.hp == NUT_HP / 4.0 * 3 or nut.hp == NUT_HP / 4.0 * 2:
+                            nut.Trigger("damage")  # 完好 -> 受损 -> 严重受损
                         elif nut.hp == NUT_HP / 4.0:
                             # 移除被吃掉的坚果
-                            self.map[nut.grid[1]][nut.grid[0]] = 0
+                            self.map.Clear(nut.grid[0], nut.grid[1])
                             self.game.nut_list.remove(nut)
                             zombie.eat = False
             if not self.CheckZombieIsEatting(zombie):
@@ -407,7 +435,7 @@ class Game:
                         sunflower.hp -= settings[zombie.type]["attack_power"]  
                         if sunflower.hp <= 0:
                             # 移除被吃掉的向日葵
-                            self.map[sunflower.grid[1]][sunflower.grid[0]] = 0
+                            self.map.Clear(sunflower.grid[0], sunflower.grid[1])
                             self.game.sunflower_list.remove(sunflower)
                             zombie.eat = False
             if not self.CheckZombieIsEatting(zombie):
@@ -416,7 +444,7 @@ class Game:
         # 处理食人花与僵尸的碰撞(大嘴花吃僵尸)
         for chomper in self.game.chomper_list:
             # 如果食人花未处于进食状态
-            if chomper.state == "Idle":  
+            if chomper.InState("idle"):  
                 for zombie in self.game.zombie_list:
                     # 检测食人花与僵尸是否发生碰撞
                     if collision_Plant_and_Zombie_detection(chomper, zombie, "chomper"):
@@ -432,7 +460,7 @@ class Game:
                 continue
             for chomper in self.game.chomper_list:
                 # 如果食人花处于进食状态
-                if chomper.state == "Eating":  
+                if chomper.InState("eating"):  
                     # 检测食人花与僵尸是否发生碰撞
                     if collision_Plant_and_Zombie_detection(chomper, zombie, "chomper"):
                         if not zombie.eat:
@@ -446,7 +474,7 @@ class Game:
                             chomper.hp -= settings[zombie.type]["attack_power"]  
                             if chomper.hp <= 0:
                                 # 移除被吃掉的食人花
-                                self.map[chomper.grid[1]][chomper.grid[0]] = 0
+                                self.map.Clear(chomper.grid[0], chomper.grid[1])
                                 self.game.chomper_list.remove(chomper)
                 if not self.CheckZombieIsEatting(zombie):
                     zombie.eat = False
@@ -463,15 +491,15 @@ class Game:
                             # 播放土豆地雷爆炸音乐
                             self.potatoMineExplosionMusic.play()
                             # 移除土豆地雷
-                            self.map[potatoMine.grid[1]][potatoMine.grid[0]] = 0
-                        if not zombie.path == settings[zombie.type]["deadPath"]:
+                            self.map.Clear(potatoMine.grid[0], potatoMine.grid[1])
+                        if not zombie.InState("dead"):
                             self.AttackZombie(zombie)
         
         for lawnmower in self.game.lawnmower_list:
             for zombie in self.game.zombie_list:
                 # 检测草地机与僵尸是否发生碰撞
                 if collision_Plant_and_Zombie_detection(lawnmower, zombie, "lawnmower"):
-                    if not zombie.path == settings[zombie.type]["deadPath"]:
+                    if not zombie.InState("dead"):
                         if not lawnmower.GoOut:
                             lawnmower.GoOut = 1
                         self.AttackZombie(zombie)
@@ -480,25 +508,17 @@ class Game:
             for zombie in self.game.zombie_list:
                 # 检测倭瓜与僵尸是否发生碰撞
                 if collision_Plant_and_Zombie_detection(squash, zombie, "squash"):
-                    if not zombie.path == settings[zombie.type]["deadPath"]:
-                        if not squash.state == "Attack": # 如果倭瓜未处于攻击状态
-                            squash.state = "Attack" # 切换为攻击状态
-                            squash.imageIndex = 1
-                            squash.path = settings["squash"]["attackPath"]
-                            squash.imageCount = settings["squash"]["attackImageCount"]
-                            squash.updateImage()
-                            squash.attackPosX = zombie.pos[0] + settings["squash"]["jumpXchange"]
-                            squash.imageIndex = 0
-                            squash.attackZombie = zombie
+                    if not zombie.InState("dead"):
+                        squash.Attack(zombie) # 倭瓜未处于攻击状态时跳起攻击
 
         for zombie in self.game.zombie_list:
-            if zombie.pos[0] <= GRID_LEFT_X and not self.game.lawnmowerIf[zombie.posY] and not zombie.hp == 0:
+            if zombie.pos[0] <= self.board.left and not self.game.lawnmowerIf[zombie.posY] and not zombie.hp == 0:
                 self.game.gameover = True
 
         # 处理倭瓜删除事件
         for squash in self.game.squash_list:
             if squash.delete:
-                self.map[squash.grid[1]][squash.grid[0]] = 0
+                self.map.Clear(squash.grid[0], squash.grid[1])
                 self.game.squash_list.remove(squash)
         
         # 处理草地机删除事件
@@ -509,20 +529,15 @@ class Game:
         
         for cherryBomb in self.game.cherryBomb_list:
             if cherryBomb.delete:
-                self.map[cherryBomb.grid[1]][cherryBomb.grid[0]] = 0
+                self.map.Clear(cherryBomb.grid[0], cherryBomb.grid[1])
                 self.game.cherryBomb_list.remove(cherryBomb)
 
         # 处理鼠标点击阳光事件
-        if pygame.mouse.get_pressed()[0]: 
-            for sunlight in self.game.sunlight_list:  
-                # 检测鼠标是否点击了阳光
-                if click(sunlight.pos, sunlight.size, pygame.mouse.get_pos()):  
-                    # 播放阳光音乐
-                    self.sunMusic.play()  
-                    # 增加金币数量
-                    self.gold += 25  
-                    # 移除被点击的阳光
-                    self.game.sunlight_list.remove(sunlight)  
+        if self.game.replayInput is not None:
+            for mouse in self.game.replayInput.Take(CMD_SUN, self.tick):  # 回放录像中这一帧点击阳光的位置
+                self.CollectSunAt(mouse)
+        elif pygame.mouse.get_pressed()[0]: 
+            self.CollectSunAt(VIEWPORT.ToWorld(pygame.mouse.get_pos()))  # 鼠标所在的世界坐标
 
         # 移除标记为删除的阳光
         for sunlight in self.game.sunlight_list: 
@@ -532,7 +547,7 @@ class Game:
         # 移除标记为删除的火爆辣椒
         for jalapeno in self.game.jalapeno_list:
             if jalapeno.delete:
-                self.map[jalapeno.oldGrid[1]][jalapeno.oldGrid[0]] = 0
+                self.map.Clear(jalapeno.grid[0], jalapeno.grid[1])
                 self.game.jalapeno_list.remove(jalapeno)
         
         # 移除标记为删除的生长土壤
@@ -540,14 +555,30 @@ class Game:
             if growSoil.delete:
                 self.game.growSoil_list.remove(growSoil)
     
+    def CollectSunAt(self, mouse):
+        """
+        收集点击位置的阳光（玩家点击或者回放录像中的点击），只有点中阳光时才记录这次点击
+
+        :param mouse: 点击的世界坐标 (x, y)
+        """
+        for sunlight in self.game.sunlight_list:  
+            # 检测鼠标是否点击了阳光
+            if click(sunlight.pos, sunlight.size, mouse):  
+                # 记录点击阳光操作
+                self.game.recorder.Sun(self.tick, *mouse)
+                # 播放阳光音乐
+                self.sunMusic.play()  
+                # 增加金币数量
+                self.economy.Add(25)
+                # 移除被点击的阳光
+                self.game.sunlight_list.remove(sunlight)  
+
     def AttackZombie(self, zombie, head = 1):
         if head and zombie.hp > 40:
             # 添加僵尸头对象
             self.game.zombieHead_list.append(ZombieHead(self.screen, (zombie.pos[0] + 30, zombie.pos[1])))
         zombie.hp = 0
-        zombie.imageIndex = 0
-        zombie.path = settings[zombie.type]["deadPath"]
-        zombie.imageCount = settings[zombie.type]["deadImageCount"]
+        zombie.Trigger("die")  # 进入死亡状态
         flag = False
         # 检查该僵尸所在行是否还有其他僵尸
         for Zombie in self.game.zombie_list:
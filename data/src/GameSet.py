@@ -147,8 +147,20 @@ class GameSet: # 游戏设置类
         self.inputPassword.insert(0, "guest")
 
     def SetFPS(self):
-        self.game.game.FPS = int(self.SetFPSInput.get())
-        messagebox.showinfo("成功", "设置FPS成功")
+        fps = self.SetFPSInput.get()
+        if fps == "":
+            messagebox.showerror("错误", "请输入刷新率")
+        else:
+            if fps.isdigit():
+                fps = int(fps)
+                if fps > 0:
+                    self.game.FPS = fps  # 窗口的刷新率，游戏逻辑仍按 DEFAULT_FPS 运行
+                    messagebox.showinfo("成功", "设置FPS成功")
+                else:
+                    messagebox.showerror("错误", "请输入正整数")
+            else:
+                messagebox.showerror("错误", "请输入数字")
+        self.SetFPSInput.delete(0, tk.END)
 
     def SetGold(self):
         gold = self.SetGoldInput.get()
@@ -160,7 +172,7 @@ class GameSet: # 游戏设置类
                     gold = int(gold)
                     if gold <= 9999:
                         if gold >= 0:
-                            self.game.game.gold = gold
+                            self.game.RequestGold(gold)  # 由游戏线程在下一个逻辑帧应用
                             messagebox.showinfo("成功", "设置成功")
                         else:
                             messagebox.showerror("错误", "请输入正整数")
@@ -1,6 +1,8 @@
 from data.src.object import *
 
 class GrowSoil(Object):  # 定义GrowSoil类，继承自object类
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, game, pos):  # 初始化函数
         self.name = ""
         self.game = game
@@ -9,9 +11,12 @@ class GrowSoil(Object):  # 定义GrowSoil类，继承自object类
         self.pos[0] += settings["GrowSoil"]["posChange"][0]
         self.pos[1] += settings["GrowSoil"]["posChange"][1]
         self.delete = False
+        self.SetMachine("GrowSoil")  # 最后一帧删除
 
     def run(self):  # 运行函数
         self.update()  # 更新图片
-        if self.imageIndex >= self.imageCount:
-            self.delete = True
-        self.draw()  # 绘制
\ No newline at end of file
+        self.draw()  # 绘制
+
+    def OnFrameEvent(self, event):  # 帧事件
+        if event == "done":  # 动画的最后一帧：删除
+            self.delete = True
\ No newline at end of file
@@ -0,0 +1,52 @@
+import pygame # 导入pygame库
+from data.src.const import *  # 导入常量
+from data.src.RenderBuffer import *  # 导入绘制快照
+
+class IdleFrames:
+    def __init__(self, renderer, frames = IDLE_FRAMES, timeout = IDLE_WAIT):
+        """
+        空闲帧检测：用于开始界面、选卡界面和游戏结束界面这样大部分时间静止的画面。
+        连续 frames 帧画面没有变化（绘制快照相同）并且没有输入时进入空闲，帧循环不再每帧运行和绘制，
+        而是阻塞等待输入，最多等待 timeout 毫秒后再运行一帧检查画面是否变化
+
+        :param renderer: 绘制器，窗口需要重画（例如被遮住后重新显示）时通知它
+        :param frames: 进入空闲需要的连续静止帧数，为 0 时不检测
+        :param timeout: 空闲时每次最多等待的时间（毫秒）
+        """
+        self.renderer = renderer
+        self.frames = frames
+        self.timeout = timeout
+        self.still = 0  # 连续静止（画面不变且没有输入）的帧数
+        self.waits = 0  # 空闲等待的次数
+
+    def Update(self, events, snapshot, previous):
+        """
+        每帧发布绘制快照后调用，更新连续静止的帧数
+
+        :param events: 这一帧收到的事件
+        :param snapshot: 这一帧的绘制快照
+        :param previous: 上一帧的绘制快照
+        """
+        for event in events:
+            if event.type == pygame.WINDOWEXPOSED:
+                self.renderer.Invalidate()  # 窗口内容可能已经丢失，下一次必须重画
+        if events or not SameImage(snapshot, previous):
+            self.still = 0
+        else:
+            self.still += 1
+
+    def Idle(self):
+        """
+        是否处于空闲（连续静止的帧数已经足够）
+        """
+        return self.frames > 0 and self.still >= self.frames
+
+    def Wait(self):
+        """
+        空闲时调用：阻塞等待输入，最多 timeout 毫秒。收到的事件放回事件队列，由帧循环照常处理
+        """
+        event = pygame.event.wait(self.timeout)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+            self.still = 0
+        self.waits += 1
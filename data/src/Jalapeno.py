@@ -2,6 +2,8 @@ from data.src.object import *
 from data.src.ZombieHead import *  # 导入僵尸头
 
 class Jalapeno(Object):  # 定义火爆辣椒类，继承自Object类
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, game, pos):  # 初始化函数
         self.plantType = "jalapeno" # 设置植物类型为火爆辣椒
         self.game = game  # 保存游戏引用
@@ -9,48 +11,35 @@ class Jalapeno(Object):  # 定义火爆辣椒类，继承自Object类
         self.pos = list(pos)
         self.pos[0] += settings["game"]["gridPlantPos"][self.plantType][0]
         self.pos[1] += settings["game"]["gridPlantPos"][self.plantType][1]
-        self.updateGrid(self.pos)
-        self.grid[1] += 1
-        self.oldGrid = self.grid.copy() # 记录旧的网格位置
-        self.state = "InitExplosion"
+        self.grid = game.board.CellAt(pos)  # 种植的网格
+        self.SetMachine(self.plantType)  # 准备爆炸（最后一帧爆炸）-> 爆炸（最后一帧删除）
         self.delete = 0
 
     def run(self):  # 运行函数，用于更新火爆辣椒的状态并绘制图片
-        # 当火爆辣椒处于初始爆炸状态且图片索引达到图片总数时
-        if self.state == "InitExplosion" and self.imageIndex == self.imageCount:
-            self.game.jalapenoExplosionMusic.play()  # 播放火爆辣椒爆炸音效
-            self.state = "Explosion"  # 切换状态为爆炸状态
-            self.imageIndex = 1  # 重置图片索引为0
-            self.path = settings[self.plantType]["ExplosionPath"]   # 更新图片路径为爆炸图片路径
-            self.imageCount = settings[self.plantType]["ExplosionImageCount"] # 更新图片总数为爆炸图片总数
-            self.size = settings[self.plantType]["ExplosionSize"] # 更新图片大小为爆炸图片大小
-            self.updateImage()
-            self.imageIndex = 0
-            self.pos[0] = settings[self.plantType]["ExplosionPos"][0] # 调整位置以适应爆炸图片
-            self.pos[1] += settings[self.plantType]["ExplosionPos"][1] # 调整位置以适应爆炸图片
-            self.updateGrid(self.pos)
-            self.grid[1] += 1
-            self.grid[0] += 1
-            # 遍历游戏中的所有僵尸
-            for zombie in self.game.zombie_list:
-                if zombie.grid[1] != self.grid[1]: # 当不在同一行时
-                    continue
-                if not zombie.InGrid: # 当不在网格内时
-                    continue
-                # 当僵尸的网格位置与火爆辣椒的爆炸范围重合时
-                zombie.hp = 0
-                zombie.imageIndex = 1
-                zombie.path = settings["game"]["zombie-burn"]["Path"]  # 更新僵尸图片路径为燃烧状态图片路径
-                zombie.imageCount = settings["game"]["zombie-burn"]["ImageCount"] # 更新僵尸图片总数为燃烧状态图片总数
-                zombie.size = settings["game"]["zombie-burn"]["Size"] # 更新僵尸图片大小为燃烧状态图片大小
+        self.update()  # 更新图片，爆炸和删除由帧事件处理
+        self.draw()
+
+    def OnFrameEvent(self, event):  # 帧事件
+        if event == "explode":  # 准备爆炸动画的最后一帧：爆炸
+            self.Explode()
+        elif event == "finish":  # 爆炸动画的最后一帧：标记为删除状态
+            self.delete = True
+
+    def Explode(self):  # 爆炸，烧毁同一行草坪内的僵尸
+        self.game.jalapenoExplosionMusic.play()  # 播放火爆辣椒爆炸音效
+        self.Trigger("explode", 1)  # 切换为爆炸状态（图片和尺寸换成爆炸的），立即显示第一帧
+        self.pos[0] = settings[self.plantType]["ExplosionPos"][0] # 调整位置以适应爆炸图片
+        self.pos[1] += settings[self.plantType]["ExplosionPos"][1] # 调整位置以适应爆炸图片
+        # 遍历同一行的僵尸（从网格索引中取得）
+        for zombie in self.game.game.zombieCells.InRow(self.grid[1]):
+            if not zombie.IsInGrid(self.game.board): # 当不在网格内时
+                continue
+            # 当僵尸的网格位置与火爆辣椒的爆炸范围重合时
+            zombie.hp = 0
+            if zombie.Trigger("burn", 1):  # 僵尸进入燃烧状态（图片和尺寸换成燃烧的）
                 zombie.pos[0] += settings["game"]["zombie-burn"]["Pos"][0] # 调整僵尸位置以适应燃烧状态图片
                 zombie.pos[1] += settings["game"]["zombie-burn"]["Pos"][1] # 调整僵尸位置以适应燃烧状态图片
-                zombie.state = "Burn"
+                zombie.UpdateCell()  # 位置改变后重新计算网格
                 zombie.updateImage()
                 zombie.imageIndex = 0
-                self.game.zombiePos[zombie.posY] = False
-
-        if self.state == "Explosion" and self.imageIndex == self.imageCount: # 当火爆辣椒处于爆炸状态且图片索引达到图片总数时
-            self.delete = True  # 标记为删除状态
-        self.update()
-        self.draw()
\ No newline at end of file
+            self.game.zombiePos[zombie.posY] = False
@@ -1,16 +1,17 @@
 from data.src.object import *
 
 class Lawnmower(Object):  # 定义Lawnmower类，继承自object类
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, game, gridY):  # 初始化函数
         self.game = game
         super().__init__(game.screen, settings['lawnmower']['path'], settings['lawnmower']['size'], settings['lawnmower']['imageCount'])
         self.gridY = gridY
-        self.pos = [LAWNMOWER_FIRST_X, GRID_Y[gridY]]
+        self.pos = [LAWNMOWER_FIRST_X, game.board.gridY[gridY]]
         self.name = "lawnmower"
         self.GoOut = 0
         self.Delete = 0
-        self.updateGrid(self.pos)
-        self.grid[1] += 1
+        self.grid = game.board.CellAt(self.pos)
         self.game.lawnmowerIf[self.grid[1]] = 1 # 标记草坪机已出现
         self.pos[1] += settings['lawnmower']['YposChange']
         self.bgmPlaying = False  # 草坪机音乐是否正在播放
@@ -24,7 +25,7 @@ class Lawnmower(Object):  # 定义Lawnmower类，继承自object类
                 self.game.lawnmowerMusic.play()  # 循环播放草坪机音乐
                 self.bgmPlaying = True
             self.pos[0] += 1
-            if self.pos[0] >= GAME_SIZE[0]:
+            if self.pos[0] >= self.game.board.worldSize[0]:  # 开出世界的右边
                 self.Delete = 1
             self.update()
         self.draw()  # 绘制
\ No newline at end of file
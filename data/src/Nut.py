@@ -1,6 +1,8 @@
 from data.src.object import * # 导入对象
 
 class Nut(Object):  # 定义nut类，继承自Object类
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, game, pos):  # 初始化函数
         self.plantType = 'nut'
         self.game = game
@@ -8,8 +10,8 @@ class Nut(Object):  # 定义nut类，继承自Object类
         self.pos = list(pos)  # 保存nut位置
         self.pos[0] += settings['game']['gridPlantPos'][self.plantType][0]
         self.pos[1] += settings['game']['gridPlantPos'][self.plantType][1]
-        self.updateGrid(self.pos)
-        self.grid[1] += 1
+        self.grid = game.board.CellAt(pos)  # 种植的网格
+        self.SetMachine(self.plantType)  # 完好 -> 受损 -> 严重受损
 
     def run(self):  # 运行函数
         self.update()  # 更新图片
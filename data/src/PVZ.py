@@ -1,6 +1,7 @@
 from data.src._BasicImports import *  # 导入基本的模块和常量
 from data.src._GameObjectImports import * # 导入各个游戏对象的类
 from data.src.Game import *  # 导入游戏处理核心
+from data.src.Snapshot import *  # 导入游戏存档
 # 定义游戏类
 class Pvz:
     def __init__(self): # 初始化游戏
@@ -22,10 +23,15 @@ class Pvz:
         pygame.display.set_caption(GAME_TITLE + "V" + GAME_VERSION)  # 设置游戏窗口标题
         self.FPS = DEFAULT_FPS  # 设置游戏帧率
         self.clock = pygame.time.Clock()  # 设置时钟
+        self.renderer = Renderer(self.screen)  # 创建绘制器，帧循环只发布绘制快照，由它绘制和刷新窗口
+        self.idle = IdleFrames(self.renderer, IDLE_FRAMES)  # 静止界面的空闲帧检测
+        self.focus = WindowFocus(self.renderer)  # 窗口焦点和可见性，窗口在后台时按策略暂停或降低帧率
         self.game = Game(game)  # 创建游戏处理核心实例
+        self.board = self.game.board  # 保存草坪实例
         self.ObjectGame = game  # 保存游戏对象实例
     
         self.loading_music()  # 加载音乐
+        PreloadAnimations()  # 加载所有动画状态用到的图片，切换状态时不再读取磁盘
         self.initialize_list()  # 初始化列表
         self.initialize_instance()  # 初始化实例
 
@@ -34,14 +40,19 @@ class Pvz:
         self.startTime = 0
         # 播放音乐
         self.startMusic.play(-1)  # -1 表示无限循环
-        # self.load()  # 加载游戏数据
+        if RESUME_SAVE:
+            self.load()  # 加载游戏数据，成功时跳过开始界面和选卡界面
 
         while not self.running:  # 当游戏还没开始时
-            for event in pygame.event.get():  # 获取所有事件
+            if self.idle.Idle():  # 画面静止并且没有输入：不运行、不绘制，阻塞等待输入
+                self.idle.Wait()
+            events = pygame.event.get()  # 获取所有事件
+            self.focus.Handle(events)  # 记录窗口焦点和可见性的变化（在后台时暂停声音）
+            for event in events:
                 if event.type == pygame.QUIT:  # 如果事件类型为退出
                     os._exit(0)
             
-            self.screen.fill(WHITE)  # 填充屏幕为白色
+            RENDER.Begin()  # 开始记录这一帧的绘制快照（由绘制器填充白色背景）
             self.startBackground.run()  # 运行开始背景
 
             # 判断是否点击开始按钮
@@ -51,7 +62,10 @@ class Pvz:
                 self.running = True
             
             self.startButton.run()  # 运行开始按钮
-            pygame.display.flip()  # 更新屏幕
+            self.idle.Update(events, RENDER.Publish(), RENDER.Previous())  # 发布这一帧的绘制快照，与上一帧比较画面是否变化
+            self.renderer.Present()  # 绘制最新的快照并更新屏幕
+            CLOCK.Advance()  # 推进动画时钟，每帧一次
+            VIEWPORT.EndFrame()  # 结束这一帧的绘制统计
             self.clock.tick(self.FPS)  # 设置帧率
 
     def chooseCard(self): # 选择卡片
@@ -60,12 +74,16 @@ class Pvz:
         self.selectedCard = [] # 创建一个空列表来存储选中的卡片
 
         while not self.really: # 当游戏还在选择卡片时
-            for event in pygame.event.get():  # 获取所有事件
+            if self.idle.Idle():  # 画面静止并且没有输入：不运行、不绘制，阻塞等待输入
+                self.idle.Wait()
+            events = pygame.event.get()  # 获取所有事件
+            self.focus.Handle(events)  # 记录窗口焦点和可见性的变化（在后台时暂停声音）
+            for event in events:
                 if event.type == pygame.QUIT:  # 如果事件类型为退出
                     os._exit(0)
 
-            self.screen.fill(WHITE)  # 填充屏幕为白色
-            self.background.run()  # 运行背景
+            RENDER.Begin()  # 开始记录这一帧的绘制快照（由绘制器填充白色背景）
+            self.background.run(self.board)  # 运行背景（只绘制窗口内的背景分块）
             self.game.run()  # 运行游戏处理
             self.CardFrame.run()  # 运行卡片框
             self.ChooseCardFrame.run() # 运行选择卡片框
@@ -82,187 +100,262 @@ class Pvz:
             if self.reallyButton.start:
                 self.really = True
 
-            pygame.display.flip()  # 更新屏幕
+            self.idle.Update(events, RENDER.Publish(), RENDER.Previous())  # 发布这一帧的绘制快照，与上一帧比较画面是否变化
+            self.renderer.Present()  # 绘制最新的快照并更新屏幕
+            CLOCK.Advance()  # 推进动画时钟，每帧一次
+            VIEWPORT.EndFrame()  # 结束这一帧的绘制统计
             self.clock.tick(self.FPS)  # 设置帧率
 
-    def run(self): # 游戏运行界面
+    def BeginRun(self):
+        """
+        进入游戏运行界面前调用：按选中的卡片创建卡片和阴影，订阅金币变化，并开始录制操作（回放时也从这里开始）
+        """
         for card in self.selectedCard:  # 遍历卡片列表
             self.card.append(Card(self.screen, card.name, card.PosNumber))  # 创建卡片实例
-            self.card_shadow_list.append(Shadow(self.screen, CARD_SIZE, [CARD_FIRST_X + (CARD_SIZE[0] + 7) * self.selectedCard.index(card), CARD_POS_Y]))  # 创建阴影实例
+        for index in range(len(self.card_shadow_list), len(self.card)):
+            self.card_shadow_list.append(Shadow(self.screen, CARD_SIZE, [CARD_FIRST_X + (CARD_SIZE[0] + 7) * index, CARD_POS_Y]))  # 创建阴影实例
+        if RECORD_REPLAY:
+            # 创建操作录像，记录种子、选中的卡片和玩家的每个操作，可以用 python -m data.src.Replay 回放；
+            # 从存档继续的对局把恢复后的游戏状态写入录像，回放时从这一帧开始
+            self.recorder = InputRecorder(os.path.join(REPLAY_DIR, time.strftime("%Y%m%d-%H%M%S") + ".pvzr"),
+                                          self.game.seed, self.game.level, self.game.gold, [card.name for card in self.card],
+                                          self.game.tick, Encode(Capture(self)) if self.game.tick else b"")
+        self.game.economy.Subscribe(self.OnGoldChanged)  # 金币变化时更新卡片是否可用和金币文字
+        self.idle.still = 0  # 选卡界面的静止帧不计入游戏结束画面
 
+    def run(self): # 游戏运行界面
+        self.BeginRun()
+        step = 1 / DEFAULT_FPS  # 一个逻辑帧的时长（秒）
+        self.accumulator = 0.0  # 累积的还没有运行逻辑的时间（秒）
         while self.running:  # 当游戏运行时
-            if not self.gameover:
-                for event in pygame.event.get():  # 获取所有事件
-                    if event.type == pygame.QUIT:  # 如果事件类型为退出
-                        os._exit(0)
-                    elif pygame.mouse.get_pressed()[0]:  # 如果鼠标左键被按下
-                        if not self.plant:
-                            for card in self.card:  # 遍历卡片
-                                if card.READY:
-                                    if click(card.pos, card.size, pygame.mouse.get_pos()):  # 如果点击卡片
-                                        if self.game.CheckPlant_Grid(card.name):
-                                            self.plant = True
-                                            self.plantType = card.number
-                                            self.plantName = card.name
-
-                                            self.Plant.name = self.plantName
-                                            self.Plant.path = settings[self.plantName]['path']
-                                            self.Plant.imageCount = settings[self.plantName]['imageCount']
-                                            self.Plant.size = settings[self.plantName]['size']
-                                            self.Plant.preIndexTimeNumber = settings['game']['plantPreIndexTimeNumber'][self.plantName]
-                                            
-                                            self.gridPlant.plantName = self.plantName
-                                            self.gridPlant.path = settings[self.plantName]['path']
-                                            self.gridPlant.imageCount = settings[self.plantName]['imageCount']
-                                            self.gridPlant.size = settings[self.plantName]['size']
-                                            self.gridPlant.preIndexTimeNumber = settings['game']['plantPreIndexTimeNumber'][self.plantName]
-                                            
-                self.screen.fill(WHITE)  # 填充屏幕为白色
-                self.background.run()  # 运行背景
-                self.game.run()  # 运行游戏核心
-
-                self.CardFrame.run()  # 运行卡片框
-                for card in self.card:
-                    card.run()  # 运行卡片
-                self.game.shovelFrame.run()  # 运行铲子框
-
-                text_surface = pygame.font.Font(None, 33).render(str(self.game.gold), True, (0, 0, 0))
-                # 设置文本表面的位置
-                text_rect = text_surface.get_rect()
-                text_rect.center = (60, 75)
-                # 将文本表面绘制到屏幕上
-                self.screen.blit(text_surface, text_rect)
-
-                if self.plant: # 如果正在种植：种植
-                    if self.game.CheckInGarden(pygame.mouse.get_pos()):
-                        self.gridPlant.run()
-                    if pygame.mouse.get_pressed()[0]:  #如果鼠标左键被按下
-                        if not self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['plant']: # 如果不能种植
-                            continue # 跳过此次循环
-                        for plant in settings["need_grow_soil_plant"]:
-                            if plant == self.plantName:
-                                self.growSoil_list.append(GrowSoil(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos'])) #添加生长土壤到生长土壤列表
-                                break
-                        if self.plantType == 1: #如果种植的是阳光花
-                            self.sunflower_list.append(Sunflower(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos'])) #添加阳光花到阳光花列表
-                            self.plant = False
-                        elif self.plantType == 2: #如果种植的是豌豆射手
-                            self.peashooter_list.append(Peashooter(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos'])) #添加射手到射手列表
-                            self.plant = False
-                        elif self.plantType == 3: #如果种植的是坚果
-                            self.nut_list.append(Nut(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos'])) #添加坚果到坚果列表
-                            self.plant = False
-                        elif self.plantType == 4: #如果种植的是土豆地雷
-                            self.potatoMine_list.append(PotatoMine(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos'])) #添加坚果到坚果列表
-                            self.plant = False
-                        elif self.plantType == 5: #如果种植的是大嘴花
-                            self.chomper_list.append(Chomper(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos'])) #添加大嘴花到大嘴花列表
-                            self.plant = False
-                        elif self.plantType == 6: #如果种植的是樱桃炸弹
-                            self.cherryBomb_list.append(CherryBomb(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos'])) #添加樱桃炸弹到樱桃炸弹列表
-                            self.plant = False
-                        elif self.plantType == 7: #如果种植的是火爆辣椒
-                            self.jalapeno_list.append(Jalapeno(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos']))
-                            self.plant = False
-                        elif self.plantType == 8: #如果种植的是倭瓜
-                            self.squash_list.append(Squash(self.ObjectGame, self.game.CheckAddPlant(pygame.mouse.get_pos(), self.plantType)['pos']))
-                            self.plant = False
-                        self.game.gold -= settings[settings['plant_name'][self.plantType]]['gold'] # 扣除金币
-
-                for potatoMine in self.potatoMine_list:  # 遍历土豆地雷列表
-                    if potatoMine.delete:
-                        self.potatoMine_list.remove(potatoMine)
-                        continue
-                    potatoMine.run()
-
-                for peashooter in self.peashooter_list:  # 遍历射手列表
-                    peashooter.run()  # 运行射手
-
-                for sunflower in self.sunflower_list:  # 遍历阳光花列表
-                    sunflower.run()  # 运行阳光花
-
-                for nut in self.nut_list: # 遍历坚果列表
-                    nut.run() # 运行坚果
+            if self.gameover and self.idle.Idle():  # 游戏结束的画面静止并且没有输入：阻塞等待输入
+                self.idle.Wait()
+                self.clock.tick()  # 等待的时间不累积为逻辑帧
+                self.accumulator = step  # 醒来后运行一个逻辑帧
+            policy = self.focus.Policy()  # 窗口在后台时的策略
+            if policy == "pause":  # 暂停：不运行也不绘制，阻塞等待窗口事件
+                self.WaitInBackground()
+                self.clock.tick()  # 暂停的时间不累积为逻辑帧
+                continue
+            fps = max(1, BACKGROUND_FPS if policy == "throttle" else self.FPS)  # 刷新率至少为 1，避免除以 0
+            # 窗口按 fps 刷新，游戏逻辑按固定的 DEFAULT_FPS 运行：把经过的时间累积起来，每满一个逻辑帧运行一次
+            frameTime = self.clock.tick(fps)  # 设置帧率，返回距离上一次绘制的时间（毫秒）
+            if frameTime > SLOW_FRAME_TIME and not self.gameover and policy == "run":
+                self.recorder.SlowFrame(self.game.tick, frameTime)  # 记录慢帧，回放时可以分析这些帧
+            self.accumulator += frameTime / 1000
+            maxSteps = max(MAX_LOGIC_STEPS, math.ceil(DEFAULT_FPS / fps) + 1)  # 帧率低时每次绘制之间需要运行更多逻辑帧
+            steps = 0
+            while self.accumulator >= step and self.running:
+                self.Step()  # 运行一个逻辑帧并发布绘制快照
+                self.accumulator -= step
+                steps += 1
+                if steps == maxSteps:
+                    self.accumulator = 0.0  # 卡顿过久，丢弃来不及运行的时间
+                    break
+            self.renderer.fps = fps
+            self.renderer.Present(self.accumulator / step)  # 在最近两个逻辑帧之间插值绘制（使用绘制线程或者不需要绘制时不绘制）
+
+    def WaitInBackground(self):
+        """
+        窗口在后台并且策略为暂停时调用：阻塞等待窗口事件，最多 FOCUS_WAIT 毫秒。
+        暂停期间只处理窗口事件和退出，其它输入（例如点击）丢弃
+        """
+        event = pygame.event.wait(FOCUS_WAIT)
+        if event.type == pygame.NOEVENT:
+            return
+        events = [event] + pygame.event.get()
+        self.focus.Handle(events)
+        for event in events:
+            if event.type == pygame.QUIT:  # 如果事件类型为退出
+                self.Quit()
+
+    def Quit(self):
+        """
+        游戏中退出：结束操作录像，保存游戏（下次启动时继续，已结束的对局不会恢复）后退出
+        """
+        self.recorder.Close(self.game.tick)  # 写入结束标记，录像可以完整回放
+        self.save()
+        os._exit(0)
+
+    def SelectCard(self, plantType):
+        """
+        选择要种植的植物（玩家点击卡片或者回放录像中的选卡操作）
+
+        :param plantType: 植物编号，对应 settings["plant_name"] 的索引
+        """
+        self.plant = True
+        self.plantType = plantType
+        self.recorder.Card(self.game.tick, plantType)  # 记录选卡操作
+        self.plantName = settings['plant_name'][plantType]
+
+        self.Plant.name = self.plantName
+        self.Plant.path = settings[self.plantName]['path']
+        self.Plant.imageCount = settings[self.plantName]['imageCount']
+        self.Plant.size = settings[self.plantName]['size']
+        self.Plant.preIndexTimeNumber = settings['game']['plantPreIndexTimeNumber'][self.plantName]
+
+        self.gridPlant.plantName = self.plantName
+        self.gridPlant.path = settings[self.plantName]['path']
+        self.gridPlant.imageCount = settings[self.plantName]['imageCount']
+        self.gridPlant.size = settings[self.plantName]['size']
+        self.gridPlant.preIndexTimeNumber = settings['game']['plantPreIndexTimeNumber'][self.plantName]
+
+    def PlaceAt(self, pos):
+        """
+        在世界坐标 pos 所在的网格种植选中的植物（玩家点击草坪或者回放录像中的种植操作）
+
+        :param pos: 世界坐标 (x, y)
+        :return: 种植成功返回 True，不能种植时保留选中的卡片并返回 False
+        """
+        if not self.plantFactory.Place(pos, self.plantType):
+            return False
+        grid = self.game.getGrid(pos)
+        self.recorder.Place(self.game.tick, self.plantType, grid[0], grid[1])  # 记录种植操作
+        self.plant = False
+        return True
+
+    def Step(self): # 运行一个逻辑帧
+        """
+        运行一个逻辑帧：处理输入、运行所有游戏对象，并发布这一帧的绘制快照
+        """
+        if not self.gameover:
+            self.ApplyPendingGold()  # 应用设置窗口修改的金币
+            events = pygame.event.get()  # 获取所有事件
+            self.focus.Handle(events)  # 记录窗口焦点和可见性的变化
+            for event in events:
+                if event.type == pygame.QUIT:  # 如果事件类型为退出
+                    self.Quit()
+                elif self.replayInput is None and pygame.mouse.get_pressed()[0]:  # 如果鼠标左键被按下（回放时不读取鼠标）
+                    if not self.plant:
+                        for card in self.card:  # 遍历卡片
+                            if card.READY:
+                                if click(card.pos, card.size, pygame.mouse.get_pos()):  # 如果点击卡片
+                                    if card.affordable:  # 金币足够（由金币变化事件维护）
+                                        self.SelectCard(card.number)
+            if self.replayInput is not None:
+                for (plantType,) in self.replayInput.Take(CMD_CARD, self.game.tick):  # 回放录像中这一帧的选卡操作
+                    self.SelectCard(plantType)
+            keys = pygame.key.get_pressed()  # 方向键滚动摄像机（草坪比窗口大时）
+            VIEWPORT.ScrollBy((keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * CAMERA_SCROLL_SPEED, (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * CAMERA_SCROLL_SPEED)
+            RENDER.Begin()  # 开始记录这一帧的绘制快照（由绘制器填充白色背景）
+            self.background.run(self.board)  # 运行背景（只绘制窗口内的背景分块）
+            self.game.run()  # 运行游戏核心
+
+            self.CardFrame.run()  # 运行卡片框
+            for card in self.card:
+                card.run()  # 运行卡片
+            self.game.shovelFrame.run()  # 运行铲子框
+
+            RENDER.AddSurface(self.goldText, self.goldTextRect.topleft)  # 绘制金币文字（只在金币变化时重新渲染）
+
+            if self.plant: # 如果正在种植：种植
+                mouse = VIEWPORT.ToWorld(pygame.mouse.get_pos())  # 鼠标所在的世界坐标
+                if self.game.CheckInGarden(mouse):
+                    self.gridPlant.run()
+                if self.replayInput is None and pygame.mouse.get_pressed()[0]:  #如果鼠标左键被按下
+                    self.PlaceAt(mouse)  # 不能种植时（例如网格已有植物）保留选中的卡片，这一帧照常运行
+            if self.replayInput is not None:
+                for plantType, column, row in self.replayInput.Take(CMD_PLACE, self.game.tick):  # 回放录像中这一帧的种植操作
+                    self.plantType = plantType
+                    self.PlaceAt(self.board.CellCenter(column, row))
+
+            for potatoMine in self.potatoMine_list:  # 遍历土豆地雷列表
+                if potatoMine.delete:
+                    self.potatoMine_list.remove(potatoMine)
+                    continue
+                potatoMine.run()
+
+            for peashooter in self.peashooter_list:  # 遍历射手列表
+                peashooter.run()  # 运行射手
+
+            for sunflower in self.sunflower_list:  # 遍历阳光花列表
+                sunflower.run()  # 运行阳光花
+
+            for nut in self.nut_list: # 遍历坚果列表
+                nut.run() # 运行坚果
                 
-                for zombie in self.zombie_list:  # 遍历僵尸列表
-                    zombie.run()  # 运行僵尸
-                    if zombie.delete:  # 如果僵尸需要被删除
-                        self.zombie_list.remove(zombie)  # 从僵尸列表中删除僵尸
-
-                for head in self.zombieHead_list:  # 遍历僵尸头列表
-                    head.run()  # 运行僵尸头
-                    if head.delete:  # 如果僵尸头需要被删除
-                        self.zombieHead_list.remove(head)  # 从僵尸头列表中删除僵尸头
-
-                for chomper in self.chomper_list:  # 遍历大嘴花列表
-                    chomper.run()  # 运行大嘴花
+            for zombie in self.zombie_list:  # 遍历僵尸列表
+                zombie.run()  # 运行僵尸
+                if zombie.delete:  # 如果僵尸需要被删除
+                    self.zombie_list.remove(zombie)  # 从僵尸列表中删除僵尸
+                    self.game.PublishCell(zombie, zombie.grid, None)  # 从网格索引中移除
+
+            for head in self.zombieHead_list:  # 遍历僵尸头列表
+                head.run()  # 运行僵尸头
+                if head.delete:  # 如果僵尸头需要被删除
+                    self.zombieHead_list.remove(head)  # 从僵尸头列表中删除僵尸头
+
+            for chomper in self.chomper_list:  # 遍历大嘴花列表
+                chomper.run()  # 运行大嘴花
                     
-                for squash in self.squash_list:  # 遍历倭瓜列表
-                    squash.run()  # 运行倭瓜
+            for squash in self.squash_list:  # 遍历倭瓜列表
+                squash.run()  # 运行倭瓜
                 
-                for pea in self.pea_list:  # 遍历子弹列表
-                    pea.run()  # 运行子弹
-                    if pea.delete:  # 如果子弹需要被删除
-                        self.pea_list.remove(pea)  # 从子弹列表中删除子弹
+            for pea in self.pea_list:  # 遍历子弹列表
+                pea.run()  # 运行子弹
+                if pea.delete:  # 如果子弹需要被删除
+                    self.pea_list.remove(pea)  # 从子弹列表中删除子弹
 
-                for cherryBomb in self.cherryBomb_list:  # 遍历樱桃炸弹列表
-                    cherryBomb.run()  # 运行樱桃炸弹
+            for cherryBomb in self.cherryBomb_list:  # 遍历樱桃炸弹列表
+                cherryBomb.run()  # 运行樱桃炸弹
 
-                for jalapeno in self.jalapeno_list:  # 遍历火爆辣椒列表
-                    jalapeno.run()  # 运行火爆辣椒
+            for jalapeno in self.jalapeno_list:  # 遍历火爆辣椒列表
+                jalapeno.run()  # 运行火爆辣椒
                 
-                for growSoil in self.growSoil_list:  # 遍历生长土壤列表
-                    growSoil.run()  # 运行生长土壤
+            for growSoil in self.growSoil_list:  # 遍历生长土壤列表
+                growSoil.run()  # 运行生长土壤
 
-                # 遍历卡片阴影列表
-                for shadow in self.card_shadow_list:
-                    # 获取当前阴影在列表中的索引位置
-                    number = self.card_shadow_list.index(shadow)
-                    # 检查卡片是否准备就绪且不能在当前网格种植
-                    if self.card[number].READY and not self.game.CheckPlant_Grid(self.card[number].name):
-                        # 运行阴影效果（显示不可用状态）
-                        shadow.run()
+            # 遍历卡片和对应的阴影
+            for card, shadow in zip(self.card, self.card_shadow_list):
+                # 卡片准备就绪但金币不足时显示阴影（不可用状态）
+                if card.READY and not card.affordable:
+                    shadow.run()
 
-                for lawnmower in self.lawnmower_list:  # 遍历草地机列表
-                    lawnmower.run()  # 运行草地机
+            for lawnmower in self.lawnmower_list:  # 遍历草地机列表
+                lawnmower.run()  # 运行草地机
 
-                for sunlight in self.sunlight_list:  # 遍历阳光列表
-                    sunlight.run()  # 运行阳光
+            for sunlight in self.sunlight_list:  # 遍历阳光列表
+                sunlight.run()  # 运行阳光
 
-                self.game.shovel.run()  # 运行铲子
+            self.game.shovel.run()  # 运行铲子
                 
-                if self.plant: # 如果正在种植
-                    self.Plant.run()  # 运行种植提示
-
-                for index in range(1, GRID_COUNT[1]) : # 遍历网格行数
-                    flag = False  # 初始化标志为False
-                    for zombie in self.zombie_list:  # 遍历僵尸列表
-                        if zombie.posY == -1: # 如果僵尸的Y位置为-1
-                            continue # 跳过此次循环
-                        if zombie.grid[1] == index:  # 如果僵尸在当前行
-                            flag = True  # 设置标志为True
-                            break  # 跳出循环
-                    self.zombiePos[index] = flag  # 更新僵尸位置列 是否有僵尸在当前行
-
-            elif self.gameover: # 如果游戏结束
-                for event in pygame.event.get():  # 获取所有事件
-                    if event.type == pygame.QUIT:  # 如果事件类型为退出
-                        os._exit(0)
+            if self.plant: # 如果正在种植
+                self.Plant.run()  # 运行种植提示
+
+            for index in range(1, self.board.rows + 1) : # 遍历网格行数
+                # 从网格索引中取得当前行的僵尸，跳过已经死亡（行号为-1）的僵尸
+                self.zombiePos[index] = any(zombie.posY != -1 for zombie in self.game.zombieCells.InRow(index))  # 更新僵尸位置列 是否有僵尸在当前行
+
+        elif self.gameover: # 如果游戏结束
+            self.recorder.Close(self.game.tick)  # 结束操作录像
+            events = pygame.event.get()  # 获取所有事件
+            self.focus.Handle(events)  # 记录窗口焦点和可见性的变化
+            for event in events:
+                if event.type == pygame.QUIT:  # 如果事件类型为退出
+                    self.Quit()
                         
-                self.screen.fill(WHITE)  # 填充屏幕为白色
-                self.background.run()  # 运行背景
-                self.game.run()  # 运行游戏核心
-
-                self.CardFrame.run()  # 运行卡片框
-                for card in self.card:
-                    card.run()  # 运行卡片
-                self.game.run()
-                self.game.shovelFrame.run()  # 运行铲子框
-                self.game.shovel.run()  # 运行铲子
-                self.gameover_text.run() # 运行游戏结束文本
+            RENDER.Begin()  # 开始记录这一帧的绘制快照（由绘制器填充白色背景）
+            self.background.run(self.board)  # 运行背景（只绘制窗口内的背景分块）
+            self.game.run()  # 运行游戏核心
 
-            self.clock.tick(self.FPS)  # 设置帧率
-            pygame.display.flip()  # 更新屏幕
+            self.CardFrame.run()  # 运行卡片框
+            for card in self.card:
+                card.run()  # 运行卡片
+            self.game.run()
+            self.game.shovelFrame.run()  # 运行铲子框
+            self.game.shovel.run()  # 运行铲子
+            self.gameover_text.run() # 运行游戏结束文本
+
+        if self.autosaveInterval and not self.gameover and self.game.tick % self.autosaveInterval == 0 and self.game.tick != self.autosaveTick:
+            self.autosaveTick = self.game.tick
+            self.autosaver.Submit(Capture(self))  # 游戏线程只复制状态，编码和写文件在后台线程完成
+        if SHOW_RENDER_STATS:  # 显示这一帧绘制和剔除的对象数量
+            RENDER.AddSurface(self.goldFont.render(f"drawn {VIEWPORT.drawn}  culled {VIEWPORT.culled}", True, (0, 0, 0)), (GAME_SIZE[0] - 240, 5))
+        snapshot = RENDER.Publish(self.game.tick)  # 发布这一帧的绘制快照
+        if self.gameover:
+            self.idle.Update(events, snapshot, RENDER.Previous())  # 游戏结束后检测画面是否静止
+        VIEWPORT.EndFrame()  # 结束这一帧的绘制统计
+        CLOCK.Advance()  # 推进动画时钟，每个逻辑帧一次
                
     def initialize_list(self): # 初始化列表
         self.zombie_list = []  # 普通僵尸列表
@@ -280,10 +373,46 @@ class Pvz:
         self.growSoil_list = []  # 生长土壤列表
         self.displayed_card_shadow_list = []  # 选择用卡片阴影列表
         self.card_shadow_list = []  # 卡片阴影列表
-        self.zombiePos = [0, 0, 0, 0, 0, 0]  # 僵尸位置列表
+        self.zombiePos = self.board.NewLaneList(0)  # 僵尸位置列表
         self.lawnmower_list = []  # 草地机列表
-        self.lawnmowerIf = [0, 0, 0, 0, 0, 0]  # 草坪机是否已出现列表
+        self.lawnmowerIf = self.board.NewLaneList(0)  # 草坪机是否已出现列表
     
+    def OnGoldChanged(self, gold):
+        """
+        金币变化时调用：重新计算每张卡片是否买得起，并重新渲染金币文字
+
+        :param gold: 新的金币数量
+        """
+        for card in self.card:
+            card.affordable = gold >= settings[card.name]["gold"]
+        self.goldText = self.goldFont.render(str(gold), True, (0, 0, 0))
+        self.goldTextRect = self.goldText.get_rect()
+        self.goldTextRect.center = (60, 75)
+
+    def RequestGold(self, gold):
+        """
+        设置窗口（tkinter 线程）修改金币时调用：只记录请求，不直接修改金币，
+        金币文字的渲染和卡片的更新都留给游戏线程在下一个逻辑帧开始时完成
+
+        :param gold: 新的金币数量
+        """
+        with self.goldLock:
+            self.pendingGold = gold
+
+    def ApplyPendingGold(self):
+        """
+        在游戏线程中应用设置窗口请求修改的金币（没有请求时什么也不做），回放时改为应用录像中这一帧的金币修改
+        """
+        if self.replayInput is not None:
+            for (gold,) in self.replayInput.Take(CMD_GOLD, self.game.tick):
+                self.game.gold = gold
+            return
+        with self.goldLock:
+            gold, self.pendingGold = self.pendingGold, None
+        if gold is not None:
+            self.recorder.Gold(self.game.tick, gold)  # 记录金币修改，回放时在同一帧应用
+            self.game.gold = gold  # 通过金币模型修改，通知卡片和金币文字
+
     def SetWindowAtTheTop(self): # 设置窗口置顶
         import ctypes
         from ctypes import wintypes
@@ -336,13 +465,25 @@ class Pvz:
         self.plantType = 0  # 种植植物类型
         self.plantName = ""  # 种植植物名称
 
-        self.gridPlant = gridPlant(self.screen)  # 创建种植提示实例
+        self.gridPlant = gridPlant(self.screen, self.board)  # 创建种植提示实例
+        self.plantFactory = PlantFactory(self.ObjectGame)  # 创建植物工厂实例
+        self.replayInput = None  # 回放时代替鼠标的操作来源（ReplayInput），为 None 时读取鼠标
+        self.recorder = InputRecorder(None, self.game.seed, self.game.level, self.game.gold)  # 操作录像，进入游戏运行界面时开始录制
+        self.autosaver = Autosaver(SAVE_PATH)  # 创建后台存档线程
+        self.autosaveInterval = AUTOSAVE_INTERVAL  # 自动存档的间隔（帧），为 0 时不自动存档
+        self.autosaveTick = 0  # 上一次自动存档的帧
         self.ChooseCardFrame = ChooseCardFrame(self.screen)  # 创建选择卡片框实例
 
         self.CardFrame = CardFrame(self.screen)  # 创建卡片框实例
         self.card = []  # 卡片实例列表
         self.displayed_card = []  # 显示卡片实例列表
 
+        self.goldFont = pygame.font.Font(None, 33)  # 金币文字字体
+        self.goldText = None  # 金币文字表面，金币变化时重新渲染
+        self.goldTextRect = None  # 金币文字位置
+        self.pendingGold = None  # 设置窗口请求修改的金币，由游戏线程在下一个逻辑帧应用
+        self.goldLock = threading.Lock()  # 保护 pendingGold，设置窗口在 tkinter 线程中写入
+
         self.gameover_text = GameOverText(self.screen)  # 创建游戏结束文本实例
         self.gameover = False  # 设置游戏结束状态
 
@@ -366,42 +507,52 @@ class Pvz:
         self.startButton = StartButton(self.screen)  # 创建开始按钮实例
         self.reallyButton = ReallyButton(self.ObjectGame)  # 创建开始按钮实例
 
-        for i in range(GRID_COUNT[1]):  # 遍历草地机列表
+        for i in range(self.board.rows):  # 遍历草地机列表
             self.lawnmower_list.append(Lawnmower(self.ObjectGame, i + 1))  # 创建草地机实例
 
-    def loading_music(self): # 加载音乐
-        # 加载背景音乐
-        self.gameMusic = pygame.mixer.Sound(settings['game']['bgm']['gameMusic'])
-        # 设置音乐参数
-        self.gameMusic.set_volume(settings['game']['bgm']['gameMusicVolume'])  # 设置音量
-
-        # 加载开始音乐
-        self.startMusic = pygame.mixer.Sound(settings['game']['bgm']['startMusic'])
-        # 设置音乐参数
-        self.startMusic.set_volume(settings['game']['bgm']['startMusicVolume'])  # 设置音量
-
-        # 加载阳光音乐
-        self.sunMusic = pygame.mixer.Sound(settings['game']['bgm']['sunlight'])
-        # 设置音乐参数
-        self.sunMusic.set_volume(settings['game']['bgm']['sunVolume'])  # 设置音量
-
-        self.cherryBombExplosionMusic = pygame.mixer.Sound(settings['cherry_bomb']['ExplosionSound'])  # 加载樱桃炸弹爆炸音效
-        self.cherryBombExplosionMusic.set_volume(settings['cherry_bomb']['ExplosionSoundVolume'])  # 设置音量
-
-        self.jalapenoExplosionMusic = pygame.mixer.Sound(settings['jalapeno']['ExplosionSound'])  # 加载火爆辣椒爆炸音效
-        self.jalapenoExplosionMusic.set_volume(settings['jalapeno']['ExplosionSoundVolume'])  # 设置音量
-
-        self.lawnmowerMusic = pygame.mixer.Sound(settings['lawnmower']['Music'])  # 加载草地机音乐
-        self.lawnmowerMusic.set_volume(settings['lawnmower']['MusicVolume'])  # 设置音量
-
-    def load(self): # 加载游戏数据
-        with open('data/save/map.json', 'r') as map:
-            map = [list(item) for item in json.loads(map)]
-        with open('data/save/gold.json', 'r') as gold:
-            gold = json.load(gold.read())
-
-    def save(self): # 保存游戏数据
-        with open('data/save/map.json', 'w') as map:
-            map.write(str(self.game.map) + '\n')
-        with open('data/save/gold.json', 'w') as gold:
-            gold.write(str(self.game.gold))
\ No newline at end of file
+    def loading_music(self): # 加载音乐（游戏处理核心不加载声音时都是不播放的 SilentSound）
+        # 加载背景音乐并设置音量
+        self.gameMusic = self.game.LoadSound(settings['game']['bgm']['gameMusic'], settings['game']['bgm']['gameMusicVolume'])
+
+        # 加载开始音乐并设置音量
+        self.startMusic = self.game.LoadSound(settings['game']['bgm']['startMusic'], settings['game']['bgm']['startMusicVolume'])
+
+        # 加载阳光音乐并设置音量
+        self.sunMusic = self.game.LoadSound(settings['game']['bgm']['sunlight'], settings['game']['bgm']['sunVolume'])
+
+        self.cherryBombExplosionMusic = self.game.LoadSound(settings['cherry_bomb']['ExplosionSound'], settings['cherry_bomb']['ExplosionSoundVolume'])  # 加载樱桃炸弹爆炸音效
+
+        self.jalapenoExplosionMusic = self.game.LoadSound(settings['jalapeno']['ExplosionSound'], settings['jalapeno']['ExplosionSoundVolume'])  # 加载火爆辣椒爆炸音效
+
+        self.lawnmowerMusic = self.game.LoadSound(settings['lawnmower']['Music'], settings['lawnmower']['MusicVolume'])  # 加载草地机音乐
+
+    def load(self, path = SAVE_PATH): # 加载游戏数据
+        """
+        从存档恢复游戏世界，已经结束的对局不会恢复
+
+        :param path: 存档路径
+        :return: 恢复成功返回 True
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            snapshot = ReadSnapshot(path)
+        except (ValueError, OSError, struct.error, zlib.error):
+            return False  # 存档损坏时开始新的对局
+        if snapshot["pvz"]["gameover"]:
+            return False
+        Restore(self, snapshot)
+        return True
+
+    def save(self, path = SAVE_PATH): # 保存游戏数据
+        """
+        把当前游戏世界保存为二进制快照，等待写入完成后返回（退出游戏前调用）
+
+        :param path: 存档路径
+        :return: 存档的字节数
+        """
+        if path != self.autosaver.path or self.autosaver.closed:  # 后台存档线程已关闭时直接写入
+            return WriteSnapshot(path, Capture(self))
+        self.autosaver.Submit(Capture(self))
+        self.autosaver.Flush()
+        return self.autosaver.lastBytes
\ No newline at end of file
@@ -0,0 +1,137 @@
+import multiprocessing  # 导入多进程库
+from data.src.Simulation import *  # 导入无界面模拟
+
+# 按行并行的无界面模拟：草坪的行被平均分给多个工作进程，每个进程常驻保存自己负责的行，
+# 每帧由主进程分发消息、收集事件。跨行影响（樱桃炸弹、游戏结束）只在帧末的屏障处交换，
+# 与单进程的 Simulation 使用同一套处理顺序，因此同一种子的结果完全相同。
+
+def _LaneWorker(connection, lanes, board):
+    """
+    工作进程主循环
+
+    :param connection: 与主进程通信的管道
+    :param lanes: 本进程负责的行 {行号: Lane}
+    :param board: 草坪
+    """
+    rows = sorted(lanes)
+    while True:
+        message = connection.recv()
+        if message[0] == "step":
+            tick, inbox = message[1], message[2]
+            events = []
+            for row in rows:
+                laneEvents = lanes[row].Step(tick, inbox.get(row, ()), board)
+                if laneEvents:
+                    events.append((row, laneEvents))
+            connection.send(events)
+        elif message[0] == "lanes":
+            connection.send(lanes)
+        elif message[0] == "count":
+            connection.send(sum(len(lanes[row].zombies) for row in rows))
+        elif message[0] == "close":
+            connection.close()
+            break
+
+class ParallelSimulation(Simulation):
+    def __init__(self, level = DEFAULT_LEVEL, seed = 0, gold = 200, autoCollectSun = False, workers = None):
+        """
+        初始化按行并行的无界面模拟，参数与 Simulation 相同
+
+        :param workers: 工作进程数量，默认使用全部CPU核心，不会超过草坪行数
+        """
+        super().__init__(level, seed, gold, autoCollectSun)
+        workers = min(workers or multiprocessing.cpu_count(), self.board.rows)
+        self.workers = []  # [(进程, 管道, 负责的行), ...]
+        rows = list(range(1, self.board.rows + 1))
+        size = (len(rows) + workers - 1) // workers
+        for index in range(workers):
+            part = rows[index * size:(index + 1) * size]
+            if not part:
+                break
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target = _LaneWorker, args = (child, {row: self.lanes[row] for row in part}, self.board), daemon = True)
+            process.start()
+            child.close()
+            self.workers.append((process, parent, part))
+        self.lanes = None  # 行数据保存在工作进程中，第一次读取 lanes 时取回
+
+    @property
+    def lanes(self):
+        """
+        各行的当前状态：第一次读取时从工作进程取回，同一帧内再次读取直接使用取回的结果。
+        取回的是副本，只能用于观察（机器人、训练环境的观察等），修改不会影响工作进程中的行
+        """
+        if self.fetched is None:
+            self.fetched = self.FetchLanes()
+        return self.fetched
+
+    @lanes.setter
+    def lanes(self, lanes):
+        self.fetched = lanes  # 创建工作进程之前保存初始的行，之后为 None 表示需要重新取回
+
+    def StepLanes(self, inbox):
+        """
+        把每行的消息发给负责的工作进程，等待全部完成（帧屏障）后按行号合并事件
+        """
+        self.fetched = None  # 各行即将改变，之前取回的状态不再有效
+        for process, connection, part in self.workers:
+            connection.send(("step", self.tick, {row: inbox[row] for row in part if inbox[row]}))
+        laneEvents = []
+        for process, connection, part in self.workers:
+            laneEvents.extend(connection.recv())  # 每个进程负责连续的行，按顺序拼接即按行号排序
+        return laneEvents
+
+    def FetchLanes(self):
+        """
+        从工作进程取回各行的当前状态（副本），用于观察或快照
+
+        :return: 与 Simulation.lanes 相同结构的列表
+        """
+        lanes = [None] * (self.board.rows + 1)
+        for process, connection, part in self.workers:
+            connection.send(("lanes",))
+        for process, connection, part in self.workers:
+            for row, lane in connection.recv().items():
+                lanes[row] = lane
+        return lanes
+
+    def Fork(self):
+        """
+        分支为单进程的 Simulation：各行从工作进程取回副本，分支独占这些副本
+
+        :return: 新的 Simulation
+        """
+        fetched = self.fetched
+        self.fetched = self.FetchLanes()  # 分支独占一份新的副本，不与 lanes 返回的副本共享
+        try:
+            fork = Simulation.Fork(self)
+        finally:
+            self.fetched = fetched
+        for lane in fork.lanes[1:]:
+            lane.shares = 0
+        return fork
+
+    def ZombieCount(self):
+        for process, connection, part in self.workers:
+            connection.send(("count",))
+        return sum(connection.recv() for process, connection, part in self.workers)
+
+    def Close(self):
+        """
+        关闭所有工作进程
+        """
+        for process, connection, part in self.workers:
+            try:
+                connection.send(("close",))
+                connection.close()
+            except (BrokenPipeError, OSError):
+                pass
+        for process, connection, part in self.workers:
+            process.join()
+        self.workers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.Close()
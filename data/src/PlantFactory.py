@@ -0,0 +1,72 @@
+from data.src.object import *  # 导入对象
+from data.src.sunflower import *  # 导入向日葵类
+from data.src.peashooter import *  # 导入豌豆射手类
+from data.src.Nut import *  # 导入坚果类
+from data.src.PotatoMine import *  # 导入土豆地雷类
+from data.src.Chomper import *  # 导入大嘴花类
+from data.src.CherryBomb import *  # 导入樱桃炸弹类
+from data.src.Jalapeno import *  # 导入火爆辣椒类
+from data.src.Squash import *  # 导入倭瓜类
+from data.src.GrowSoil import *  # 导入生长土壤类
+
+# 植物注册表：植物编号 -> (植物类, Pvz 中保存该植物的列表名)
+PLANT_REGISTRY = {}
+
+def RegisterPlant(name, plantClass, listName):
+    """
+    注册一种可种植的植物
+
+    :param name: 植物名称，必须出现在 settings["plant_name"] 中
+    :param plantClass: 植物类，构造参数为 (game, pos)
+    :param listName: Pvz 实例中保存该植物的列表属性名
+    """
+    PLANT_REGISTRY[settings["plant_name"].index(name)] = (plantClass, listName)
+
+RegisterPlant("sunflower", Sunflower, "sunflower_list")
+RegisterPlant("peashooter", Peashooter, "peashooter_list")
+RegisterPlant("nut", Nut, "nut_list")
+RegisterPlant("potato_mine", PotatoMine, "potatoMine_list")
+RegisterPlant("chomper", Chomper, "chomper_list")
+RegisterPlant("cherry_bomb", CherryBomb, "cherryBomb_list")
+RegisterPlant("jalapeno", Jalapeno, "jalapeno_list")
+RegisterPlant("squash", Squash, "squash_list")
+
+class PlantFactory:
+    def __init__(self, game):
+        """
+        初始化植物工厂
+
+        :param game: Pvz 游戏实例，植物会被添加到它的列表中
+        """
+        self.game = game
+
+    def Place(self, xy, plantType):
+        """
+        在指定屏幕坐标种植一株植物（一次网格检查，失败时不改变任何状态）
+
+        :param xy: 鼠标所在的屏幕坐标
+        :param plantType: 植物编号，对应 settings["plant_name"] 的索引
+        :return: 种植成功返回 True，否则返回 False
+        """
+        plantClass, listName = PLANT_REGISTRY[plantType]
+        name = settings["plant_name"][plantType]
+        gold = settings[name]["gold"]
+        if not self.game.game.economy.CanAfford(gold):  # 金币不足
+            return False
+        result = self.game.game.CheckAddPlant(xy, plantType)  # 检查并占用网格
+        if not result["plant"]:
+            return False
+        try:
+            plant = plantClass(self.game, result["pos"])  # 创建植物实例
+            growSoil = None
+            if name in settings["need_grow_soil_plant"]:
+                growSoil = GrowSoil(self.game, list(result["pos"]))  # 创建生长土壤实例
+        except Exception:
+            grid = self.game.game.getGrid(xy)
+            self.game.game.map.Clear(grid[0], grid[1])  # 回滚网格占用
+            raise
+        if growSoil is not None:
+            self.game.growSoil_list.append(growSoil)  # 添加生长土壤到生长土壤列表
+        getattr(self.game, listName).append(plant)  # 添加植物到对应列表
+        self.game.game.economy.Spend(gold)  # 扣除金币
+        return True
@@ -0,0 +1,144 @@
+from data.src.settings import *  # 导入设置
+
+class PlantGrid:
+    def __init__(self, columns, rows, plantTypes = None):
+        """
+        植物地图：每个网格一个字节保存植物编号（0 表示没有植物），写入时同时维护每行的占用位掩码和每种植物的数量，
+        “某行有没有豌豆射手”“某行第一个空格”之类的查询不需要遍历网格
+
+        :param columns: 列数
+        :param rows: 行数
+        :param plantTypes: 植物编号的个数（包括 0），默认为 settings["plant_name"] 的长度
+        """
+        self.columns = columns  # 列数
+        self.rows = rows  # 行数
+        self.plantTypes = plantTypes if plantTypes is not None else len(settings["plant_name"])
+        self.full = (1 << columns) - 1  # 一整行都被占用时的位掩码
+        self.cells = bytearray(columns * rows)  # 按行保存的植物编号，第 row 行第 column 列在 (row - 1) * columns + column - 1
+        self.laneMasks = [0] * (rows + 1)  # 每行被占用网格的位掩码，第 column 列对应第 column - 1 位，索引 0 为占位
+        self.typeMasks = [[0] * (rows + 1) for _ in range(self.plantTypes)]  # typeMasks[植物编号][行]：该植物占用的网格的位掩码
+        self.counts = [0] * self.plantTypes  # 每种植物的数量
+
+    def Get(self, column, row):
+        """
+        获取网格中的植物编号，草坪外的网格返回 0
+
+        :param column: 列，从 1 开始
+        :param row: 行，从 1 开始
+        """
+        if 1 <= column <= self.columns and 1 <= row <= self.rows:
+            return self.cells[(row - 1) * self.columns + column - 1]
+        return 0
+
+    def Set(self, column, row, plantType):
+        """
+        设置网格中的植物编号，同时更新位掩码和数量；草坪外的网格忽略
+
+        :param column: 列，从 1 开始
+        :param row: 行，从 1 开始
+        :param plantType: 植物编号，0 表示清空
+        """
+        if not (1 <= column <= self.columns and 1 <= row <= self.rows):
+            return
+        index = (row - 1) * self.columns + column - 1
+        old = self.cells[index]
+        if old == plantType:
+            return
+        bit = 1 << (column - 1)
+        if old:
+            self.typeMasks[old][row] &= ~bit
+            self.counts[old] -= 1
+        if plantType:
+            self.typeMasks[plantType][row] |= bit
+            self.counts[plantType] += 1
+            self.laneMasks[row] |= bit
+        else:
+            self.laneMasks[row] &= ~bit
+        self.cells[index] = plantType
+
+    def Clear(self, column, row):
+        """
+        清空网格
+        """
+        self.Set(column, row, 0)
+
+    def IsFree(self, column, row):
+        """
+        检查网格是否在草坪内且没有植物
+        """
+        return 1 <= column <= self.columns and 1 <= row <= self.rows and not self.laneMasks[row] >> (column - 1) & 1
+
+    def Count(self, plantType):
+        """
+        某种植物在整个草坪上的数量
+        """
+        return self.counts[plantType]
+
+    def LaneCount(self, plantType, row):
+        """
+        某种植物在一行中的数量
+        """
+        return bin(self.typeMasks[plantType][row]).count("1")
+
+    def LanesWith(self, plantType):
+        """
+        有某种植物的行
+
+        :return: 行号列表
+        """
+        masks = self.typeMasks[plantType]
+        return [row for row in range(1, self.rows + 1) if masks[row]]
+
+    def FirstFree(self, row, start = 1):
+        """
+        一行中从 start 列开始的第一个空格
+
+        :return: 列号，没有空格时返回 0
+        """
+        free = ~self.laneMasks[row] & self.full & ~((1 << (start - 1)) - 1)
+        return (free & -free).bit_length()
+
+    def Copy(self):
+        """
+        复制地图，之后与原地图互不影响
+        """
+        grid = PlantGrid.__new__(PlantGrid)
+        grid.columns = self.columns
+        grid.rows = self.rows
+        grid.plantTypes = self.plantTypes
+        grid.full = self.full
+        grid.cells = bytearray(self.cells)
+        grid.laneMasks = list(self.laneMasks)
+        grid.typeMasks = [list(masks) for masks in self.typeMasks]
+        grid.counts = list(self.counts)
+        return grid
+
+    def ToList(self):
+        """
+        按行展开的植物编号列表，用于保存
+        """
+        return list(self.cells)
+
+    def Load(self, values):
+        """
+        从 ToList 的结果恢复，重新计算位掩码和数量
+        """
+        self.cells[:] = bytes(len(self.cells))  # 原地清空，已经取得的 AsArray 视图仍然有效
+        self.laneMasks = [0] * (self.rows + 1)
+        self.typeMasks = [[0] * (self.rows + 1) for _ in range(self.plantTypes)]
+        self.counts = [0] * self.plantTypes
+        for index, plantType in enumerate(values):
+            if plantType:
+                row, column = divmod(index, self.columns)
+                self.Set(column + 1, row + 1, plantType)
+
+    def AsArray(self):
+        """
+        以 NumPy 数组的形式查看地图（不复制，形状为 (行数, 列数)，类型为 uint8），需要安装 NumPy。
+        数组与地图共享内存，只应该用于读取，修改请使用 Set
+        """
+        import numpy  # 只有需要数组时才导入NumPy
+        return numpy.frombuffer(self.cells, dtype = numpy.uint8).reshape(self.rows, self.columns)
+
+    def __repr__(self):
+        return "\n".join(" ".join(str(value) for value in self.cells[row * self.columns:(row + 1) * self.columns]) for row in range(self.rows))
@@ -1,6 +1,8 @@
 from data.src.object import * # 导入对象
 
 class PotatoMine(Object):  # 定义PotatoMine类，继承自Object类
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, game, pos):  # 初始化函数
         self.plantType = 'potato_mine'
         self.game = game
@@ -11,16 +13,15 @@ class PotatoMine(Object):  # 定义PotatoMine类，继承自Object类
         self.Explosion = False
         self.grow = False
         self.growTime = 0
-        self.updateGrid(self.pos)
+        self.grid = game.board.CellAt(pos)  # 种植的网格
         self.ExplosionTime = 0
         self.delete = False
+        self.SetMachine(self.plantType)  # 生长中 -> 已生长 -> 爆炸
 
     def run(self):  # 运行函数
         self.update()  # 更新图片
         if self.Explosion and self.ExplosionTime == 0:  # 如果PotatoMine爆炸
-            self.path = settings['potato_mine']['ExplosionPath']  # 更新图片路径
-            self.imageIndex = 0
-            self.imageCount = settings['potato_mine']['ExplosionImageCount']
+            self.Trigger("explode")  # 进入爆炸状态
             self.update()  # 更新图片
             self.ExplosionTime += 1  # 增加爆炸时间
 
@@ -33,9 +34,7 @@ class PotatoMine(Object):  # 定义PotatoMine类，继承自Object类
             self.growTime += 1  # 增加生长时间
             if self.growTime >= settings['potato_mine']['growTime']:  # 如果生长时间达到设定值
                 self.grow = True  # 设置为已经生长
-                self.path = settings['potato_mine']['path']  # 更新图片路径
-                self.imageIndex = 0
-                self.imageCount = settings['potato_mine']['imageCount']
-                self.update()  # 更新图片
+                if self.Trigger("grow"):  # 进入已生长状态（已经爆炸时不再切换）
+                    self.update()  # 更新图片
         
         self.draw()  # 绘制图片
\ No newline at end of file
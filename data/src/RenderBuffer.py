@@ -0,0 +1,115 @@
+import threading # 导入threading库
+import time # 导入time库
+from collections import namedtuple  # 导入命名元组，快照中的数据都不可修改
+from data.src.const import *  # 导入常量
+from data.src.Viewport import *  # 导入摄像机
+
+# 一个要绘制的图片：对象编号、动画片段、帧索引、图片、左上角坐标、是否为世界坐标（绘制时减去摄像机位置）
+RenderItem = namedtuple("RenderItem", ["id", "clip", "frame", "image", "x", "y", "world"])
+# 摄像机在这一帧的位置和窗口大小（与 Viewport 有相同的 x、y、width、height，可以直接交给 BackgroundTiles.Draw）
+Camera = namedtuple("Camera", ["x", "y", "width", "height"])
+# 一帧的绘制快照：序号、游戏帧数、发布的时间（time.perf_counter）、摄像机、背景分块、按绘制顺序排列的图片
+RenderSnapshot = namedtuple("RenderSnapshot", ["sequence", "tick", "time", "camera", "background", "items"])
+
+def SameImage(snapshot, other):
+    """
+    两份快照画出的画面是否相同：摄像机和背景相同，并且按同样的顺序把同样的图片画在同样的位置
+
+    :return: 相同返回 True，任一快照为 None 时返回 False
+    """
+    if snapshot is None or other is None or snapshot.camera != other.camera or snapshot.background is not other.background \
+            or len(snapshot.items) != len(other.items):
+        return False
+    return all(item.image is old.image and item.x == old.x and item.y == old.y and item.world == old.world
+               for item, old in zip(snapshot.items, other.items))
+
+class RenderBuffer:
+    def __init__(self):
+        """
+        绘制快照的双缓冲：游戏逻辑每帧把要绘制的内容记录为一份不可修改的快照，写入后缓冲后与前缓冲交换；
+        绘制（同一线程或单独的绘制线程）只读取前缓冲中最新的完整快照，绘制慢时不会拖慢游戏逻辑，
+        逻辑卡顿时也不会画出只更新了一半的画面。后缓冲保留上一份快照
+        """
+        self.condition = threading.Condition()
+        self.slots = [None, None]  # 两份快照
+        self.front = 0  # 最新快照所在的位置
+        self.sequence = 0  # 已经发布的快照数量
+        self.building = False  # 是否正在记录这一帧（为 False 时对象直接绘制到窗口，例如无界面测试）
+        self.items = []  # 这一帧已经记录的图片
+        self.background = None  # 这一帧的背景分块
+
+    def Begin(self):
+        """
+        开始记录一帧：之后对象的 draw 只记录图片，不绘制到窗口
+        """
+        self.building = True
+        self.items = []
+        self.background = None
+
+    def Add(self, entityId, clip, frame, image, x, y, world):
+        """
+        记录一个对象的图片（参数与 RenderItem 的字段相同）
+        """
+        self.items.append(RenderItem(entityId, clip, frame, image, x, y, world))
+
+    def AddSurface(self, image, pos):
+        """
+        记录一个界面图片（例如金币文字），按窗口坐标绘制
+
+        :param image: 图片，记录后不能再修改
+        :param pos: 左上角的窗口坐标
+        """
+        self.items.append(RenderItem(None, None, 0, image, pos[0], pos[1], False))
+
+    def SetBackground(self, tiles):
+        """
+        记录这一帧的背景分块（BackgroundTiles），绘制时先画背景
+        """
+        self.background = tiles
+
+    def Publish(self, tick = 0):
+        """
+        结束记录，把这一帧的快照写入后缓冲并与前缓冲交换
+
+        :param tick: 游戏帧数
+        :return: 发布的快照
+        """
+        snapshot = RenderSnapshot(self.sequence + 1, tick, time.perf_counter(), Camera(VIEWPORT.x, VIEWPORT.y, VIEWPORT.width, VIEWPORT.height),
+                                  self.background, tuple(self.items))
+        self.building = False
+        self.items = []
+        with self.condition:
+            back = 1 - self.front
+            self.slots[back] = snapshot
+            self.front = back
+            self.sequence = snapshot.sequence
+            self.condition.notify_all()
+        return snapshot
+
+    def Latest(self):
+        """
+        获取最新的快照，还没有发布时返回 None
+        """
+        with self.condition:
+            return self.slots[self.front]
+
+    def Previous(self):
+        """
+        获取最新快照的上一份快照，没有时返回 None
+        """
+        with self.condition:
+            return self.slots[1 - self.front]
+
+    def Wait(self, sequence, timeout = None):
+        """
+        等待序号大于 sequence 的快照
+
+        :param sequence: 已经处理过的快照序号
+        :param timeout: 超时（秒），为 None 时一直等待
+        :return: 最新的快照，超时时可能是已经处理过的快照
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.sequence > sequence, timeout)
+            return self.slots[self.front]
+
+RENDER = RenderBuffer()  # 游戏窗口的绘制快照
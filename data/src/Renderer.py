@@ -0,0 +1,134 @@
+import pygame # 导入pygame库
+import threading # 导入threading库
+import time # 导入time库
+from data.src.const import *  # 导入常量
+from data.src.RenderBuffer import *  # 导入绘制快照的双缓冲
+
+class Renderer:
+    def __init__(self, screen, buffer = RENDER, threaded = RENDER_THREAD, interpolate = INTERPOLATE):
+        """
+        绘制器：读取双缓冲中最新的快照，绘制到窗口并刷新。
+        threaded 为 False 时由帧循环在每帧结束时调用 Present；为 True 时在单独的线程中绘制，
+        帧循环只发布快照，不再等待绘制和刷新。
+        interpolate 为 True 时在最近两份快照之间按比例插值世界中对象的位置（和摄像机位置），
+        游戏逻辑按固定的 DEFAULT_FPS 运行，窗口按任意帧率绘制时移动也是平滑的
+
+        :param screen: 窗口
+        :param buffer: 绘制快照的双缓冲
+        :param threaded: 是否使用单独的绘制线程
+        :param interpolate: 是否在两份快照之间插值
+        """
+        self.screen = screen
+        self.buffer = buffer
+        self.threaded = threaded
+        self.interpolate = interpolate
+        self.fps = DEFAULT_FPS  # 绘制线程的帧率（同一线程绘制时由帧循环控制帧率）
+        self.presented = 0  # 已经绘制的快照序号
+        self.alpha = 1.0  # 上一次绘制时的插值比例
+        self.frames = 0  # 已经绘制的帧数
+        self.skipped = 0  # 画面与上一次绘制相同而跳过的帧数
+        self.shown = None  # 上一次绘制的快照
+        self.visible = True  # 是否需要绘制（窗口最小化等情况下为 False）
+        self.running = threaded  # 绘制线程是否继续运行
+        self.thread = None
+        if threaded:
+            self.thread = threading.Thread(target = self.Worker, name = "Renderer", daemon = True)
+            self.thread.start()
+
+    def Draw(self, snapshot, previous = None, alpha = 1.0):
+        """
+        把一份快照绘制到窗口（不刷新）：先画背景分块，再按顺序画图片，世界坐标的图片减去摄像机位置
+
+        :param snapshot: 绘制快照
+        :param previous: 上一份快照，为 None 时不插值
+        :param alpha: 插值比例，0 为上一份快照的位置，1 为这一份快照的位置
+        """
+        screen = self.screen
+        camera = snapshot.camera
+        positions = None  # 上一份快照中世界对象的位置，对象编号 -> (x, y)
+        if previous is not None and alpha < 1:
+            old = previous.camera
+            camera = Camera(round(old.x + (camera.x - old.x) * alpha), round(old.y + (camera.y - old.y) * alpha), camera.width, camera.height)
+            positions = {item.id: (item.x, item.y) for item in previous.items if item.world}
+        screen.fill(WHITE)  # 填充屏幕为白色
+        if snapshot.background is not None:
+            snapshot.background.Draw(screen, camera)  # 只绘制窗口内的背景分块
+        for item in snapshot.items:
+            if item.world:
+                x, y = item.x, item.y
+                if positions is not None:
+                    old = positions.get(item.id)
+                    # 新出现的对象和一帧内跳得很远的对象（例如被火爆辣椒烧死后移走）不插值
+                    if old is not None and abs(x - old[0]) + abs(y - old[1]) <= INTERPOLATE_MAX_DISTANCE:
+                        x = old[0] + (x - old[0]) * alpha
+                        y = old[1] + (y - old[1]) * alpha
+                screen.blit(item.image, (round(x) - camera.x, round(y) - camera.y))
+            else:
+                screen.blit(item.image, (item.x, item.y))  # 界面按窗口坐标绘制，不插值
+
+    def Present(self, alpha = 1.0):
+        """
+        同一线程绘制时每帧调用：有新的快照（或者插值比例变化）时绘制并刷新窗口
+
+        :param alpha: 插值比例，帧循环中为累积的时间不足一个逻辑帧的部分除以逻辑帧的时长
+        :return: 绘制了返回 True
+        """
+        if self.threaded or not self.visible:
+            return False  # 由绘制线程负责，或者不需要绘制
+        snapshot = self.buffer.Latest()
+        if not self.interpolate:
+            alpha = 1.0
+        if snapshot is None or (snapshot.sequence == self.presented and alpha == self.alpha):
+            return False
+        self.Show(snapshot, alpha)
+        return True
+
+    def Show(self, snapshot, alpha = 1.0):
+        """
+        绘制快照并刷新窗口，与上一次绘制的画面相同时跳过
+        """
+        previous = self.buffer.Previous() if alpha < 1 else None
+        if previous is not None and SameImage(previous, snapshot):
+            previous, alpha = None, 1.0  # 两份快照的画面相同，插值不改变画面
+        if alpha >= 1 and self.alpha >= 1 and SameImage(snapshot, self.shown):
+            self.presented = snapshot.sequence
+            self.skipped += 1
+            return
+        self.Draw(snapshot, previous, alpha)
+        self.shown = snapshot
+        pygame.display.flip()  # 更新屏幕
+        self.presented = snapshot.sequence
+        self.alpha = alpha
+        self.frames += 1
+
+    def Invalidate(self):
+        """
+        窗口内容可能已经丢失（例如窗口被遮住后重新显示），下一次必须重画
+        """
+        self.shown = None
+        self.presented = 0
+
+    def Worker(self):
+        clock = pygame.time.Clock()
+        while self.running:
+            if not self.visible:
+                time.sleep(0.1)  # 不需要绘制时定时醒来检查
+                continue
+            if not self.interpolate:
+                snapshot = self.buffer.Wait(self.presented, 0.1)  # 定时醒来检查是否需要结束
+                if snapshot is not None and snapshot.sequence != self.presented:
+                    self.Show(snapshot)
+                continue
+            snapshot = self.buffer.Latest()
+            if snapshot is not None:
+                # 按这份快照发布后经过的时间插值，发布后经过一个逻辑帧时到达这份快照的位置
+                self.Show(snapshot, min(1.0, (time.perf_counter() - snapshot.time) * DEFAULT_FPS))
+            clock.tick(self.fps)
+
+    def Close(self, timeout = None):
+        """
+        结束绘制线程
+        """
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout)
@@ -0,0 +1,322 @@
+import os  # 导入os库
+import sys  # 导入sys库
+import json  # 导入json库
+import time  # 导入time库
+import struct  # 导入二进制打包库
+import argparse  # 导入命令行参数库
+from data.src.Simulation import *  # 导入无界面模拟
+
+# 操作录像：记录种子、设置哈希和玩家的每个操作（选卡、种植、铲除、点击阳光、修改金币）及其帧数，
+# 保存为紧凑的二进制文件；回放时不打开窗口，用与游戏完全相同的代码（Pvz.Step）以最快速度重新运行，并找出最慢的帧。
+# 回放方法（在项目根目录）：python -m data.src.Replay data/replay/xxx.pvzr
+
+REPLAY_MAGIC = b"PVZR"  # 文件头标识
+REPLAY_VERSION = 3  # 文件格式版本（2: 增加修改金币和选中的卡片，回放改为运行真实的游戏；3: 从存档继续的对局保存开始时的快照）
+HEADER = struct.Struct("<4sBII20sBI")  # 标识, 版本, 种子, 初始金币, 设置哈希, 对局信息长度, 快照长度（后接对局信息的 JSON 和存档快照）
+COMMAND = struct.Struct("<HB")  # 与上一个操作相差的帧数, 操作类型
+
+CMD_WAIT = 0  # 帧数差超过 65535 时的占位
+CMD_CARD = 1  # 选择卡片：植物编号
+CMD_PLACE = 2  # 种植：植物编号, 列, 行
+CMD_SHOVEL = 3  # 铲除：列, 行
+CMD_SUN = 4  # 点击阳光：屏幕横坐标, 纵坐标
+CMD_SLOW = 5  # 游戏中出现的慢帧：耗时（毫秒）
+CMD_END = 6  # 录像结束
+CMD_GOLD = 7  # 设置窗口修改金币：新的金币数量
+PAYLOAD = {
+    CMD_WAIT: struct.Struct("<"),
+    CMD_CARD: struct.Struct("<B"),
+    CMD_PLACE: struct.Struct("<BBB"),
+    CMD_SHOVEL: struct.Struct("<BB"),
+    CMD_SUN: struct.Struct("<HH"),
+    CMD_SLOW: struct.Struct("<H"),
+    CMD_END: struct.Struct("<"),
+    CMD_GOLD: struct.Struct("<I"),
+}
+COMMAND_NAME = {CMD_WAIT: "wait", CMD_CARD: "card", CMD_PLACE: "place", CMD_SHOVEL: "shovel", CMD_SUN: "sun", CMD_SLOW: "slow", CMD_END: "end",
+                CMD_GOLD: "gold"}
+
+def SettingsDigest():
+    """
+    当前设置的哈希值（20字节），回放时用于检查设置是否被修改
+    """
+    return bytes.fromhex(ConfigHash(settings))
+
+class InputRecorder:
+    def __init__(self, path, seed, level = DEFAULT_LEVEL, gold = 200, cards = (), tick = 0, snapshot = b""):
+        """
+        创建操作录像文件并写入文件头
+
+        :param path: 录像文件路径，为 None 时不录制
+        :param seed: 僵尸出生时间线的随机种子
+        :param level: 关卡编号
+        :param gold: 初始金币
+        :param cards: 选中的植物名称列表
+        :param tick: 开始录制的帧（从存档继续的对局不是 0）
+        :param snapshot: 开始录制时游戏状态的存档快照（Encode 的结果），从第 0 帧开始时为空
+        """
+        self.path = path
+        self.lastTick = tick  # 上一个操作的帧数
+        self.file = None
+        if path is None:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+        self.file = open(path, "wb")
+        info = json.dumps({"level": level, "cards": list(cards), "tick": tick}).encode("utf-8")
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, gold, SettingsDigest(), len(info), len(snapshot)) + info + snapshot)
+        self.file.flush()
+
+    def Write(self, tick, code, *args):
+        """
+        写入一个操作，立即刷新到磁盘，游戏异常退出时录像也是完整的
+
+        :param tick: 操作发生的帧
+        :param code: 操作类型 CMD_*
+        :param args: 操作参数
+        """
+        if self.file is None:
+            return
+        delta = max(0, tick - self.lastTick)
+        data = b""
+        while delta > 0xFFFF:
+            data += COMMAND.pack(0xFFFF, CMD_WAIT)
+            delta -= 0xFFFF
+        self.file.write(data + COMMAND.pack(delta, code) + PAYLOAD[code].pack(*args))
+        self.file.flush()
+        self.lastTick = max(tick, self.lastTick)
+
+    def Card(self, tick, plantType):
+        self.Write(tick, CMD_CARD, plantType)
+
+    def Place(self, tick, plantType, column, row):
+        self.Write(tick, CMD_PLACE, plantType, column, row)
+
+    def Shovel(self, tick, column, row):
+        self.Write(tick, CMD_SHOVEL, column, row)
+
+    def Sun(self, tick, x, y):
+        self.Write(tick, CMD_SUN, max(0, min(int(x), 0xFFFF)), max(0, min(int(y), 0xFFFF)))
+
+    def Gold(self, tick, gold):
+        self.Write(tick, CMD_GOLD, max(0, min(int(gold), 0xFFFFFFFF)))
+
+    def SlowFrame(self, tick, milliseconds):
+        self.Write(tick, CMD_SLOW, min(int(milliseconds), 0xFFFF))
+
+    def Close(self, tick):
+        """
+        写入结束标记并关闭文件
+        """
+        if self.file is None:
+            return
+        self.Write(tick, CMD_END)
+        self.file.close()
+        self.file = None
+
+def ReadReplay(path):
+    """
+    读取录像文件
+
+    :param path: 录像文件路径
+    :return: (文件头字典, [(帧, 操作类型, 参数元组), ...])
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    magic, version, seed, gold, digest, infoLength, snapshotLength = HEADER.unpack_from(data, 0)
+    if magic != REPLAY_MAGIC:
+        raise ValueError(f"{path} 不是录像文件")
+    if version != REPLAY_VERSION:
+        raise ValueError(f"不支持的录像版本 {version}")
+    offset = HEADER.size
+    info = json.loads(data[offset:offset + infoLength].decode("utf-8"))
+    offset += infoLength
+    header = {"seed": seed, "gold": gold, "settingsHash": digest.hex(), "level": info["level"], "cards": info["cards"],
+              "tick": info["tick"], "snapshot": data[offset:offset + snapshotLength]}
+    offset += snapshotLength
+    commands = []
+    tick = info["tick"]
+    while offset + COMMAND.size <= len(data):
+        delta, code = COMMAND.unpack_from(data, offset)
+        offset += COMMAND.size
+        payload = PAYLOAD[code]
+        if offset + payload.size > len(data):
+            break  # 游戏异常退出时最后一个操作可能不完整
+        args = payload.unpack_from(data, offset)
+        offset += payload.size
+        tick += delta
+        if code != CMD_WAIT:
+            commands.append((tick, code, args))
+    return header, commands
+
+class ReplayInput:
+    def __init__(self, commands):
+        """
+        回放时代替鼠标的操作来源：游戏在录制每种操作的同一位置，按 (操作类型, 帧) 取出录像中的操作
+
+        :param commands: ReadReplay 读出的操作列表
+        """
+        self.pending = {}  # (操作类型, 帧) -> [参数元组, ...]
+        for tick, code, args in commands:
+            self.pending.setdefault((code, tick), []).append(args)
+
+    def Take(self, code, tick):
+        """
+        取出某一帧的某种操作
+
+        :param code: 操作类型 CMD_*
+        :param tick: 帧
+        :return: 参数元组的列表，没有时为空
+        """
+        return self.pending.pop((code, tick), ())
+
+def HeadlessGame(level, seed, gold, cards, path = None, snapshot = b""):
+    """
+    创建不打开窗口、不播放声音的游戏，直接进入游戏运行界面，之后由调用者逐帧调用 Step。
+    除了跳过开始界面和选卡界面，运行的代码与玩家的游戏完全相同；不加载声音文件（使用 SilentSound），也不自动存档，不会覆盖玩家的存档
+
+    :param level: 关卡编号
+    :param seed: 僵尸出生时间线的随机种子
+    :param gold: 初始金币
+    :param cards: 选中的植物名称列表
+    :param path: 操作录像路径，为 None 时不录制
+    :param snapshot: 存档快照（Encode 的结果），不为空时从快照的状态开始（关卡、种子、金币和卡片都来自快照）
+    :return: Pvz 实例
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # 不打开窗口
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # 不播放声音
+    import pygame  # 只有运行游戏时才导入pygame
+    import data.src.PVZ as PVZ  # 游戏导入了本模块，只在这里导入游戏（同时导入存档快照）
+    PVZ.RECORD_REPLAY = False  # 录像由下面的 InputRecorder 写入
+    pvz = PVZ.Pvz()
+    pygame.init()
+    pvz.screen = pygame.display.set_mode(GAME_SIZE)
+    pvz.FPS = DEFAULT_FPS
+    pvz.renderer = PVZ.Renderer(pvz.screen, PVZ.RENDER, False)
+    pvz.idle = PVZ.IdleFrames(pvz.renderer, 0)
+    pvz.focus = PVZ.WindowFocus(pvz.renderer)
+    pvz.game = PVZ.Game(pvz, level, seed, sound = False)
+    pvz.board = pvz.game.board
+    pvz.ObjectGame = pvz
+    pvz.loading_music()
+    PVZ.PreloadAnimations()
+    pvz.initialize_list()
+    pvz.initialize_instance()
+    pvz.autosaver.Close()  # 结束后台存档线程，save() 改为直接写入
+    pvz.autosaveInterval = 0
+    pvz.selectedCard = [PVZ.DisplayedSelectedCard(pvz.screen, name, index + 1) for index, name in enumerate(cards)]
+    pvz.running = pvz.really = True
+    if snapshot:
+        PVZ.Restore(pvz, PVZ.Decode(snapshot))  # 恢复游戏世界和卡片
+    else:
+        pvz.game.gold = gold
+    pvz.BeginRun()
+    pvz.recorder = InputRecorder(path, pvz.game.seed, pvz.game.level, pvz.game.gold, [card.name for card in pvz.card], pvz.game.tick, snapshot)
+    return pvz
+
+class Replayer:
+    def __init__(self, path):
+        """
+        加载录像，并创建相同关卡、种子和初始金币的无窗口游戏，录像中的操作在录制时的同一位置交给游戏。
+        点击阳光使用游戏本身的点击检测，点击位置没有阳光时（例如录制后设置被修改）这次点击不起作用
+
+        :param path: 录像文件路径
+        """
+        self.header, self.commands = ReadReplay(path)
+        self.settingsChanged = self.header["settingsHash"] != SettingsDigest().hex()  # 录制后设置被修改时回放结果可能不同
+        self.pvz = HeadlessGame(self.header["level"], self.header["seed"], self.header["gold"], self.header["cards"],
+                                snapshot = self.header["snapshot"])
+        self.pvz.replayInput = ReplayInput(self.commands)
+        self.endTick = self.commands[-1][0] if self.commands else self.header["tick"]  # 最后一个操作的帧
+        self.slowFrames = [(tick, args[0]) for tick, code, args in self.commands if code == CMD_SLOW]  # 游戏中记录的慢帧
+        self.tickTimes = []  # 回放中每帧的耗时 [(帧, 秒), ...]
+
+    def Run(self, ticks = None, timing = False, profileTicks = None, profiler = None):
+        """
+        以最快速度回放
+
+        :param ticks: 回放的帧数，默认回放到最后一个操作
+        :param timing: 是否记录每帧的耗时
+        :param profileTicks: 需要分析的帧集合，只在这些帧启用 profiler
+        :param profiler: cProfile.Profile 实例
+        :return: 回放结果，见 Result
+        """
+        pvz = self.pvz
+        ticks = self.endTick if ticks is None else ticks
+        while pvz.game.tick < ticks and not pvz.gameover:
+            profiling = profiler is not None and profileTicks and pvz.game.tick + 1 in profileTicks
+            if profiling:
+                profiler.enable()
+            if timing:
+                start = time.perf_counter()
+                pvz.Step()
+                self.tickTimes.append((pvz.game.tick, time.perf_counter() - start))
+            else:
+                pvz.Step()
+            if profiling:
+                profiler.disable()
+        return self.Result()
+
+    def Result(self):
+        """
+        回放结果：帧数、是否结束、金币和每种实体的数量
+        """
+        from data.src.Snapshot import ENTITY_LISTS  # 存档模块导入了游戏，只在这里导入
+        pvz = self.pvz
+        return {"tick": pvz.game.tick, "gameover": pvz.gameover, "gold": pvz.game.gold,
+                "entities": {name: len(getattr(pvz, name)) for name in ENTITY_LISTS}}
+
+    def SlowestTicks(self, count = 10):
+        """
+        回放中最慢的几帧
+
+        :return: [(帧, 秒), ...]，从慢到快
+        """
+        return sorted(self.tickTimes, key = lambda item: item[1], reverse = True)[:count]
+
+def main():
+    parser = argparse.ArgumentParser(description = "以最快速度回放操作录像")
+    parser.add_argument("path", help = "录像文件路径")
+    parser.add_argument("-t", "--ticks", type = int, default = None, help = "回放的帧数，默认回放到最后一个操作")
+    parser.add_argument("--top", type = int, default = 10, help = "显示最慢的帧数")
+    parser.add_argument("--profile-slow", action = "store_true", help = "用 cProfile 分析游戏中记录的慢帧（前后各 window 帧）")
+    parser.add_argument("--window", type = int, default = 2, help = "分析慢帧时包括的前后帧数")
+    parser.add_argument("--list", action = "store_true", help = "列出录像中的所有操作")
+    args = parser.parse_args()
+
+    replayer = Replayer(args.path)
+    print(f"关卡 {replayer.header['level']}  种子 {replayer.header['seed']}  操作 {len(replayer.commands)} 个  最后操作帧 {replayer.endTick}")
+    if replayer.header["snapshot"]:
+        print(f"从存档继续的对局，从第 {replayer.header['tick']} 帧开始回放")
+    if args.list:
+        for tick, code, commandArgs in replayer.commands:
+            print(f"  帧 {tick}: {COMMAND_NAME[code]} {' '.join(map(str, commandArgs))}")
+    if replayer.settingsChanged:
+        print("警告：录制后设置已被修改，回放结果可能与录制时不同", file = sys.stderr)
+    profiler = None
+    profileTicks = set()
+    if args.profile_slow and replayer.slowFrames:
+        import cProfile  # 导入性能分析库
+        profiler = cProfile.Profile()
+        for tick, milliseconds in replayer.slowFrames:
+            profileTicks.update(range(tick - args.window, tick + args.window + 1))
+    start = time.perf_counter()
+    result = replayer.Run(args.ticks, timing = True, profileTicks = profileTicks, profiler = profiler)
+    cost = time.perf_counter() - start
+    ticks = result["tick"] - replayer.header["tick"]  # 回放的帧数
+    print(f"回放 {ticks} 帧用时 {cost:.2f}s（{ticks / max(cost, 1e-9):.0f} 帧/秒，约为实时的 {ticks / DEFAULT_FPS / max(cost, 1e-9):.0f} 倍）")
+    print(json.dumps(result, ensure_ascii = False))
+    print("回放中最慢的帧：")
+    for tick, seconds in replayer.SlowestTicks(args.top):
+        print(f"  帧 {tick}: {seconds * 1000:.3f}ms")
+    if replayer.slowFrames:
+        print("游戏中记录的慢帧：")
+        for tick, milliseconds in replayer.slowFrames[:args.top]:
+            print(f"  帧 {tick}: {milliseconds}ms")
+    if profiler is not None:
+        import pstats  # 导入性能分析统计库
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+
+if __name__ == '__main__':
+    main()
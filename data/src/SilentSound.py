@@ -0,0 +1,22 @@
+class SilentSound:
+    def __init__(self, path = None):
+        """
+        不播放的声音，接口与 pygame.mixer.Sound 中游戏用到的部分相同。
+        无窗口运行的游戏（回放、检查脚本）用它代替声音，不需要声音文件，也不需要音频设备
+
+        :param path: 声音文件路径，只保存不读取
+        """
+        self.path = path
+        self.volume = 1.0
+
+    def play(self, loops = 0, maxtime = 0, fade_ms = 0):
+        return None
+
+    def stop(self):
+        pass
+
+    def set_volume(self, value):
+        self.volume = value
+
+    def get_volume(self):
+        return self.volume
@@ -0,0 +1,624 @@
+import random  # 导入random库
+import math  # 导入数学计算库
+import json  # 导入json库
+import hashlib  # 导入哈希库
+from data.src.const import *  # 导入常量
+from data.src.settings import *  # 导入设置
+from data.src.Board import *  # 导入草坪类
+from data.src.WaveScheduler import *  # 导入僵尸出生调度器
+
+# 无界面模拟：按帧推进与游戏相同的规则，不依赖pygame、图片和声音，
+# 用于压力测试、批量对局和机器人。所有随机数都来自种子，同一种子结果完全相同。
+# 这里的规则是游戏规则的另一份实现，以下部分是近似的，修改游戏规则时需要同步修改这里：
+#   - 僵尸只有一个横坐标：碰撞按横坐标和植物的碰撞宽度判断，而不是按图片的矩形；
+#   - 僵尸的移动、啃食和植物的射击、产生阳光都按帧数计时，不播放动画，也没有死亡动画（被消灭时立即移除）；
+#   - 阳光出现后即可收集，不模拟下落；种植的植物在下一帧才出现在对应行；
+#   - 天降阳光的位置使用独立的随机数生成器，与游戏中的位置不同。
+# benchmarks/simulation_fidelity.py 用同一个种子和脚本比较无界面模拟与真实的游戏，修改规则后运行它检查两边是否仍然一致。
+
+def SecondsToTicks(seconds):
+    """
+    将秒数换算为帧数（按默认帧率）
+
+    :param seconds: 秒数
+    :return: 帧数，至少为 1
+    """
+    return max(1, round(seconds * DEFAULT_FPS))
+
+ZOMBIE_MOVE_TICKS = SecondsToTicks(0.1)  # 僵尸每移动1像素所需的帧数
+PEA_SPEED = 8  # 豌豆每帧移动的像素
+LAWNMOWER_DELETE_OFFSET = GAME_SIZE[0] - GRID_RIGHT_X  # 草地机驶出草坪右边界多远后删除
+SUN_VALUE = 25  # 每个阳光的金币数
+SHOVEL_PLANT = ("sunflower", "peashooter", "nut", "chomper")  # 可以被铲子铲除的植物
+
+def _FrameTicks(name):
+    return SecondsToTicks(settings["game"]["plantPreIndexTimeNumber"][name])
+
+def _BuildPlantSpec(plantType):
+    """
+    根据 settings 预计算一种植物在无界面模拟中需要的数据
+
+    :param plantType: 植物编号，对应 settings["plant_name"] 的索引
+    :return: 植物规格字典
+    """
+    name = settings["plant_name"][plantType]
+    plant = settings[name]
+    frame = _FrameTicks(name)
+    collision = plant.get("collisionSize", plant["size"])[0] + settings["game"]["detectionPlantXPos"].get(name, 0)
+    spec = {
+        "type": plantType,
+        "name": name,
+        "gold": plant["gold"],
+        "offsetX": settings["game"]["gridPlantPos"][name][0],  # 植物相对网格左边的偏移
+        "reach": collision,  # 碰撞检测右边界相对植物横坐标的偏移
+        "edible": name in SHOVEL_PLANT,  # 是否会被僵尸啃食
+    }
+    if name == "peashooter":
+        spec["readyTicks"] = PEATIME * plant["imageCount"] * frame  # 发射前的待机帧数
+        spec["actionTicks"] = 6 * frame  # 射击动画第6帧发射豌豆
+        spec["cycleTicks"] = spec["readyTicks"] + plant["shoot_imageCount"] * frame  # 一次射击的总帧数
+    elif name == "sunflower":
+        spec["readyTicks"] = SUNTIME * plant["imageCount"] * frame
+        spec["actionTicks"] = 7 * frame  # 产生阳光动画第7帧产生阳光
+        spec["cycleTicks"] = spec["readyTicks"] + plant["shoot_imageCount"] * frame
+    elif name == "chomper":
+        spec["eatTicks"] = plant["eatImageCount"] * frame  # 咬住僵尸的动画帧数
+        spec["digestTicks"] = plant["eatingTime"]  # 咀嚼的帧数
+    elif name == "cherry_bomb":
+        spec["fuseTicks"] = plant["initExplosionImageCount"] * frame  # 引爆前的帧数
+        spec["deleteTicks"] = spec["fuseTicks"] + plant["ExplosionImageCount"] * frame
+    elif name == "jalapeno":
+        spec["fuseTicks"] = plant["imageCount"] * frame
+        spec["deleteTicks"] = spec["fuseTicks"] + plant["ExplosionImageCount"] * frame
+    elif name == "potato_mine":
+        spec["explosionTicks"] = plant["ExplosionTime"]  # 爆炸持续的帧数
+    elif name == "squash":
+        spec["attackTicks"] = (plant["attackImageCount"] - 1) * frame  # 起跳到砸中僵尸的帧数
+        spec["deleteTicks"] = plant["attackImageCount"] * frame + plant["deleteTime"]
+    return spec
+
+PLANT_SPEC = {}  # 植物编号 -> 植物规格
+
+def RebuildPlantSpec():
+    """
+    根据当前的 settings 和常量重新计算植物规格，修改平衡数值后需要调用
+    """
+    PLANT_SPEC.clear()
+    for plantType in range(1, len(settings["plant_name"])):
+        PLANT_SPEC[plantType] = _BuildPlantSpec(plantType)
+
+RebuildPlantSpec()
+
+def _Canonical(value):
+    if isinstance(value, dict):
+        return {str(key): _Canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_Canonical(item) for item in value]
+    return value
+
+def ConfigHash(value):
+    """
+    计算配置的哈希值，字典的键顺序和元组/列表的区别不影响结果
+
+    :param value: 由字典、列表和基本类型组成的配置，例如 settings
+    :return: 十六进制哈希字符串
+    """
+    text = json.dumps(_Canonical(value), sort_keys = True, ensure_ascii = False, separators = (",", ":"), default = str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+class SimZombie:
+    __slots__ = ("id", "type", "x", "hp", "eat", "moveTime")
+
+    def __init__(self, id, type, x):
+        self.id = id  # 实体编号
+        self.type = type  # 僵尸类型
+        self.x = x  # 横坐标
+        self.hp = settings[type]["hp"]  # 生命值
+        self.eat = False  # 是否正在啃食植物
+        self.moveTime = 0  # 移动计时
+
+    def Copy(self):
+        zombie = SimZombie.__new__(SimZombie)
+        zombie.id, zombie.type, zombie.x, zombie.hp, zombie.eat, zombie.moveTime = self.id, self.type, self.x, self.hp, self.eat, self.moveTime
+        return zombie
+
+class SimPlant:
+    __slots__ = ("id", "type", "column", "x", "hp", "hpTime", "timer", "state", "target")
+
+    def __init__(self, id, type, column, board):
+        self.id = id  # 实体编号
+        self.type = type  # 植物编号
+        self.column = column  # 所在列
+        self.x = board.gridX[column] + PLANT_SPEC[type]["offsetX"]  # 横坐标
+        self.hp = NUT_HP if PLANT_SPEC[type]["name"] == "nut" else PLANT_HP  # 生命值
+        self.hpTime = 0  # 被啃食计时
+        self.timer = 0  # 植物自身的行为计时（射击、产生阳光、引爆等）
+        self.state = 0  # 状态：0 待机，1 动作中，2 之后的阶段
+        self.target = 0  # 倭瓜锁定的僵尸横坐标
+
+    def Copy(self):
+        plant = SimPlant.__new__(SimPlant)
+        plant.id, plant.type, plant.column, plant.x, plant.hp = self.id, self.type, self.column, self.x, self.hp
+        plant.hpTime, plant.timer, plant.state, plant.target = self.hpTime, self.timer, self.state, self.target
+        return plant
+
+class SimPea:
+    __slots__ = ("x",)
+
+    def __init__(self, x):
+        self.x = x  # 横坐标
+
+class SimSun:
+    __slots__ = ("id", "x", "y", "time")
+
+    def __init__(self, id, x, y, time):
+        self.id = id  # 实体编号
+        self.x = x  # 横坐标
+        self.y = y  # 落地后的纵坐标
+        self.time = time  # 剩余存在的帧数
+
+    def Copy(self):
+        return SimSun(self.id, self.x, self.y, self.time)
+
+class Lane:
+    __slots__ = ("index", "zombies", "plants", "peas", "lawnmower", "killed", "shares")
+
+    def __init__(self, index):
+        """
+        一行草坪上的所有实体，每行的推进互不依赖，跨行的影响以事件形式交给 Simulation
+
+        :param index: 行号，从 1 开始
+        """
+        self.index = index  # 行号
+        self.zombies = []  # 本行的僵尸
+        self.plants = []  # 本行的植物
+        self.peas = []  # 本行的豌豆
+        self.lawnmower = LAWNMOWER_POS_X  # 草地机横坐标，-1 表示已经没有草地机
+        self.killed = 0  # 本行被消灭的僵尸数量
+        self.shares = 0  # 除了第一个之外还有几个模拟共享本行（写时复制）
+
+    def Copy(self):
+        """
+        复制本行的所有实体，得到的副本不与任何模拟共享
+        """
+        lane = Lane.__new__(Lane)
+        lane.index = self.index
+        lane.zombies = [zombie.Copy() for zombie in self.zombies]
+        lane.plants = [plant.Copy() for plant in self.plants]
+        lane.peas = [SimPea(pea.x) for pea in self.peas]
+        lane.lawnmower = self.lawnmower
+        lane.killed = self.killed
+        lane.shares = 0
+        return lane
+
+    def Step(self, tick, inbox, board):
+        """
+        推进本行一帧
+
+        :param tick: 当前帧
+        :param inbox: 上一帧末尾交给本行的消息：("spawn", 编号, 僵尸类型)、("place", 编号, 植物编号, 列)、
+                      ("shovel", 列)、("bomb", 列)
+        :param board: 草坪
+        :return: 本帧产生的事件：("free", 列)、("sun", 横坐标, 纵坐标)、("bomb", 列)、("killed", 数量)、("gameover",)
+        """
+        events = []
+        killed = self.killed
+        for message in inbox:
+            kind = message[0]
+            if kind == "spawn":
+                self.zombies.append(SimZombie(message[1], message[2], board.zombieFirstX))
+            elif kind == "place":
+                self.plants.append(SimPlant(message[1], message[2], message[3], board))
+            elif kind == "shovel":
+                self.plants = [plant for plant in self.plants if plant.column != message[1]]
+            elif kind == "bomb":
+                self.Bomb(message[1], board)
+
+        self.StepPlants(events, board)
+        self.StepZombies(events, board)
+        self.StepPeas(board)
+        self.StepLawnmower(events, board)
+
+        if self.killed != killed:
+            events.append(("killed", self.killed - killed))
+        return events
+
+    def Kill(self, zombie):
+        """
+        消灭一只僵尸
+        """
+        if zombie in self.zombies:
+            self.zombies.remove(zombie)
+            self.killed += 1
+
+    def Bomb(self, column, board):
+        """
+        樱桃炸弹在本行或相邻行爆炸，消灭爆炸范围内的僵尸
+
+        :param column: 樱桃炸弹所在列
+        """
+        last = column + 2 if column >= board.columns else column + 1  # 最后一列时包括右侧虚拟网格
+        for zombie in list(self.zombies):
+            zombieColumn = board.Column(zombie.x + board.cellSize[0])  # 与 Zombie.GridAt 相同
+            if column - 1 <= zombieColumn <= last:
+                self.Kill(zombie)
+
+    def StepPlants(self, events, board):
+        """
+        推进本行植物的计时：射击、产生阳光、爆炸、大嘴花和倭瓜的攻击
+        """
+        hasZombie = bool(self.zombies)
+        for plant in list(self.plants):
+            spec = PLANT_SPEC[plant.type]
+            name = spec["name"]
+            if name == "peashooter":
+                if plant.timer >= spec["readyTicks"] or hasZombie:
+                    plant.timer += 1
+                if plant.timer == spec["readyTicks"] + spec["actionTicks"]:
+                    self.peas.append(SimPea(plant.x + 35))
+                if plant.timer >= spec["cycleTicks"]:
+                    plant.timer = 0
+            elif name == "sunflower":
+                plant.timer += 1
+                if plant.timer == spec["readyTicks"] + spec["actionTicks"]:
+                    events.append(("sun", plant.x + 2, board.gridY[self.index] - 25))
+                if plant.timer >= spec["cycleTicks"]:
+                    plant.timer = 0
+            elif name == "chomper" and plant.state:
+                plant.timer += 1
+                if plant.timer >= spec["eatTicks"] + spec["digestTicks"]:
+                    plant.timer = 0
+                    plant.state = 0
+                elif plant.timer >= spec["eatTicks"]:
+                    plant.state = 2  # 咀嚼中，此时会被僵尸啃食
+            elif name == "chomper":
+                for zombie in self.zombies:
+                    if zombie.x <= plant.x + spec["reach"]:
+                        self.Kill(zombie)  # 大嘴花吞下僵尸
+                        plant.state = 1
+                        break
+            elif name == "cherry_bomb":
+                plant.timer += 1
+                if plant.timer == spec["fuseTicks"]:
+                    events.append(("bomb", plant.column))  # 影响相邻行，交给 Simulation 在帧末分发
+                elif plant.timer >= spec["deleteTicks"]:
+                    self.plants.remove(plant)
+                    events.append(("free", plant.column))
+            elif name == "jalapeno":
+                plant.timer += 1
+                if plant.timer == spec["fuseTicks"]:
+                    for zombie in list(self.zombies):
+                        if zombie.x + settings[zombie.type]["size"][0] / 2 <= board.right:
+                            self.Kill(zombie)
+                elif plant.timer >= spec["deleteTicks"]:
+                    self.plants.remove(plant)
+                    events.append(("free", plant.column))
+            elif name == "potato_mine":
+                if plant.state:
+                    plant.timer += 1
+                    if plant.timer >= spec["explosionTicks"]:
+                        self.plants.remove(plant)
+                        continue
+                for zombie in list(self.zombies):
+                    if zombie.x <= plant.x + spec["reach"]:
+                        if not plant.state:
+                            plant.state = 1  # 爆炸，同时让出网格
+                            events.append(("free", plant.column))
+                        self.Kill(zombie)
+            elif name == "squash":
+                if plant.state:
+                    plant.timer += 1
+                    if plant.timer == spec["attackTicks"]:
+                        for zombie in list(self.zombies):
+                            if abs(zombie.x - plant.target) <= board.cellSize[0]:
+                                self.Kill(zombie)
+                                break
+                    elif plant.timer >= spec["deleteTicks"]:
+                        self.plants.remove(plant)
+                        events.append(("free", plant.column))
+                else:
+                    for zombie in self.zombies:
+                        if zombie.x <= plant.x + spec["reach"]:
+                            plant.state = 1
+                            plant.target = zombie.x
+                            break
+
+    def StepZombies(self, events, board):
+        """
+        推进本行僵尸：啃食植物或向左移动
+        """
+        for zombie in self.zombies:
+            target = None
+            if zombie.hp > 40:  # 失去头的僵尸不再啃食
+                for plant in self.plants:
+                    spec = PLANT_SPEC[plant.type]
+                    if not spec["edible"] or (spec["name"] == "chomper" and plant.state != 2):
+                        continue
+                    if plant.x - board.cellSize[0] <= zombie.x <= plant.x + spec["reach"]:
+                        if target is None or plant.column > target.column:
+                            target = plant
+            zombie.eat = target is not None
+            if target is not None:
+                target.hpTime += 1
+                if target.hpTime == (NUT_HP if PLANT_SPEC[target.type]["name"] == "nut" else PLANT_HP):
+                    target.hpTime = 0
+                    if PLANT_SPEC[target.type]["name"] == "nut":
+                        target.hp -= NUT_HP / 4.0
+                        dead = target.hp <= NUT_HP / 4.0
+                    else:
+                        target.hp -= settings[zombie.type]["attack_power"]
+                        dead = target.hp <= 0
+                    if dead:
+                        self.plants.remove(target)
+                        events.append(("free", target.column))
+                        zombie.eat = False
+            else:
+                zombie.moveTime += 1
+                if zombie.moveTime >= ZOMBIE_MOVE_TICKS:
+                    zombie.moveTime = 0
+                    zombie.x -= 1
+
+    def StepPeas(self, board):
+        """
+        推进本行豌豆：移动并命中僵尸
+        """
+        limit = board.right + PEA_DELETE_OFFSET
+        peaWidth = settings["pea"]["size"][0]
+        for pea in list(self.peas):
+            pea.x += PEA_SPEED
+            hit = None
+            for zombie in self.zombies:
+                if zombie.x < pea.x + peaWidth - 30:
+                    hit = zombie
+                    break
+            if hit is not None:
+                self.peas.remove(pea)
+                hit.hp -= settings["game"]["peaAttackPower"][hit.type]
+                if hit.hp <= 100 and hit.type != "common_zombie":
+                    hit.type = "common_zombie"  # 失去护具
+                if hit.hp <= 0:
+                    self.Kill(hit)
+            elif pea.x > limit:
+                self.peas.remove(pea)
+
+    def StepLawnmower(self, events, board):
+        """
+        推进本行草地机，并检查僵尸是否进入房子
+        """
+        if self.lawnmower >= 0:
+            reach = self.lawnmower + settings["lawnmower"]["collisionSize"][0] + settings["game"]["detectionPlantXPos"]["lawnmower"]
+            running = self.lawnmower > LAWNMOWER_POS_X
+            for zombie in list(self.zombies):
+                if zombie.x <= reach:
+                    running = True
+                    self.Kill(zombie)
+            if running:
+                self.lawnmower += 1
+                if self.lawnmower >= board.right + LAWNMOWER_DELETE_OFFSET:
+                    self.lawnmower = -1  # 草地机驶出草坪
+        else:
+            for zombie in self.zombies:
+                if zombie.x <= board.left:
+                    events.append(("gameover",))
+                    break
+
+class Simulation:
+    def __init__(self, level = DEFAULT_LEVEL, seed = 0, gold = 200, autoCollectSun = False):
+        """
+        初始化无界面模拟
+
+        :param level: 关卡编号，对应 settings["level"]；也可以直接传入关卡定义字典
+        :param seed: 随机种子，决定僵尸时间线和天降阳光
+        :param gold: 初始金币
+        :param autoCollectSun: 是否在阳光出现时自动收集
+        """
+        self.level = level if isinstance(level, dict) else settings["level"][level]
+        self.seed = seed
+        self.board = Board.FromLevel(self.level)
+        self.scheduler = WaveScheduler(self.level, seed, self.board.rows)  # 僵尸出生调度器
+        self.rng = random.Random(seed ^ 0x5EED)  # 天降阳光使用的随机数生成器，与僵尸时间线互不影响
+        self.map = self.board.NewMap()  # 植物地图（PlantGrid），与 Game.map 相同
+        self.lanes = [None] + [Lane(row) for row in range(1, self.board.rows + 1)]  # 每行的实体，索引 0 为占位
+        self.inbox = [[] for _ in range(self.board.rows + 1)]  # 下一帧交给每行的消息
+        self.suns = []  # 场上的阳光
+        self.tick = 0  # 帧数
+        self.gold = gold  # 金币
+        self.nextId = 1  # 下一个实体编号
+        self.gameover = False  # 游戏是否结束
+        self.autoCollectSun = autoCollectSun
+        self.stats = {"zombiesSpawned": 0, "zombiesKilled": 0, "sunProduced": 0, "sunCollected": 0, "goldSpent": 0, "plantsPlaced": 0}
+
+    def NewId(self):
+        self.nextId += 1
+        return self.nextId - 1
+
+    def CanPlace(self, plantType, column, row):
+        """
+        检查能否在指定网格种植植物
+
+        :return: 金币足够且网格为空时返回 True
+        """
+        return self.map.IsFree(column, row) and self.gold >= PLANT_SPEC[plantType]["gold"]
+
+    def Place(self, plantType, column, row):
+        """
+        在指定网格种植植物，植物在下一帧出现在对应行
+
+        :param plantType: 植物编号，对应 settings["plant_name"] 的索引
+        :param column: 列，从 1 开始
+        :param row: 行，从 1 开始
+        :return: 种植成功返回 True
+        """
+        if self.gameover or not self.CanPlace(plantType, column, row):
+            return False
+        gold = PLANT_SPEC[plantType]["gold"]
+        self.map.Set(column, row, plantType)
+        self.gold -= gold
+        self.stats["goldSpent"] += gold
+        self.stats["plantsPlaced"] += 1
+        self.inbox[row].append(("place", self.NewId(), plantType, column))
+        return True
+
+    def Shovel(self, column, row):
+        """
+        铲除指定网格的植物
+
+        :return: 铲除成功返回 True
+        """
+        if not self.board.IsValidGrid((column, row)) or settings["plant_name"][self.map.Get(column, row)] not in SHOVEL_PLANT:
+            return False
+        self.map.Clear(column, row)
+        self.inbox[row].append(("shovel", column))
+        return True
+
+    def CollectSun(self, sunId):
+        """
+        收集指定编号的阳光
+
+        :return: 收集成功返回 True
+        """
+        for sun in self.suns:
+            if sun.id == sunId:
+                self.suns.remove(sun)
+                self.gold += SUN_VALUE
+                self.stats["sunCollected"] += SUN_VALUE
+                return True
+        return False
+
+    def AddSun(self, x, y, time):
+        sun = SimSun(self.NewId(), x, y, time)
+        self.stats["sunProduced"] += SUN_VALUE
+        if self.autoCollectSun:
+            self.gold += SUN_VALUE
+            self.stats["sunCollected"] += SUN_VALUE
+        else:
+            self.suns.append(sun)
+
+    def Step(self):
+        """
+        推进一帧：分发消息 -> 各行独立推进 -> 在帧末统一处理跨行事件
+        """
+        if self.gameover:
+            return
+        self.tick += 1
+        for zombieType, row in self.scheduler.Due(self.tick):
+            self.inbox[row].append(("spawn", self.NewId(), zombieType))
+            self.stats["zombiesSpawned"] += 1
+        inbox = self.inbox
+        self.inbox = [[] for _ in range(self.board.rows + 1)]
+        self.ApplyEvents(self.StepLanes(inbox))
+        self.StepSun()
+
+    def StepLanes(self, inbox):
+        """
+        推进所有行
+
+        :param inbox: 每行的消息列表
+        :return: [(行号, 事件列表), ...]，按行号排序
+        """
+        return [(row, self.OwnLane(row).Step(self.tick, inbox[row], self.board)) for row in range(1, self.board.rows + 1)]
+
+    def OwnLane(self, row):
+        """
+        修改一行之前调用：如果这一行还与分支共享，先复制一份给自己
+
+        :param row: 行号
+        :return: 可以修改的 Lane
+        """
+        lane = self.lanes[row]
+        if lane.shares:
+            lane.shares -= 1
+            lane = self.lanes[row] = lane.Copy()
+        return lane
+
+    def Fork(self):
+        """
+        分支出一个独立的模拟，用于前瞻搜索和“如果这样做会怎样”的分析。
+        草坪、关卡、植物规格和僵尸出生时间线不会被原地修改，直接共享；各行实体写时复制，
+        分支和原模拟都只在第一次推进某一行时才复制这一行；其余可变状态（地图、阳光、消息、随机数）立即复制。
+
+        :return: 新的 Simulation，之后与原模拟互不影响
+        """
+        fork = Simulation.__new__(Simulation)
+        fork.level = self.level
+        fork.seed = self.seed
+        fork.board = self.board
+        fork.scheduler = self.scheduler.Fork()
+        fork.rng = CopyRandom(self.rng)
+        fork.map = self.map.Copy()
+        for lane in self.lanes[1:]:
+            lane.shares += 1
+        fork.lanes = list(self.lanes)
+        fork.inbox = [list(messages) for messages in self.inbox]
+        fork.suns = [sun.Copy() for sun in self.suns]
+        fork.tick = self.tick
+        fork.gold = self.gold
+        fork.nextId = self.nextId
+        fork.gameover = self.gameover
+        fork.autoCollectSun = self.autoCollectSun
+        fork.stats = dict(self.stats)
+        return fork
+
+    def ApplyEvents(self, laneEvents):
+        """
+        按行号顺序处理各行产生的事件，跨行的爆炸在下一帧开始时交给相邻行
+        """
+        for row, events in laneEvents:
+            for event in events:
+                kind = event[0]
+                if kind == "free":
+                    self.map.Clear(event[1], row)
+                elif kind == "sun":
+                    self.AddSun(event[1], event[2], SUNLIGHT_DELETE_TIME)
+                elif kind == "bomb":
+                    for target in (row - 1, row, row + 1):
+                        if 1 <= target <= self.board.rows:
+                            self.inbox[target].append(("bomb", event[1]))
+                elif kind == "killed":
+                    self.stats["zombiesKilled"] += event[1]
+                elif kind == "gameover":
+                    self.gameover = True
+
+    def StepSun(self):
+        """
+        生成天降阳光，并删除超时的阳光
+        """
+        if self.tick % SUNLIGHT_TIME == 0:
+            fall = self.rng.randint(*self.board.sunFallY)  # 阳光落地的纵坐标
+            self.AddSun(self.rng.randint(self.board.left, self.board.right), fall, fall + SUNLIGHT_DELETE_TIME)
+        if self.suns:
+            for sun in self.suns:
+                sun.time -= 1
+            self.suns = [sun for sun in self.suns if sun.time > 0]
+
+    def Run(self, ticks, strategy = None):
+        """
+        连续推进多帧，直到游戏结束或达到帧数
+
+        :param ticks: 最多推进的帧数
+        :param strategy: 每帧开始时调用的函数 strategy(simulation)，用于脚本或机器人操作
+        :return: self.Result()
+        """
+        for _ in range(ticks):
+            if self.gameover:
+                break
+            if strategy is not None:
+                strategy(self)
+            self.Step()
+        return self.Result()
+
+    def Result(self):
+        """
+        汇总当前对局结果
+
+        :return: 结果字典
+        """
+        result = dict(self.stats)
+        result["tick"] = self.tick
+        result["gold"] = self.gold
+        result["gameover"] = self.gameover
+        result["zombies"] = self.ZombieCount()
+        return result
+
+    def ZombieCount(self):
+        return sum(len(self.lanes[row].zombies) for row in range(1, self.board.rows + 1))
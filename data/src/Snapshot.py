@@ -0,0 +1,477 @@
+import zlib  # 导入压缩库
+import threading  # 导入多线程库
+import struct  # 导入二进制打包库
+from data.src.Game import *  # 导入游戏处理核心（同时导入所有游戏对象）
+
+# 游戏存档：把 Pvz 中所有实体列表、Game 的计数器和随机数状态保存为带版本号的二进制快照，并能从快照重建游戏世界。
+# 存档分两步：Capture 在游戏线程中把状态复制为只包含基本类型的数据（很快），Encode 再把它编码并压缩为字节串，
+# 后者由 Autosaver 在后台线程完成。
+
+SNAPSHOT_MAGIC = b"PVZS"  # 文件头标识
+SNAPSHOT_VERSION = 6  # 快照格式版本，格式改变时加一（2：植物地图改为按行展开的列表；3：实体保存动画状态机的名字和状态编号；4：僵尸保存所在网格的左右边界；5：豌豆保存所在草坪；6：计时改为帧数）
+SNAPSHOT_HEADER = struct.Struct("<4sHBI")  # 标识, 版本, 压缩方式（0 不压缩，1 zlib）, 未压缩的长度
+
+# 需要保存的实体列表（Pvz 的属性名），僵尸在最前面，其他实体引用僵尸时可以直接找到
+ENTITY_LISTS = ("zombie_list", "sunflower_list", "peashooter_list", "nut_list", "potatoMine_list", "chomper_list",
+                "cherryBomb_list", "jalapeno_list", "squash_list", "pea_list", "sunlight_list", "zombieHead_list",
+                "growSoil_list", "lawnmower_list", "card")
+ENTITY_CLASSES = {cls.__name__: cls for cls in (Zombie, Sunflower, Peashooter, Nut, PotatoMine, Chomper, CherryBomb, Jalapeno,
+                                                Squash, Pea, Sunlight, ZombieHead, GrowSoil, Lawnmower, Card)}
+SKIP_FIELDS = ("image", "clip", "machine", "visible")  # 不保存的属性，恢复时从共享的动画片段和状态机中取得，是否可见在下一次绘制时重新检查
+TICK_FIELDS = ("preIndexTick", "prePosTick")  # 保存为距离存档时经过的帧数，恢复时换算回当前的帧数，恢复后的计时与原来完全相同
+
+_LENGTH = struct.Struct("<I")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_REF = struct.Struct("<II")
+
+class Link:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name  # 指向 Pvz 的运行时对象（屏幕、草坪、列表等），恢复时重新连接
+
+class Ref:
+    __slots__ = ("table", "row")
+
+    def __init__(self, table, row):
+        self.table = table  # 被引用实体所在的表
+        self.row = row  # 被引用实体在表中的行
+
+class _Missing:
+    __slots__ = ()
+
+MISSING = _Missing()  # 同一张表中某些实体没有的属性
+
+def _Links(pvz):
+    """
+    实体中指向运行时对象的属性，按对象 id 查找名称
+    """
+    return {id(pvz): "game", id(pvz.screen): "screen", id(pvz.game.board): "board",
+            id(pvz.pea_list): "pea_list", id(pvz.sunlight_list): "sunlight_list"}
+
+class _Capturer:
+    def __init__(self, pvz):
+        self.links = _Links(pvz)
+        self.ticks = CLOCK.ticks
+        self.index = {}  # 实体 id -> (表, 行)
+        self.tables = []
+        self.detached = []  # 被引用但已不在任何列表中的实体（例如大嘴花正在吃的僵尸）
+        for listName in ENTITY_LISTS:
+            entities = getattr(pvz, listName)
+            for row, entity in enumerate(entities):
+                self.index[id(entity)] = (len(self.tables), row)
+            self.tables.append((listName, list(entities)))
+        self.detachedTable = len(self.tables)
+
+    def Value(self, value):
+        kind = type(value)
+        if value is None or kind is bool or kind is int or kind is float or kind is str:
+            return value
+        if id(value) in self.links:
+            return Link(self.links[id(value)])
+        if kind is list:
+            return [self.Value(item) for item in value]
+        if kind is tuple:
+            return tuple(self.Value(item) for item in value)
+        if kind is dict:
+            return {key: self.Value(item) for key, item in value.items()}
+        if isinstance(value, pygame.sprite.Sprite):
+            if id(value) not in self.index:
+                self.index[id(value)] = (self.detachedTable, len(self.detached))
+                self.detached.append(value)
+            return Ref(*self.index[id(value)])
+        raise TypeError(f"无法保存类型为 {kind.__name__} 的属性")
+
+    def Table(self, name, entities):
+        columns = {}
+        for row, entity in enumerate(entities):
+            for field, value in entity.__dict__.items():
+                if field in SKIP_FIELDS:
+                    continue
+                column = columns.get(field)
+                if column is None:
+                    column = columns[field] = [MISSING] * row
+                try:
+                    if field in TICK_FIELDS:
+                        value = self.ticks - value
+                    column.append(self.Value(value))
+                except TypeError as error:
+                    raise TypeError(f"{type(entity).__name__}.{field}: {error}") from None
+            for column in columns.values():
+                if len(column) <= row:
+                    column.append(MISSING)
+        return {"name": name, "classes": [type(entity).__name__ for entity in entities], "columns": columns}
+
+    def Run(self):
+        tables = [self.Table(name, entities) for name, entities in self.tables]
+        tables.append(self.Table("detached", self.detached))  # 遍历时新发现的被引用实体会追加到列表末尾，一并保存
+        return tables
+
+def Capture(pvz):
+    """
+    把游戏状态复制为只包含基本类型的快照（在游戏线程中调用，复制后游戏可以继续运行）
+
+    :param pvz: Pvz 实例
+    :return: 快照字典
+    """
+    game = pvz.game
+    scheduler = game.scheduler
+    return {
+        "time": time.time(),
+        "game": {
+            "level": game.level,
+            "seed": game.seed,
+            "gold": game.gold,
+            "tick": game.tick,
+            "sunlightTime": game.sunlightTime,
+            "map": game.map.ToList(),
+            "rng": game.rng.getstate(),
+            "random": random.getstate(),
+            "scheduler": {
+                "rng": scheduler.rng.getstate(),
+                "horizon": scheduler.horizon,
+                "timeline": {tick: list(spawns) for tick, spawns in scheduler.timeline.items() if tick > game.tick},
+            },
+        },
+        "pvz": {
+            "zombiePos": list(pvz.zombiePos),
+            "lawnmowerIf": list(pvz.lawnmowerIf),
+            "gameover": pvz.gameover,
+        },
+        "tables": _Capturer(pvz).Run(),
+    }
+
+def _PackSequence(tag, intTag, floatTag, value, out):
+    count = len(value)
+    if count:
+        first = type(value[0])
+        if first is int and all(type(item) is int for item in value):
+            try:
+                out.append(intTag + _LENGTH.pack(count) + struct.pack(f"<{count}q", *value))
+                return
+            except struct.error:
+                pass  # 超出 64 位的整数按通用方式保存
+        elif first is float and all(type(item) is float for item in value):
+            out.append(floatTag + _LENGTH.pack(count) + struct.pack(f"<{count}d", *value))
+            return
+    out.append(tag + _LENGTH.pack(count))
+    for item in value:
+        _Pack(item, out)
+
+def _Pack(value, out):
+    """
+    把一个值编码为带类型标记的字节串，追加到 out
+    """
+    kind = type(value)
+    if value is None:
+        out.append(b"N")
+    elif value is True:
+        out.append(b"T")
+    elif value is False:
+        out.append(b"F")
+    elif kind is int:
+        try:
+            out.append(b"i" + _INT.pack(value))
+        except struct.error:
+            text = str(value).encode("ascii")
+            out.append(b"I" + _LENGTH.pack(len(text)) + text)
+    elif kind is float:
+        out.append(b"d" + _FLOAT.pack(value))
+    elif kind is str:
+        data = value.encode("utf-8")
+        out.append(b"s" + _LENGTH.pack(len(data)) + data)
+    elif kind is list:
+        _PackSequence(b"l", b"A", b"E", value, out)
+    elif kind is tuple:
+        _PackSequence(b"t", b"a", b"e", value, out)
+    elif kind is dict:
+        out.append(b"m" + _LENGTH.pack(len(value)))
+        for key, item in value.items():
+            _Pack(key, out)
+            _Pack(item, out)
+    elif kind is Link:
+        data = value.name.encode("utf-8")
+        out.append(b"L" + _LENGTH.pack(len(data)) + data)
+    elif kind is Ref:
+        out.append(b"R" + _REF.pack(value.table, value.row))
+    elif value is MISSING:
+        out.append(b"X")
+    else:
+        raise TypeError(f"无法编码类型为 {kind.__name__} 的值")
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+        self.dispatch = {ord(tag): method for tag, method in (
+            ("i", self.Int), ("I", self.BigInt), ("d", self.Float), ("s", self.Str), ("L", self.Link),
+            ("l", self.List), ("t", self.Tuple), ("A", self.IntList), ("a", self.IntTuple), ("E", self.FloatList),
+            ("e", self.FloatTuple), ("m", self.Dict), ("R", self.Ref), ("N", lambda: None), ("T", lambda: True),
+            ("F", lambda: False), ("X", lambda: MISSING))}
+
+    def Value(self):
+        tag = self.data[self.offset]
+        self.offset += 1
+        method = self.dispatch.get(tag)
+        if method is None:
+            raise ValueError(f"快照数据损坏：未知的类型标记 {tag}")
+        return method()
+
+    def Length(self):
+        count = _LENGTH.unpack_from(self.data, self.offset)[0]
+        self.offset += 4
+        return count
+
+    def Numbers(self, code):
+        count = self.Length()
+        values = struct.unpack_from(f"<{count}{code}", self.data, self.offset)
+        self.offset += 8 * count
+        return values
+
+    def Text(self):
+        count = self.Length()
+        self.offset += count
+        return self.data[self.offset - count:self.offset].decode("utf-8")
+
+    def Int(self):
+        self.offset += 8
+        return _INT.unpack_from(self.data, self.offset - 8)[0]
+
+    def BigInt(self):
+        return int(self.Text())
+
+    def Float(self):
+        self.offset += 8
+        return _FLOAT.unpack_from(self.data, self.offset - 8)[0]
+
+    def Str(self):
+        return self.Text()
+
+    def Link(self):
+        return Link(self.Text())
+
+    def List(self):
+        return [self.Value() for _ in range(self.Length())]
+
+    def Tuple(self):
+        return tuple([self.Value() for _ in range(self.Length())])
+
+    def IntList(self):
+        return list(self.Numbers("q"))
+
+    def IntTuple(self):
+        return self.Numbers("q")
+
+    def FloatList(self):
+        return list(self.Numbers("d"))
+
+    def FloatTuple(self):
+        return self.Numbers("d")
+
+    def Dict(self):
+        result = {}
+        for _ in range(self.Length()):
+            key = self.Value()
+            result[key] = self.Value()
+        return result
+
+    def Ref(self):
+        self.offset += 8
+        return Ref(*_REF.unpack_from(self.data, self.offset - 8))
+
+def Encode(snapshot, compress = 6):
+    """
+    把快照编码为带版本号的二进制数据
+
+    :param snapshot: Capture 返回的快照
+    :param compress: zlib 压缩等级，0 表示不压缩
+    :return: 字节串
+    """
+    out = []
+    _Pack(snapshot, out)
+    body = b"".join(out)
+    if compress:
+        return SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 1, len(body)) + zlib.compress(body, compress)
+    return SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(body)) + body
+
+def Decode(data):
+    """
+    把二进制数据解码为快照
+
+    :param data: Encode 返回的字节串
+    :return: 快照字典
+    """
+    magic, version, compression, length = SNAPSHOT_HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("不是存档文件")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"不支持的存档版本 {version}")
+    body = data[SNAPSHOT_HEADER.size:]
+    if compression == 1:
+        body = zlib.decompress(body)
+    if len(body) != length:
+        raise ValueError("存档数据不完整")
+    return _Reader(body).Value()
+
+def _RandomState(state):
+    return (state[0], tuple(state[1]), state[2])
+
+def Restore(pvz, snapshot):
+    """
+    根据快照重建游戏世界
+
+    :param pvz: Pvz 实例（已经调用过 start 中的初始化）
+    :param snapshot: Capture 或 Decode 返回的快照
+    """
+    state = snapshot["game"]
+    pvz.game = Game(pvz.ObjectGame, state["level"], state["seed"], pvz.game.sound)  # 按存档的关卡重建游戏处理核心和草坪
+    game = pvz.game
+    pvz.board = game.board
+    if hasattr(pvz, "gridPlant"):
+        pvz.gridPlant.board = game.board
+    game.gold = state["gold"]
+    game.tick = state["tick"]
+    game.sunlightTime = state["sunlightTime"]
+    game.map.Load(state["map"])
+    game.rng.setstate(_RandomState(state["rng"]))
+    random.setstate(_RandomState(state["random"]))
+    game.scheduler.rng.setstate(_RandomState(state["scheduler"]["rng"]))
+    game.scheduler.horizon = state["scheduler"]["horizon"]
+    game.scheduler.timeline = {tick: tuple(tuple(spawn) for spawn in spawns) for tick, spawns in state["scheduler"]["timeline"].items()}
+
+    links = {"game": pvz, "screen": pvz.screen, "board": game.board, "pea_list": pvz.pea_list, "sunlight_list": pvz.sunlight_list}
+    tables = snapshot["tables"]
+    objects = [[ENTITY_CLASSES[name].__new__(ENTITY_CLASSES[name]) for name in table["classes"]] for table in tables]
+    ticks = CLOCK.ticks
+
+    def Resolve(value):
+        kind = type(value)
+        if kind is Link:
+            return links[value.name]
+        if kind is Ref:
+            return objects[value.table][value.row]
+        if kind is list:
+            return [Resolve(item) for item in value]
+        if kind is tuple:
+            return tuple(Resolve(item) for item in value)
+        return value
+
+    for table, entities in zip(tables, objects):
+        for field, column in table["columns"].items():
+            isTick = field in TICK_FIELDS
+            for entity, value in zip(entities, column):
+                if value is MISSING:
+                    continue
+                entity.__dict__[field] = ticks - value if isTick else Resolve(value)
+        for entity in entities:
+            entity.machine = MACHINES[entity.machineName] if entity.__dict__.get("machineName") else None  # 重新连接共享的状态机
+            if entity.imageCount != 1 and entity.imageIndex == 0:
+                continue  # 还没有更新过图片，第一次 update 时加载
+            entity.updateImage()  # 相同的动画帧只加载一次，由所有实体共享
+        if table["name"] != "detached":
+            getattr(pvz, table["name"])[:] = entities  # 原地替换，保持实体中对列表的引用有效
+
+    for zombie in pvz.zombie_list:
+        game.PublishCell(zombie, None, zombie.grid)  # 重建僵尸的网格索引
+    pvz.zombiePos = list(snapshot["pvz"]["zombiePos"])
+    pvz.lawnmowerIf = list(snapshot["pvz"]["lawnmowerIf"])
+    pvz.gameover = snapshot["pvz"]["gameover"]
+    pvz.card_shadow_list = [Shadow(pvz.screen, CARD_SIZE, [CARD_FIRST_X + (CARD_SIZE[0] + 7) * index, CARD_POS_Y]) for index in range(len(pvz.card))]
+    pvz.selectedCard = []  # 卡片已经恢复，不需要再根据选中的卡片创建
+    pvz.plant = False
+    pvz.running = True  # 跳过开始界面
+    pvz.really = True  # 跳过选卡界面
+
+def WriteSnapshot(path, snapshot, compress = 6):
+    """
+    编码快照并原子地写入文件：先写临时文件并刷新到磁盘，再替换原存档，写入中途崩溃不会损坏旧存档
+
+    :return: 写入的字节数
+    """
+    data = Encode(snapshot, compress)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok = True)
+    temp = path + ".tmp"
+    with open(temp, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp, path)
+    return len(data)
+
+class Autosaver:
+    def __init__(self, path, compress = 6):
+        """
+        后台存档线程：游戏线程只需要 Capture 一份快照交给 Submit，编码、压缩和写文件都在后台线程完成
+
+        :param path: 存档路径
+        :param compress: zlib 压缩等级
+        """
+        self.path = path
+        self.compress = compress
+        self.condition = threading.Condition()
+        self.pending = None  # 等待写入的快照，只保留最新的一份
+        self.busy = False  # 后台线程是否正在写入
+        self.closed = False
+        self.saves = 0  # 已完成的存档次数
+        self.lastBytes = 0  # 上一次存档的字节数
+        self.lastTime = 0  # 上一次编码和写入的耗时（秒）
+        self.error = None  # 上一次存档失败的异常
+        self.thread = threading.Thread(target = self.Worker, name = "Autosaver", daemon = True)
+        self.thread.start()
+
+    def Submit(self, snapshot):
+        """
+        提交一份快照，立即返回；上一份还没开始写入时直接被替换
+        """
+        with self.condition:
+            self.pending = snapshot
+            self.condition.notify_all()
+
+    def Flush(self, timeout = None):
+        """
+        等待已提交的快照全部写入
+
+        :return: 在超时前写完返回 True
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: self.pending is None and not self.busy, timeout)
+
+    def Close(self, timeout = None):
+        """
+        写完已提交的快照后结束后台线程
+        """
+        self.Flush(timeout)
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join(timeout)
+
+    def Worker(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending is not None or self.closed)
+                if self.pending is None:
+                    return
+                snapshot, self.pending = self.pending, None
+                self.busy = True
+            start = time.perf_counter()
+            try:
+                self.lastBytes = WriteSnapshot(self.path, snapshot, self.compress)
+                self.lastTime = time.perf_counter() - start
+                self.saves += 1
+                self.error = None
+            except Exception as error:  # 存档失败不能影响游戏，保留旧存档，下次再试
+                self.error = error  # 由调用者检查
+            with self.condition:
+                self.busy = False
+                self.condition.notify_all()
+
+def ReadSnapshot(path):
+    """
+    读取并解码快照文件
+    """
+    with open(path, "rb") as file:
+        return Decode(file.read())
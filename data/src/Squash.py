@@ -1,6 +1,8 @@
 from data.src.object import *
 
 class Squash(Object):
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, game, pos):  # 初始化函数
         self.plantType = "squash" # 设置植物类型为倭瓜
         self.game = game  # 保存游戏引用
@@ -8,10 +10,8 @@ class Squash(Object):
         self.pos = list(pos)
         self.pos[0] += settings["game"]["gridPlantPos"][self.plantType][0]
         self.pos[1] += settings["game"]["gridPlantPos"][self.plantType][1]
-        self.updateGrid(self.pos)
-        self.grid[0] += 1
-        self.grid[1] += 2
-        self.state = "Idle"
+        self.grid = game.board.CellAt(pos)  # 种植的网格
+        self.SetMachine(self.plantType)  # 闲置 -> 攻击（倒数第二帧压扁僵尸，最后一帧落地）
         self.delete = 0
         self.Todelete = 0
         self.attackPosX = None
@@ -30,8 +30,18 @@ class Squash(Object):
                 self.pos[0] += 1
             elif self.pos[0] > self.attackPosX:
                 self.pos[0] -= 1
-        if self.state == "Attack" and self.imageIndex == self.imageCount:
-            self.Todelete = 1
-        if self.state == "Attack" and self.imageIndex == self.imageCount - 1:
+        self.draw()
+
+    def Attack(self, zombie):  # 跳起攻击僵尸
+        if not self.Trigger("attack", 1):  # 只有闲置时才能攻击
+            return
+        self.updateImage()  # 立即显示攻击的第一帧
+        self.imageIndex = 0
+        self.attackPosX = zombie.pos[0] + settings[self.plantType]["jumpXchange"]
+        self.attackZombie = zombie
+
+    def OnFrameEvent(self, event):  # 帧事件
+        if event == "hit":  # 攻击动画的倒数第二帧：压扁僵尸
             self.game.game.AttackZombie(self.attackZombie)
-        self.draw()
\ No newline at end of file
+        elif event == "land":  # 攻击动画的最后一帧：等待删除
+            self.Todelete = 1
\ No newline at end of file
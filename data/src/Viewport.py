@@ -0,0 +1,94 @@
+from data.src.const import *  # 导入常量
+
+class Viewport:
+    def __init__(self, width = GAME_SIZE[0], height = GAME_SIZE[1]):
+        """
+        摄像机（可见区域）：窗口显示世界中左上角为 (x, y)、大小为窗口大小的一块。
+        世界中的对象（背景、植物、僵尸等）按世界坐标保存，绘制时减去摄像机位置；界面（卡片、铲子等）按窗口坐标绘制。
+        绘制前检查对象是否在可见区域内，不在的对象不取动画帧、不绘制（剔除），每帧统计绘制和剔除的对象数量
+
+        :param width: 可见区域（窗口）的宽度
+        :param height: 可见区域（窗口）的高度
+        """
+        self.width = width
+        self.height = height
+        self.x = 0  # 摄像机左上角的世界横坐标
+        self.y = 0  # 摄像机左上角的世界纵坐标
+        self.worldWidth = width  # 世界的宽度
+        self.worldHeight = height  # 世界的高度
+        self.enabled = True  # 是否剔除不可见的对象，关闭时所有对象都绘制
+        self.drawn = 0  # 这一帧已经绘制的对象数量
+        self.culled = 0  # 这一帧已经剔除的对象数量
+        self.lastDrawn = 0  # 上一帧绘制的对象数量
+        self.lastCulled = 0  # 上一帧剔除的对象数量
+
+    def SetWorld(self, width, height):
+        """
+        设置世界的大小（例如换成更大的草坪），摄像机回到左上角
+
+        :param width: 世界的宽度，不小于窗口宽度
+        :param height: 世界的高度，不小于窗口高度
+        """
+        self.worldWidth = max(width, self.width)
+        self.worldHeight = max(height, self.height)
+        self.MoveTo(0, 0)
+
+    def MoveTo(self, x, y):
+        """
+        移动摄像机，限制在世界范围内
+
+        :param x: 摄像机左上角的世界横坐标
+        :param y: 摄像机左上角的世界纵坐标
+        """
+        self.x = max(0, min(x, self.worldWidth - self.width))
+        self.y = max(0, min(y, self.worldHeight - self.height))
+
+    def ScrollBy(self, dx, dy):
+        """
+        滚动摄像机
+        """
+        self.MoveTo(self.x + dx, self.y + dy)
+
+    def ToWorld(self, pos):
+        """
+        窗口坐标（例如鼠标位置）转换为世界坐标，用于点击检测
+
+        :param pos: 窗口坐标 (x, y)
+        :return: 世界坐标 (x, y)
+        """
+        return (pos[0] + self.x, pos[1] + self.y)
+
+    def ToScreen(self, pos):
+        """
+        世界坐标转换为窗口坐标
+
+        :param pos: 世界坐标 (x, y)
+        :return: 窗口坐标 (x, y)
+        """
+        return (pos[0] - self.x, pos[1] - self.y)
+
+    def Visible(self, pos, size, world = True):
+        """
+        检查左上角为 pos、大小为 size 的矩形是否在可见区域内
+
+        :param pos: 左上角坐标 (x, y)
+        :param size: 大小 (宽, 高)
+        :param world: pos 是否为世界坐标，为 False 时是窗口坐标
+        :return: 相交（或者没有开启剔除）返回 True，否则返回 False
+        """
+        if not self.enabled:
+            return True
+        x = pos[0] - self.x if world else pos[0]
+        y = pos[1] - self.y if world else pos[1]
+        return x < self.width and x + size[0] > 0 and y < self.height and y + size[1] > 0
+
+    def EndFrame(self):
+        """
+        帧循环每帧结束时调用：保存这一帧的统计并清零
+        """
+        self.lastDrawn = self.drawn
+        self.lastCulled = self.culled
+        self.drawn = 0
+        self.culled = 0
+
+VIEWPORT = Viewport()  # 游戏窗口的摄像机
@@ -0,0 +1,131 @@
+import random  # 导入random库
+from data.src.const import *  # 导入常量
+from data.src.settings import *  # 导入设置
+
+def CopyRandom(rng):
+    """
+    复制随机数生成器的状态（跳过新建生成器时从系统读取种子的开销）
+
+    :param rng: random.Random 实例
+    :return: 状态相同、之后互不影响的 random.Random
+    """
+    copy = random.Random.__new__(random.Random)
+    copy.setstate(rng.getstate())
+    return copy
+
+class AliasTable:
+    def __init__(self, items, weights):
+        """
+        使用 Vose 别名法构建加权随机抽样表，构建 O(n)，每次抽样 O(1)
+
+        :param items: 候选项列表
+        :param weights: 与候选项一一对应的权重，数值越大越容易被抽中
+        """
+        total = float(sum(weights))
+        if not items or total <= 0:
+            raise ValueError("别名表需要至少一个权重为正的候选项")
+        count = len(items)
+        self.items = list(items)
+        self.prob = [0.0] * count  # 每个槽位保留自身的概率
+        self.alias = [0] * count  # 每个槽位的别名索引
+        scaled = [weight * count / total for weight in weights]
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        for index in large + small:  # 剩余槽位由于浮点误差，概率视为 1
+            self.prob[index] = 1.0
+
+    def Sample(self, rng):
+        """
+        抽取一个候选项
+
+        :param rng: random.Random 实例
+        :return: 被抽中的候选项
+        """
+        index = int(rng.random() * len(self.items))
+        if rng.random() < self.prob[index]:
+            return self.items[index]
+        return self.items[self.alias[index]]
+
+class WaveScheduler:
+    def __init__(self, level, seed, laneCount = GRID_COUNT[1]):
+        """
+        根据关卡定义和随机种子预计算僵尸出生时间线
+
+        :param level: 关卡定义，见 settings["level"]
+        :param seed: 随机种子，相同种子得到相同的时间线
+        :param laneCount: 草坪的行数
+        """
+        self.level = level
+        self.seed = seed
+        self.rng = random.Random(seed)  # 独立的随机数生成器，不受全局random影响
+        zombieWeight = level["zombieWeight"] or settings["game"]["zombieChooseProbability"]
+        zombieTypes = [zombieType for zombieType in settings["game"]["zombieType"] if zombieWeight.get(zombieType, 0) > 0]
+        self.typeTable = AliasTable(zombieTypes, [zombieWeight[zombieType] for zombieType in zombieTypes])
+        laneWeight = level["laneWeight"] or [1] * laneCount
+        self.laneTable = AliasTable(list(range(1, laneCount + 1)), laneWeight[:laneCount])
+        self.timeline = {}  # 时间线：帧 -> ((僵尸类型, 行号), ...)，只在 Extend 中整体替换，复制调度器时可以共享
+        self.horizon = 0  # 已预计算到的帧
+        self.Extend()
+
+    def Extend(self):
+        """
+        向后预计算一段关卡长度的时间线，关卡结束后时间线按关卡长度循环
+        """
+        start = self.horizon
+        end = start + self.level["length"]
+        self.timeline = {tick: spawns for tick, spawns in self.timeline.items() if tick >= start}  # 新建字典并丢掉已经过去的帧
+        tick = start + self.level["firstZombieTime"]
+        while tick < end:  # 常规僵尸：每隔 zombieTime 帧出现一只
+            self.Add(tick, 1)
+            tick += self.level["zombieTime"]
+        for wave in self.level["waves"]:  # 大波僵尸：同一帧或按间隔批量出现
+            for index in range(wave["count"]):
+                self.Add(start + wave["time"] + index * wave.get("interval", 0), 1)
+        self.horizon = end
+
+    def Add(self, tick, count):
+        """
+        在指定帧加入 count 只随机类型、随机行的僵尸
+
+        :param tick: 出生的帧
+        :param count: 僵尸数量
+        """
+        spawns = tuple((self.typeTable.Sample(self.rng), self.laneTable.Sample(self.rng)) for _ in range(count))
+        self.timeline[tick] = self.timeline.get(tick, ()) + spawns
+
+    def Due(self, tick):
+        """
+        查询指定帧需要出生的僵尸（不修改时间线）
+
+        :param tick: 当前帧
+        :return: ((僵尸类型, 行号), ...)，没有僵尸时返回空元组
+        """
+        while tick >= self.horizon:
+            self.Extend()
+        return self.timeline.get(tick, ())
+
+    def Fork(self):
+        """
+        复制调度器：别名表、关卡定义和时间线都不会被原地修改，直接共享
+
+        :return: 新的 WaveScheduler，之后与原调度器互不影响
+        """
+        fork = WaveScheduler.__new__(WaveScheduler)
+        fork.level = self.level
+        fork.seed = self.seed
+        fork.rng = CopyRandom(self.rng)
+        fork.typeTable = self.typeTable
+        fork.laneTable = self.laneTable
+        fork.timeline = self.timeline
+        fork.horizon = self.horizon
+        return fork
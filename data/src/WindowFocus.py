@@ -0,0 +1,66 @@
+import pygame # 导入pygame库
+from data.src.const import *  # 导入常量
+
+class WindowFocus:
+    def __init__(self, renderer, unfocused = UNFOCUSED_POLICY, minimized = MINIMIZED_POLICY, pauseAudio = PAUSE_AUDIO_IN_BACKGROUND):
+        """
+        窗口焦点和可见性：根据 SDL 的窗口事件记录窗口是否有焦点、是否最小化（或隐藏），
+        窗口在后台时按策略运行游戏：
+        run 照常运行；pause 暂停游戏逻辑和绘制，阻塞等待窗口事件；
+        skip_render 游戏逻辑照常运行，但不绘制；throttle 游戏逻辑照常运行，窗口按 BACKGROUND_FPS 绘制
+
+        :param renderer: 绘制器，窗口回到前台时通知它重画
+        :param unfocused: 窗口失去焦点时的策略
+        :param minimized: 窗口最小化或隐藏时的策略
+        :param pauseAudio: 窗口在后台时是否暂停声音（pause 策略总是暂停声音）
+        """
+        self.renderer = renderer
+        self.unfocused = unfocused
+        self.minimized = minimized
+        self.pauseAudio = pauseAudio
+        self.focused = True  # 窗口是否有焦点
+        self.hidden = False  # 窗口是否最小化或隐藏
+        self.audioPaused = False  # 是否已经暂停了声音
+
+    def Handle(self, events):
+        """
+        处理这一帧的事件，窗口状态变化时暂停或继续声音
+
+        :param events: 事件列表
+        """
+        changed = False
+        for event in events:
+            if event.type == pygame.WINDOWFOCUSGAINED:
+                self.focused = True
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self.focused = False
+            elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                self.hidden = True
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSHOWN):
+                self.hidden = False
+            else:
+                continue
+            changed = True
+        if not changed:
+            return
+        policy = self.Policy()
+        if policy == "run":
+            self.renderer.Invalidate()  # 窗口回到前台，内容可能已经丢失，重画一次
+        self.renderer.visible = policy in ("run", "throttle")
+        pause = policy == "pause" or (policy != "run" and self.pauseAudio)
+        if pause != self.audioPaused and pygame.mixer.get_init():
+            if pause:
+                pygame.mixer.pause()  # 暂停所有声道
+            else:
+                pygame.mixer.unpause()
+        self.audioPaused = pause
+
+    def Policy(self):
+        """
+        当前使用的策略：窗口在前台时为 run，最小化或隐藏时为 minimized，只是失去焦点时为 unfocused
+        """
+        if self.hidden:
+            return self.minimized
+        if not self.focused:
+            return self.unfocused
+        return "run"
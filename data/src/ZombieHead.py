@@ -1,6 +1,8 @@
 from data.src.object import *
 
 class ZombieHead(Object):
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, screen, pos):
         super().__init__(screen, settings['zombie_head']['path'], settings['zombie_head']['size'], settings['zombie_head']['imageCount'])
         self.delete = False
@@ -26,4 +26,13 @@ from data.src.Jalapeno import * # 导入火爆辣椒类
 from data.src.GrowSoil import * # 导入生长土壤类
 from data.src.Lawnmower import * # 导入草地机类
 from data.src.Squash import * # 导入倭瓜类
-from data.src.GameOverText import * # 导入游戏结束文本类
\ No newline at end of file
+from data.src.GameOverText import * # 导入游戏结束文本类
+from data.src.PlantFactory import * # 导入植物工厂类
+from data.src.WaveScheduler import * # 导入僵尸出生调度器
+from data.src.Replay import * # 导入操作录像
+from data.src.Economy import * # 导入金币模型
+from data.src.CellIndex import * # 导入网格索引
+from data.src.Renderer import * # 导入绘制器
+from data.src.IdleFrames import * # 导入空闲帧检测
+from data.src.WindowFocus import * # 导入窗口焦点
+from data.src.SilentSound import * # 导入静音的声音
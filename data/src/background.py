@@ -1,11 +1,20 @@
 from data.src._BasicImports import *  # 导入基本导入模块
+from data.src.BackgroundTiles import *  # 导入分块缓存的背景
 
 # 定义背景类
 class Background(Object):
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     # 初始化背景类
     def __init__(self, screen):
         super().__init__(screen, settings['background']['path'], settings['background']['size'], 1)
         self.pos = list(settings['background']['pos'])
-    def run(self):
-        self.update()
-        self.draw()
\ No newline at end of file
+        self.tiles = None  # 当前草坪的分块背景，第一次绘制时创建
+
+    def run(self, board = DEFAULT_BOARD):
+        if self.tiles is None or self.tiles.board is not board:  # 换了草坪（例如读档）时重新分块
+            self.tiles = BackgroundTiles(GetClip(self.path, self.size, 1).Frame(1), self.pos, board)
+        if RENDER.building:
+            RENDER.SetBackground(self.tiles)  # 记录到绘制快照，由绘制器绘制
+        else:
+            self.tiles.Draw(self.screen, VIEWPORT)  # 只绘制窗口内的小块
@@ -1,4 +1,4 @@
-DEFAULT_FPS = 60  # 屏幕刷新率
+DEFAULT_FPS = 60  # 屏幕刷新率，也是游戏逻辑每秒运行的帧数（按帧计数的计时器都按这个帧率设定，逻辑帧率不能单独修改）
 GAME_SIZE = (1200, 600)  # 游戏窗口大小
 GAME_SET_WINDOW_SIZE = (600, 400)  # 游戏设置窗口大小
 USER_PATH = "./data/user/user.json"  # 用户密码文件路径
@@ -7,6 +7,7 @@ GAME_TITLE = "植物大战僵尸"  # 游戏窗口标题
 GAME_VERSION = "2.4.8"  # 游戏版本号
 ZONBIE_FIRST_X = 800  # 僵尸第一次出现的横坐标
 ZOMBIE_TIME = 600  # 僵尸出现的时间间隔
+DEFAULT_LEVEL = 1  # 默认关卡
 SUNLIGHT_TIME = 900  # 阳光出现的时间间隔
 PLANT_HP = 100  # 植物的生命值
 NUT_HP = 100  # 坚果的生命值
@@ -18,9 +19,8 @@ GRID_DOWN_Y = 530  # 网格的底部纵坐标
 GRID_LEFT_X = 230  # 网格的左边横坐标
 GRID_RIGHT_X = 908  # 网格的右边横坐标
 GRID_SIZE = (75, 85)  # 网格的大小
-GRID_X = []  # 网格的横坐标
-GRID_Y = []  # 网格的纵坐标
 RIGHT_VIRTUAL_GRID_X = GRID_LEFT_X + (GRID_COUNT[0] + 1) * GRID_SIZE[0]  # 右侧虚拟网格的横坐标
+PEA_DELETE_OFFSET = 1150 - GRID_RIGHT_X  # 豌豆飞出草坪右边界多远后删除
 CHOOSE_CARD_FRAME_CARD_COUNT = (8, 5)  # 选择卡片框的卡片行列数
 
 CHOOSE_CARD_FRAME_CARD_X = []  # 选择卡片框的卡片横坐标
@@ -43,4 +43,26 @@ WHITE = (255, 255, 255)  # 白色
 BLACK = (0, 0, 0)  # 黑色
 
 PEATIME = 7  # 豌豆产生时间间隔
-SUNTIME = 14  # 阳光产生时间间隔
\ No newline at end of file
+SUNTIME = 14  # 阳光产生时间间隔
+
+RECORD_REPLAY = True  # 是否录制玩家操作
+REPLAY_DIR = "./data/replay"  # 操作录像保存目录
+SLOW_FRAME_TIME = 50  # 超过该耗时（毫秒）的帧会记录到录像中
+SAVE_PATH = "./data/save/save.pvzs"  # 存档路径
+RESUME_SAVE = False  # 启动时是否从存档继续游戏（开启后跳过开始界面和选卡界面，不能开始新的对局）
+AUTOSAVE_INTERVAL = 600  # 自动存档间隔（帧），为 0 时不自动存档
+SHOW_RENDER_STATS = False  # 是否在窗口右上角显示每帧绘制和剔除的对象数量
+BACKGROUND_TILE_SIZE = 256  # 背景分块的边长（像素）
+BACKGROUND_TILE_CACHE = 128  # 最多缓存的背景分块数量
+CAMERA_SCROLL_SPEED = 15  # 按方向键时摄像机每帧滚动的距离（像素）
+RENDER_THREAD = False  # 是否在单独的线程中绘制（游戏逻辑只发布绘制快照，不等待绘制和刷新窗口）
+MAX_LOGIC_STEPS = 5  # 一次绘制之间最多补运行的逻辑帧数，卡顿过久时丢弃多出的时间，避免越来越慢
+INTERPOLATE = True  # 是否在最近两个逻辑帧之间插值绘制位置
+INTERPOLATE_MAX_DISTANCE = 100  # 两个逻辑帧之间移动超过该距离（像素）的对象不插值
+IDLE_FRAMES = 30  # 静止的界面（开始、选卡、游戏结束）连续多少帧画面不变且没有输入后进入空闲，为 0 时不检测
+IDLE_WAIT = 250  # 空闲时每次阻塞等待输入的最长时间（毫秒）
+UNFOCUSED_POLICY = "throttle"  # 窗口失去焦点时的策略：run 照常运行，pause 暂停，skip_render 继续运行但不绘制，throttle 降低绘制帧率
+MINIMIZED_POLICY = "pause"  # 窗口最小化或隐藏时的策略（取值同上）
+BACKGROUND_FPS = 10  # throttle 策略的绘制帧率
+PAUSE_AUDIO_IN_BACKGROUND = True  # 窗口在后台时是否暂停声音（pause 策略总是暂停声音）
+FOCUS_WAIT = 500  # pause 策略下每次阻塞等待窗口事件的最长时间（毫秒）
@@ -1,15 +1,18 @@
 from data.src.object import *
 
 class gridPlant(Object):  # 定义plant类，继承自object类
-    def __init__(self, screen):  # 初始化函数
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
+    def __init__(self, screen, board = DEFAULT_BOARD):  # 初始化函数
         self.plantName = ""
+        self.board = board  # 草坪
         super().__init__(screen, '', (), 0)
 
     def updatePos(self):
-        ifpos = getGridPos(pygame.mouse.get_pos())["if"]
-        pos = getGridPos(pygame.mouse.get_pos())["pos"]
-        if not ifpos:
+        result = getGridPos(VIEWPORT.ToWorld(pygame.mouse.get_pos()), self.board)  # 鼠标所在的世界坐标对应的网格
+        if not result["if"]:
             return
+        pos = result["pos"]
         pos[0] += settings['game']['gridPlantPos'][self.plantName][0]
         pos[1] += settings['game']['gridPlantPos'][self.plantName][1]
         self.pos = pos
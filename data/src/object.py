@@ -9,8 +9,16 @@ from data.src.const import *  # 导入常量
 from data.src.settings import *  # 导入设置
 from data.src.object import *  # 导入对象类
 from data.src.tools import *  # 导入工具类
+from data.src.AnimationClock import *  # 导入共享的动画时钟
+from data.src.AnimationClip import *  # 导入共享的动画片段
+from data.src.AnimationState import *  # 导入动画状态机
+from data.src.Viewport import *  # 导入可见区域
+from data.src.RenderBuffer import *  # 导入绘制快照
 
 class Object(pygame.sprite.Sprite):  # 定义基类
+    world = False  # 是否按世界坐标绘制（随摄像机滚动），界面对象按窗口坐标绘制
+    visible = True  # 上一次绘制时是否在窗口内，由 draw 每帧检查一次
+
     def __init__(self, screen, path, size, imageCount, plantType = 'not plant'):  # 初始化函数
         self.screen = screen  # 保存屏幕
         self.pos = [0, 0]
@@ -18,22 +26,24 @@ class Object(pygame.sprite.Sprite):  # 定义基类
         self.size = size
         self.imageCount = imageCount  # 获取图片数量
         self.imageIndex = 0  # 初始化图片索引
-        self.preIndexTime = 0  # 初始化切换角色时间
+        self.preIndexTick = -math.inf  # 初始化切换角色的帧数，保证第一次 update 时就加载图片
         self.hp = 100
         self.hpTime = 0
         self.animation = False
+        self.machineName = None  # 动画状态机的名字，没有状态机时为 None
+        self.machine = None  # 动画状态机（MACHINES 中编译好的，所有对象共享）
+        self.animState = 0  # 当前动画状态的编号
         if plantType == 'not plant':
             self.preIndexTimeNumber = 0.1
         else:
             self.preIndexTimeNumber = settings['game']['plantPreIndexTimeNumber'][plantType]
     
     def updateImage(self):  # 更新图片函数
-        if self.imageCount == 1:  # 获取当前图片路径
-            path = self.path
+        if self.machine is not None:
+            self.clip = self.machine.states[self.animState].clip  # 当前状态的动画片段
         else:
-            path = self.path % self.imageIndex
-        self.image = pygame.image.load(path)  # 加载图片
-        self.image = pygame.transform.scale(self.image, self.size)  # 缩放图片
+            self.clip = GetClip(self.path, self.size, self.imageCount)  # 获取共享的动画片段（路径、尺寸改变时换成对应的片段）
+        self.image = self.clip.Frame(self.imageIndex)  # 当前帧，所有对象共享同一个图片，不再各自加载和缩放
     
     def getRect(self):  # 获取图片矩形函数
         rect = self.image.get_rect()  # 获取图片矩形
@@ -42,26 +52,104 @@ class Object(pygame.sprite.Sprite):  # 定义基类
     
     def update(self):  # 更新函数
         if self.imageCount != 1:
-            if time.time() - self.preIndexTime <= self.preIndexTimeNumber:  # 如果当前时间与上一次切换角色时间间隔小于指定秒
+            if not CLOCK.Elapsed(self.preIndexTick, self.preIndexTimeNumber):  # 如果距离上一次切换角色还没有经过指定秒
                 return  # 不更新图片
-            self.preIndexTime = time.time()  # 更新上一次切换角色时间
+            self.preIndexTick = CLOCK.ticks  # 更新上一次切换角色的帧数
             self.imageIndex = self.imageIndex + 1  # 更新图片索引
             if self.imageIndex > self.imageCount:  # 如果图片索引大于图片数量
                 self.animation = True  # 设置动画为True
                 self.imageIndex = 1  # 设置图片索引为1
+                if self.machine is not None and self.machine.states[self.animState].end >= 0:
+                    self.Enter(self.machine.states[self.animState].end, 1)  # 播放完后进入声明的下一个状态
+            if self.machine is not None:
+                event = self.machine.states[self.animState].events.get(self.imageIndex)
+                if event is not None:
+                    self.OnFrameEvent(event)  # 帧事件
+
+        # 帧索引、动画标志和帧事件照常推进（游戏逻辑依赖它们），不在窗口内时只是不取图片，重新进入窗口时再取。
+        # 使用上一次绘制时的检查结果，不再重复检查：刚进入窗口的对象由 draw 取图片
+        if self.visible:
+            self.updateImage()  # 更新图片
+        else:
+            self.image = None
+
+    def SetMachine(self, name, state = None):
+        """
+        使用 MACHINES 中的动画状态机，并进入初始状态（或指定的状态）
+
+        :param name: 状态机的名字
+        :param state: 状态名，为 None 时使用初始状态
+        """
+        self.machineName = name
+        self.machine = MACHINES[name]
+        self.Enter(self.machine.initial if state is None else self.machine.ids[state])
+
+    def Enter(self, state, index = 0):
+        """
+        进入动画状态：只复制编译好的路径、图片数量和尺寸，不查找设置、不读取磁盘
 
-        self.updateImage()  # 更新图片
+        :param state: 状态编号
+        :param index: 进入后的图片索引，为 0 时下一次 update 显示第一帧
+        """
+        record = self.machine.states[state]
+        self.animState = state
+        self.path = record.path
+        self.imageCount = record.imageCount
+        self.size = record.size
+        self.imageIndex = index
+
+    def Trigger(self, trigger, index = 0):
+        """
+        按当前状态的转换表切换状态
+
+        :param trigger: 触发名
+        :param index: 进入后的图片索引
+        :return: 当前状态声明了这个触发时返回 True，否则不切换并返回 False
+        """
+        target = self.machine.states[self.animState].transitions.get(trigger)
+        if target is None:
+            return False
+        self.Enter(target, index)
+        return True
+
+    def InState(self, name):
+        """
+        检查是否处于指定名字的动画状态
+        """
+        return self.machine is not None and self.animState == self.machine.ids[name]
+
+    def OnFrameEvent(self, event):
+        """
+        动画播放到声明了帧事件的帧时调用，由子类实现
+
+        :param event: 事件名
+        """
+        pass
     
-    def updateGrid(self, pos):
-        self.grid = getGrid(pos)
+    def updateGrid(self, pos, board = DEFAULT_BOARD):
+        self.grid = board.GetGrid(pos)
 
-    def IsInRightVirtualGrid(self):
-        return IsInRightVirtualGrid(self.pos)
+    def IsInRightVirtualGrid(self, board = DEFAULT_BOARD):
+        return IsInRightVirtualGrid(self.pos, board)
     
-    def IsInGrid(self):
-        return self.pos[0] + self.size[0] / 2 <= GRID_RIGHT_X
+    def IsInGrid(self, board = DEFAULT_BOARD):
+        return self.pos[0] + self.size[0] / 2 <= board.right
 
     def draw(self):  # 绘制函数
-        self.screen.blit(self.image, self.getRect())  # 将图片绘制到屏幕上
+        self.visible = VIEWPORT.Visible(self.pos, self.size, self.world)  # 每帧只在这里检查一次
+        if self.visible:
+            if self.image is None:
+                self.updateImage()  # 在窗口外时没有取图片，现在取当前帧
+            if RENDER.building:  # 正在记录这一帧：只记录到绘制快照，由绘制器绘制
+                RENDER.Add(id(self), self.clip, self.imageIndex, self.image, self.pos[0], self.pos[1], self.world)
+            else:
+                rect = self.getRect()
+                if self.world:
+                    rect.x -= VIEWPORT.x  # 世界坐标转换为窗口坐标
+                    rect.y -= VIEWPORT.y
+                self.screen.blit(self.image, rect)  # 将图片绘制到屏幕上
+            VIEWPORT.drawn += 1
+        else:
+            VIEWPORT.culled += 1  # 不在窗口内：剔除，不绘制
         if self.animation:
             self.animation = False
\ No newline at end of file
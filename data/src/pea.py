@@ -1,15 +1,18 @@
 from data.src.object import *
 
 class Pea(Object):  # 定义Pea类，继承自Object
-    def __init__(self, pos, screen, posY):  # 初始化函数
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
+    def __init__(self, pos, screen, posY, board):  # 初始化函数
         super().__init__(screen, settings['pea']['path'], settings['pea']['size'], 1)
         self.pos = list(pos)  # 保存Pea位置
         self.posY = posY
+        self.board = board  # 所在的草坪，飞出草坪右边界后删除
         self.delete = False
 
     def run(self):  # 运行函数
         self.update()
         self.pos[0] += 8
-        if self.pos[0] > 1150:
+        if self.pos[0] > self.board.right + PEA_DELETE_OFFSET:
             self.delete = True
         self.draw()  # 绘制
\ No newline at end of file
@@ -2,6 +2,8 @@ from data.src.object import * # 导入对象
 from data.src.pea import * # 导入豌豆
 
 class Peashooter(Object):  # 定义Peashooter类，继承自Object类
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, game, pos):  # 初始化函数
         self.plantType = 'peashooter'
         self.game = game
@@ -11,27 +13,20 @@ class Peashooter(Object):  # 定义Peashooter类，继承自Object类
         self.pos[0] += settings['game']['gridPlantPos'][self.plantType][0]
         self.pos[1] += settings['game']['gridPlantPos'][self.plantType][1]
         self.peaTime = 0
-        self.ifAppendPea = False
-        self.updateGrid(self.pos)
-        self.grid[1] += 1
+        self.SetMachine(self.plantType)  # 闲置 -> 射击 -> 闲置，第 6 帧发射豌豆
+        self.grid = game.board.CellAt(pos)  # 种植的网格
 
     def run(self):  # 运行函数
-        self.update()  # 更新图片
-        if self.animation: # 如果处于动画状态
-            if self.peaTime < PEATIME:
-                if self.game.zombiePos[self.grid[1]]: # 如果有僵尸
-                    self.peaTime += 1
-            elif self.peaTime == PEATIME:
-                self.path = settings['peashooter']['path']  # 获取Peashooter图片路径
-                self.imageCount = settings['peashooter']['imageCount']  # 获取Peashooter图片数量
+        idle = self.InState("idle")
+        self.update()  # 更新图片，射击动画播放完后自动回到闲置状态
+        if idle and self.animation: # 如果闲置动画播放了一遍
+            if self.game.zombiePos[self.grid[1]]: # 如果有僵尸
+                self.peaTime += 1
+            if self.peaTime == PEATIME:
                 self.peaTime = 0
-                self.ifAppendPea = False
-        if self.peaTime == PEATIME:
-            if self.path == settings['peashooter']['path']:
-                self.path = settings['peashooter']['shoot_path']  # 获取Peashooter图片路径
-                self.imageCount = settings['peashooter']['shoot_imageCount']  # 获取Peashooter图片数量
-                self.imageIndex = 1
-            if self.imageIndex == 6 and not self.ifAppendPea:
-                self.pea_list.append(Pea((self.pos[0] + 35, self.pos[1] + 20), self.screen, self.grid[1]))
-                self.ifAppendPea = True
-        self.draw()  # 绘制图片
\ No newline at end of file
+                self.Trigger("fire")  # 进入射击状态
+        self.draw()  # 绘制图片
+
+    def OnFrameEvent(self, event):  # 帧事件
+        if event == "shoot":  # 射击动画的第 6 帧：发射豌豆
+            self.pea_list.append(Pea((self.pos[0] + 35, self.pos[1] + 20), self.screen, self.grid[1], self.game.board))
\ No newline at end of file
@@ -84,13 +84,13 @@ settings = {
             "jalapeno": 0,         # 火爆辣椒碰撞检测 X 轴偏移量
             "squash": -70,           # 倭瓜碰撞检测 X 轴偏移量
         },
-        # 游戏中会出现的僵尸类型集合
-        "zombieType": {
+        # 游戏中会出现的僵尸类型列表（使用列表保证遍历顺序固定）
+        "zombieType": [
             "common_zombie",
             "conehead_zombie",
             "buckethead_zombie"
-        },
-        # 不同类型僵尸出现的概率，数值越大越容易出现
+        ],
+        # 不同类型僵尸出现的权重，数值越大越容易出现
         "zombieChooseProbability": { 
             "common_zombie": 100,  # 普通僵尸出现概率为 100%
             "conehead_zombie": 50,  # 路障僵尸出现概率为 50%
@@ -109,6 +109,39 @@ settings = {
             "Pos": (45, 40)   # 僵尸燃烧状态图片位置偏移
         },
     },
+    # 关卡定义：僵尸出生节奏与大波僵尸，由 WaveScheduler 预计算为时间线
+    "level": {
+        1: {
+            "name": "白天",  # 关卡名称
+            "board": {"columns": GRID_COUNT[0], "rows": GRID_COUNT[1]},  # 草坪的列数和行数
+            "length": 72000,  # 关卡长度（帧），时间线按此长度预计算并循环
+            "firstZombieTime": ZOMBIE_TIME,  # 第一只僵尸出现的帧
+            "zombieTime": ZOMBIE_TIME,  # 僵尸出现的时间间隔（帧）
+            "zombieWeight": None,  # 僵尸类型权重，None 表示使用 zombieChooseProbability
+            "laneWeight": None,  # 每行出现僵尸的权重，None 表示各行相同
+            "waves": [],  # 大波僵尸：{"time": 出现的帧, "count": 数量, "interval": 每只间隔帧数}
+        },
+        "endurance": {
+            "name": "无尽",  # 关卡名称
+            "board": {"columns": GRID_COUNT[0], "rows": GRID_COUNT[1]},  # 草坪的列数和行数
+            "length": 36000,  # 关卡长度（帧）
+            "firstZombieTime": ZOMBIE_TIME,  # 第一只僵尸出现的帧
+            "zombieTime": ZOMBIE_TIME // 2,  # 僵尸出现的时间间隔（帧）
+            "zombieWeight": None,  # 僵尸类型权重
+            "laneWeight": None,  # 每行出现僵尸的权重
+            "waves": [{"time": 6000 * i, "count": 100 * i, "interval": 0} for i in range(1, 6)],  # 每100秒一波，逐波增加
+        },
+        "stress": {
+            "name": "压力测试",  # 关卡名称，用于测量模拟随草坪大小的开销
+            "board": {"columns": 40, "rows": 50},  # 草坪的列数和行数
+            "length": 36000,  # 关卡长度（帧）
+            "firstZombieTime": 60,  # 第一只僵尸出现的帧
+            "zombieTime": 6,  # 僵尸出现的时间间隔（帧）
+            "zombieWeight": None,  # 僵尸类型权重
+            "laneWeight": None,  # 每行出现僵尸的权重
+            "waves": [{"time": 1200 * i, "count": 500, "interval": 0} for i in range(1, 30)],  # 每20秒一波500只
+        },
+    },
     # 阴影相关设置
     "shadow":{
         "name": "shadow",           # 阴影名称
@@ -2,6 +2,8 @@ from data.src.object import *
 from data.src.sunlight import *
 
 class Sunflower(Object):  # 定义Sunflower类，继承自Odject类
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
     def __init__(self, game, pos):  # 初始化函数
         self.plantType = 'sunflower'
         self.game = game
@@ -11,26 +13,19 @@ class Sunflower(Object):  # 定义Sunflower类，继承自Odject类
         self.pos[0] += settings['game']['gridPlantPos'][self.plantType][0]
         self.pos[1] += settings['game']['gridPlantPos'][self.plantType][1]
         self.sunTime = 0
-        self.ifAppendSun = False
-        self.updateGrid(self.pos)
-        self.grid[1] += 1
+        self.SetMachine(self.plantType)  # 闲置 -> 产生阳光 -> 闲置，第 7 帧产生阳光
+        self.grid = game.board.CellAt(pos)  # 种植的网格
 
     def run(self):  # 运行函数
-        self.update()  # 更新图片
-        if self.animation:
-            if self.sunTime < SUNTIME:
-                self.sunTime += 1
-            elif self.sunTime == SUNTIME:
-                self.path = settings['sunflower']['path']  # 获取sunflower图片路径
-                self.imageCount = settings['sunflower']['imageCount']  # 获取sunflower图片数量
+        idle = self.InState("idle")
+        self.update()  # 更新图片，产生阳光的动画播放完后自动回到闲置状态
+        if idle and self.animation:  # 如果闲置动画播放了一遍
+            self.sunTime += 1
+            if self.sunTime == SUNTIME:
                 self.sunTime = 0
-                self.ifAppendSun = False
-        if self.sunTime == SUNTIME:
-            if self.path == settings['sunflower']['path']:
-                self.path = settings['sunflower']['shoot_path']  # 获取sunflower图片路径
-                self.imageCount = settings['sunflower']['shoot_imageCount']  # 获取sunflower图片数量
-                self.imageIndex = 1
-            if self.imageIndex == 7 and not self.ifAppendSun:
-                self.sunlight_list.append(Sunlight(self.screen, (self.pos[0] + 2, self.pos[1] - 25), 1))
-                self.ifAppendSun = True
-        self.draw()  # 绘制
\ No newline at end of file
+                self.Trigger("fire")  # 进入产生阳光状态
+        self.draw()  # 绘制
+
+    def OnFrameEvent(self, event):  # 帧事件
+        if event == "sun":  # 产生阳光动画的第 7 帧：产生阳光
+            self.sunlight_list.append(Sunlight(self.screen, (self.pos[0] + 2, self.pos[1] - 25), 1))
\ No newline at end of file
@@ -1,14 +1,16 @@
 from data.src.object import *  # 导入Object类
 
 class Sunlight(Object):  # 定义Sunlight类，继承自Object类
-    def __init__(self, screen, pos, type = 0):  # 初始化函数
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
+    def __init__(self, screen, pos, type = 0, posY = None):  # 初始化函数
         super().__init__(screen,
                          settings['sunlight']['path'],
                          settings['sunlight']['size'],
                          settings['sunlight']['imageCount']) # 调用父类的初始化函数
         self.type = type # 保存Sunlight类型
         self.pos = list(pos)  # 保存Sunlight位置
-        self.posY = random.randint(GAME_SIZE[1] - 450, GAME_SIZE[1] - 60) # 随机生成Sunlight的Y坐标
+        self.posY = posY if posY is not None else random.randint(GAME_SIZE[1] - 450, GAME_SIZE[1] - 60) # 落地的Y坐标，未指定时随机生成
         self.posNum = 0 # 位置变化标志
         self.preIndexTimeNumber = 0.05 # 初始化时间间隔
         self.time = 0 # 初始化时间
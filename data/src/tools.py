@@ -1,6 +1,7 @@
 # 导入必要的模块和常量
 from data.src.const import *  # 导入游戏常量配置
 from data.src.settings import *  # 导入游戏设置配置
+from data.src.Board import *  # 导入草坪类
 import math  # 导入数学计算库
 
 def click(thingPos, thingSize, mousePos):
@@ -78,84 +79,49 @@ def collision_Pea_add_Zombie_detection(zombie, pea):
             return True
     return False
 
-def getGrid(xy):
+def getGrid(xy, board = DEFAULT_BOARD):
     """
     将屏幕坐标转换为网格坐标
     :param xy: 屏幕坐标 (x, y)
+    :param board: 草坪，默认为 9x5 草坪
     :return: 网格坐标 [col, row]
     """
-    pos = list(xy)
-    grid = [0, 0]
-    # 计算相对于网格起始位置的偏移量
-    pos[0] -= GRID_LEFT_X
-    pos[0] /= GRID_SIZE[0]
-    pos[1] -= GRID_TOP_Y
-    pos[1] /= GRID_SIZE[1]
-    # 使用math.ceil向上取整得到网格坐标
-    grid[0] = math.ceil(pos[0])
-    grid[1] = math.ceil(pos[1])
-    return grid
+    return board.GetGrid(xy)
 
-def IsInRightVirtualGrid(xy):
+def IsInRightVirtualGrid(xy, board = DEFAULT_BOARD):
     """
     检查坐标是否在右侧虚拟网格范围内
     :param xy: 屏幕坐标 (x, y)
+    :param board: 草坪，默认为 9x5 草坪
     :return: 如果在右侧虚拟网格范围内返回True,否则返回False
     """
-    pos = list(xy)
-    grid = [0, 0]
-    # 计算相对于网格起始位置的偏移量
-    pos[0] -= GRID_LEFT_X
-    pos[0] /= GRID_SIZE[0]
-    pos[1] -= GRID_TOP_Y
-    pos[1] /= GRID_SIZE[1]
-    # 使用math.ceil向上取整得到网格坐标
-    grid[0] = math.ceil(pos[0])
-    grid[1] = math.ceil(pos[1])
-    return grid[0] == GRID_COUNT[0] + 2 and grid[1] >= 1 and grid[1] <= GRID_COUNT[1]
+    return board.IsInRightVirtualGrid(xy)
 
-def getGridPos(xy):
+def getGridPos(xy, board = DEFAULT_BOARD):
     """
     获取指定坐标对应的网格位置
     :param xy: 屏幕坐标 (x, y)
+    :param board: 草坪，默认为 9x5 草坪
     :return: 如果坐标在花园内返回网格位置,否则返回False
     """
-    # 首先检查坐标是否在花园范围内
-    if not CheckInGarden(xy):
-        return {"if": False, "pos": []}
-    # 获取网格坐标
-    grid = getGrid(xy)
-    # 检查网格坐标是否超出范围
-    if grid[0] > 9 or grid[1] > 5:
-        return {"if": False, "pos": []}
-    # 返回网格的实际位置坐标
-    return {"if": True, "pos": [GRID_X[grid[0]], GRID_Y[grid[1]]]}
+    return board.GetGridPos(xy)
 
-def CheckInGarden(pos):
+def CheckInGarden(pos, board = DEFAULT_BOARD):
     """
     检查坐标是否在花园范围内
     :param pos: 屏幕坐标 (x, y)
+    :param board: 草坪，默认为 9x5 草坪
     :return: 如果在花园范围内返回True,否则返回False
     """
-    # 检查x坐标是否在花园左右边界之间
-    # 检查y坐标是否在花园上下边界之间
-    return pos[0] > GRID_LEFT_X and pos[0] < GRID_RIGHT_X and pos[1] > GRID_TOP_Y and pos[1] < GRID_DOWN_Y
+    return board.InGarden(pos)
 
 def ChooseZombieType():
     """
-    随机选择僵尸类型
+    按权重随机选择僵尸类型
     :return: 返回一个随机选择的僵尸类型
     """
     # 导入random模块，用于生成随机数
     import random
-    # 初始化随机数生成器，使用系统默认的种子（通常基于当前时间）
-    random.seed()
-    # 生成一个1到100之间的随机整数，用于后续的概率判断
-    randNumber = random.randint(1, 100)
-    # 遍历游戏设置中定义的所有僵尸类型
-    for zombieType in settings["game"]["zombieType"]:
-        # 从游戏设置中获取当前僵尸类型被选中的概率
-        # 若生成的随机数小于等于该概率值，则表示选中该僵尸类型
-        if randNumber <= settings["game"]["zombieChooseProbability"][zombieType]:
-            # 返回当前被选中的僵尸类型
-            return zombieType
\ No newline at end of file
+    zombieTypes = settings["game"]["zombieType"]
+    # 按照游戏设置中的权重选择僵尸类型，权重越大越容易被选中
+    return random.choices(zombieTypes, [settings["game"]["zombieChooseProbability"][zombieType] for zombieType in zombieTypes])[0]
\ No newline at end of file
@@ -1,12 +1,15 @@
 from data.src.object import *
 
 class Zombie(Object):  # 定义Zombie类，继承自object
-    def __init__(self, game, type):  # 初始化函数，用于创建Zombie对象
+    world = True  # 按世界坐标绘制，随摄像机滚动
+
+    def __init__(self, game, type, posY = None):  # 初始化函数，用于创建Zombie对象
         """
         初始化Zombie对象
 
         :param game: 游戏实例，包含游戏的各种信息和状态
         :param type: 僵尸类型，用于确定僵尸的属性
+        :param posY: 僵尸出现的行号，为None时随机选择
         """
         self.type = type  # 记录僵尸的类型
         # 调用父类Object的构造函数，初始化僵尸的屏幕、图片路径、尺寸和图片数量
@@ -14,17 +17,73 @@ class Zombie(Object):  # 定义Zombie类，继承自object
         self.screen = game.screen  # 保存游戏屏幕对象，用于后续绘制操作
         self.game = game  # 保存游戏实例，方便访问游戏的其他信息
         self.eat = False  # 初始化僵尸是否在吃植物的状态，初始为False
-        self.posY = random.randint(1, GRID_COUNT[1])  # 随机生成僵尸出现的行号，范围在1到GRID_COUNT[1]之间
+        self.board = game.board  # 保存草坪，用于网格判断
+        self.posY = posY if posY is not None else random.randint(1, self.board.rows)  # 僵尸出现的行号，未指定时在1到草坪行数之间随机生成
         self.game.zombiePos[self.posY] = True  # 标记该行有僵尸出现
-        self.pos = [ZONBIE_FIRST_X, GRID_Y[self.posY] - 25]  # 初始化僵尸的位置，X坐标为ZONBIE_FIRST_X，Y坐标根据随机生成的行号计算
-        self.updateGrid(self.pos)  # 初始化grid属性
+        self.pos = [self.board.zombieFirstX, self.board.gridY[self.posY] - 25]  # 初始化僵尸的位置，X坐标为草坪右侧的出现位置，Y坐标根据行号计算
         self.hp = settings[self.type]["hp"]# 从配置文件中获取对应类型僵尸的初始生命值
-        self.prePosTime = 0  # 记录上一次僵尸移动位置的时间，初始为0
+        self.prePosTick = -math.inf  # 记录上一次僵尸移动位置的帧数，保证第一次 run 时就移动
         self.head = True  # 标记僵尸是否有头，初始为True
         self.delete = False  # 标记僵尸是否需要被删除，初始为False
         self.dieTime = 0  # 记录僵尸死亡后的持续时间，初始为0
-        self.InRightVirtualGrid = 0  # 标记僵尸是否在右侧虚拟网格内，初始为False
-        self.InGrid = False  # 标记僵尸是否在网格内，初始为False
+        self.Locate()  # 初始化grid属性、所在网格的左右边界和是否在右侧虚拟网格内
+        self.SetMachine(self.type)  # 行走、啃食、无头、死亡、燃烧
+
+    @staticmethod
+    def GridAt(board, x, y):
+        """
+        僵尸所在的网格：僵尸的身体在图片左上角右下方一格的位置
+
+        :param board: 草坪
+        :param x: 僵尸的横坐标（图片左上角）
+        :param y: 僵尸的纵坐标（图片左上角）
+        :return: 网格坐标 [col, row]
+        """
+        return [board.Column(x + board.cellSize[0]), board.Row(y + board.cellSize[1])]
+
+    def Locate(self):
+        """
+        根据当前位置计算所在的网格、这一格的左右边界和是否在右侧虚拟网格内（不发出通知）
+        """
+        board = self.board
+        self.grid = self.GridAt(board, self.pos[0], self.pos[1])
+        # 横坐标在 (cellLeft, cellRight] 内时网格不变
+        self.cellLeft = board.left + (self.grid[0] - 2) * board.cellSize[0]
+        self.cellRight = self.cellLeft + board.cellSize[0]
+        self.InRightVirtualGrid = board.IsInRightVirtualGrid(self.pos)  # 是否在右侧虚拟网格内
+
+    def UpdateCell(self):
+        """
+        重新计算所在的网格，网格变化时通知订阅者（见 Game.SubscribeCells）。
+        僵尸的位置被移动行以外的代码修改（例如燃烧时调整位置）后也需要调用
+        """
+        old = self.grid
+        self.Locate()
+        if self.grid != old:
+            self.game.game.PublishCell(self, old, self.grid)
+
+    @classmethod
+    def SpawnBatch(cls, game, types, lanes = None, xOffsets = None):
+        """
+        一次创建一批僵尸（例如一大波僵尸）：先按逐只创建时的随机数顺序确定行号，再逐只完整初始化，
+        有偏移的僵尸移动到对应位置后重新计算网格。动画帧来自共享的动画片段，不会加载图片
+
+        :param game: 游戏实例
+        :param types: 每只僵尸的类型
+        :param lanes: 每只僵尸的行号，为 None（或其中某项为 None）时随机选择，与逐只创建时的随机数顺序相同
+        :param xOffsets: 每只僵尸相对于出现位置的横坐标偏移，为 None 时都为 0
+        :return: 新僵尸的列表（不会加入僵尸列表）
+        """
+        count = len(types)
+        lanes = [random.randint(1, game.board.rows) if lane is None else lane for lane in (lanes if lanes is not None else [None] * count)]
+        zombies = []
+        for index in range(count):
+            zombie = cls(game, types[index], lanes[index])
+            if xOffsets is not None and xOffsets[index]:
+                zombie.pos[0] += xOffsets[index]
+                zombie.Locate()  # 还没有加入僵尸列表，不发出通知
+            zombies.append(zombie)
+        return zombies
         
     def run(self):  # 运行函数，用于更新僵尸的状态和绘制僵尸
         """
@@ -58,34 +117,23 @@ class Zombie(Object):  # 定义Zombie类，继承自object
                 # 更新僵尸的图片显示
                 self.updateImage()
 
-        # 检查当前时间与上一次移动位置的时间间隔是否超过0.1秒，且僵尸生命值不为0
-        if not time.time() - self.prePosTime <= 0.1 and self.hp != 0:  # 如果当前时间与上一次切换位置时间间隔不小于指定秒
-            # 若僵尸正在吃植物且当前图片路径不是吃植物的图片路径
-            if self.eat and not self.path == settings[self.type]["eatPath"]:
-                # 将图片路径切换为吃植物的图片路径
-                self.path = settings[self.type]["eatPath"]
-                self.imageCount = settings[self.type]["eatImageCount"]
-                # 重置图片索引为0
-                self.imageIndex = 0
-            # 若僵尸不在吃植物且当前图片路径是吃植物的图片路径
-            elif not self.eat and self.path == settings[self.type]["eatPath"]:
-                # 将图片路径切换为正常行走的图片路径
-                self.path = settings[self.type]["path"]
-                self.imageCount = settings[self.type]["imageCount"]
-                # 重置图片索引为0
-                self.imageIndex = 0
+        # 检查距离上一次移动位置是否已经经过0.1秒，且僵尸生命值不为0
+        if CLOCK.Elapsed(self.prePosTick, 0.1) and self.hp != 0:  # 如果距离上一次切换位置已经经过指定秒
+            # 若僵尸正在吃植物，从行走切换为啃食
+            if self.eat:
+                self.Trigger("eat")
+            # 若僵尸不在吃植物，从啃食切换回行走
+            else:
+                self.Trigger("stop")
             # 更新上一次移动位置的时间
-            self.prePosTime = time.time()  # 更新上一次切换位置时间
+            self.prePosTick = CLOCK.ticks  # 更新上一次切换位置的帧数
             # 若僵尸不在吃植物状态
             if not self.eat:  # 如果Zombie不在吃植物状态
                 # 僵尸的X坐标减1，使其向左移动
                 self.pos[0] -= 1
 
-        # 根据僵尸当前位置更新其所在网格坐标
-        self.updateGrid(self.pos)
-        self.grid[0] += 1# 网格X坐标加1
-        self.grid[1] += 1# 网格Y坐标加1
-        self.InRightVirtualGrid = self.IsInRightVirtualGrid()  # 检查僵尸是否在右侧虚拟网格内
-        self.InGrid = self.IsInGrid()  # 检查僵尸是否在网格内
+        # 只有越过所在网格的边界时才重新计算网格坐标
+        if not self.cellLeft < self.pos[0] <= self.cellRight:
+            self.UpdateCell()
         # 绘制僵尸
         self.draw()  # 绘制
\ No newline at end of file
@@ -30,8 +30,7 @@ class Main: # 主函数
     def CreateGameInstance(self): # 创建游戏实例
         self.game.start(self.game, self.GameSetWindow) # 开始游戏
         self.game.chooseCard() # 选择卡牌
-        self.game.run() # 运行游戏
-        self.game.save() # 保存游戏
+        self.game.run() # 运行游戏（退出时由 Pvz.Quit 保存游戏并结束进程）
 
     def CreateGameSet(self): # 创建游戏设置窗口
         pass